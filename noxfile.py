@@ -168,6 +168,20 @@ def regression_tests(session: Session) -> None:
     )
 
 
+@nox.session(name="test:performance", python=False)
+def performance_tests(session: Session) -> None:
+    """
+    Run the offline benchmarks and compare them with their baselines.
+
+    Append '-- --update-baselines' to record new baselines.
+    """
+    session.run(
+        "pytest",
+        f"{PROJECT_CONFIG.root_path / 'test' / 'performance'}",
+        *session.posargs,
+    )
+
+
 @nox.session(name="test:integration", python=False)
 def integration_tests_for_sqlalchemy_exasol(session: Session) -> None:
     """Run integration tests with a specific configuration. For more details append '-- -h'"""
@@ -45,26 +45,24 @@ representation (all uppercase).
 
 """
 
+import functools
 import logging
 import re
+import sys
 import textwrap
+import time
 from collections import (
     defaultdict,
     namedtuple,
 )
 from collections.abc import MutableMapping
-from contextlib import closing
+from contextlib import (
+    closing,
+    contextmanager,
+)
 from typing import Any
 
 import sqlalchemy.exc
-from pyexasol.exceptions import (
-    ExaAuthError,
-    ExaCommunicationError,
-    ExaError,
-    ExaQueryError,
-    ExaRequestError,
-    ExaRuntimeError,
-)
 from sqlalchemy import (
     Connection,
     event,
@@ -83,17 +81,34 @@ from sqlalchemy.engine import (
     reflection,
 )
 from sqlalchemy.engine.interfaces import (
+    ExecuteStyle,
     ReflectedColumn,
     ReflectedTableComment,
 )
+from sqlalchemy.engine.reflection import (
+    ObjectKind,
+    ObjectScope,
+    ReflectionDefaults,
+)
 from sqlalchemy.schema import (
     AddConstraint,
     ForeignKeyConstraint,
 )
-from sqlalchemy.sql import compiler
+from sqlalchemy.sql import (
+    compiler,
+    expression,
+)
 from sqlalchemy.sql.elements import quoted_name
 from sqlalchemy.sql.type_api import TypeEngine
 
+from sqlalchemy_exasol import (
+    catalog,
+    metrics,
+    profiling,
+    retry,
+    transport,
+)
+from sqlalchemy_exasol.metrics import MetricsRegistry
 from sqlalchemy_exasol.types import (
     EXATimestring,
 )
@@ -102,6 +117,76 @@ from .constraints import DistributeByConstraint
 
 logger = logging.getLogger("sqlalchemy_exasol")
 
+
+# server version per (host, port), shared by all engines of the process
+_server_version_infos: dict[tuple[str | None, int | None], tuple[int, int, int]] = {}
+
+
+def _parse_server_version(version):
+    """The (major, minor, patch) tuple of an Exasol version string."""
+    result = version.split(".")
+    major, minor, patch = 0, 0, 0
+    major = int(result[0])
+    minor = int(result[1])
+    try:
+        # last version position can something like: '12-S' or 'RC2'
+        # might fail with ValueError
+        patch = int(result[2].split("-")[0])
+    except ValueError:
+        # ignore if there is some funky string in the patch field
+        pass
+    return major, minor, patch
+
+
+def _connection_info(dbapi_connection):
+    """
+    The info dictionary of a pooled DBAPI connection, or None for the ad-hoc
+    connection SQLAlchemy initializes the dialect with, which has none.
+    """
+    try:
+        return dbapi_connection.info
+    except NotImplementedError:
+        return None
+
+
+def _pyexasol_exceptions():
+    """
+    The ``pyexasol.exceptions`` module, or None if pyexasol was not imported yet.
+
+    pyexasol is only imported once a connection is created, an exception raised
+    before that point can not originate from it.
+    """
+    return sys.modules.get("pyexasol.exceptions")
+
+
+def _translate_pyexasol_error(statement, parameters, error):
+    """
+    The SQLAlchemy exception for an exception raised by pyexasol while executing
+    ``statement``, or None if ``error`` does not originate from pyexasol.
+    """
+    exceptions = _pyexasol_exceptions()
+    if exceptions is None or not isinstance(error, exceptions.ExaError):
+        return None
+
+    # Query-specific server errors
+    if isinstance(error, exceptions.ExaQueryError):
+        return sa_exc.ProgrammingError(statement, parameters, error)
+
+    # Connection/auth/request/transport problems
+    if isinstance(
+        error,
+        (
+            exceptions.ExaAuthError,
+            exceptions.ExaRequestError,
+            exceptions.ExaCommunicationError,
+        ),
+    ):
+        return sa_exc.OperationalError(statement, parameters, error)
+
+    # Everything else from pyexasol
+    return sa_exc.DatabaseError(statement, parameters, error)
+
+
 ColumnMetadata = namedtuple(
     "ColumnMetadata",
     [
@@ -117,6 +202,28 @@ ColumnMetadata = namedtuple(
     ],
 )
 
+# execution option setting the number of bytes fetched per chunk of a result set
+FETCH_SIZE_BYTES_OPTION = "exasol_fetch_size_bytes"
+# execution option opening a schema on the connection before statements run
+SCHEMA_OPTION = "exasol_schema"
+
+# Upper bound for the parameters of one multi-row INSERT of "insertmanyvalues",
+# which the websocket driver sends as a single JSON message.
+INSERTMANYVALUES_MAX_BYTES = 4 * 1024 * 1024
+# parameter sets sampled to estimate the size of the rows of an INSERT
+_ROW_SIZE_SAMPLES = 16
+# Default number of identifiers whose conversion is cached per direction by
+# normalize_name and denormalize_name.
+NAME_CACHE_SIZE = 10_000
+# key of the current schema in the info dictionary of a pooled DBAPI connection
+_CURRENT_SCHEMA_KEY = "exasol_current_schema"
+# key of the schema to open again when a connection switched by the
+# exasol_schema execution option is checked in
+_DEFAULT_SCHEMA_KEY = "exasol_default_schema"
+# key marking that a statement was executed in the current transaction of a
+# pooled DBAPI connection, which makes it unsafe to retry the next statement
+_TRANSACTION_WORK_KEY = "exasol_transaction_work"
+
 AUTOCOMMIT_REGEXP = re.compile(
     r"\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER|TRUNCATE|MERGE)", re.I | re.UNICODE
 )
@@ -618,6 +725,17 @@ class EXACompiler(compiler.SQLCompiler):
         },
     )
 
+    # seconds spent compiling, if the metrics of the dialect are enabled
+    _exasol_compile_time = None
+
+    def __init__(self, dialect, statement, *args, **kwargs):
+        if dialect.metrics is None:
+            super().__init__(dialect, statement, *args, **kwargs)
+            return
+        start = time.perf_counter()
+        super().__init__(dialect, statement, *args, **kwargs)
+        self._exasol_compile_time = time.perf_counter() - start
+
     def visit_now_func(self, fn, **kw):
         return "CURRENT_TIMESTAMP"
 
@@ -625,11 +743,14 @@ class EXACompiler(compiler.SQLCompiler):
         return "length%s" % self.function_argspec(fn)
 
     def limit_clause(self, select, **kw):
+        # Exasol does not accept bind parameters in LIMIT / OFFSET. Rendering the
+        # values as literals at execution time keeps the compiled form cacheable.
+        kw["literal_execute"] = True
         text = ""
-        if select._limit is not None:
-            text += "\n LIMIT %d" % int(select._limit)
-        if select._offset is not None:
-            text += "\n OFFSET %d" % int(select._offset)
+        if select._limit_clause is not None:
+            text += "\n LIMIT " + self.process(select._limit_clause, **kw)
+        if select._offset_clause is not None:
+            text += "\n OFFSET " + self.process(select._offset_clause, **kw)
 
         return text
 
@@ -831,9 +952,154 @@ class EXAIdentifierPreparer(compiler.IdentifierPreparer):
 
 
 class EXAExecutionContext(default.DefaultExecutionContext):
+    _bulk_import_rowcount = None
+    # parts of the profiles captured with the execution option exasol_profile
+    exasol_profile = None
+    _statement_metrics = None
+    _execute_start = None
+
+    SELECT_STATEMENT_RE = re.compile(r"\s*(SELECT|WITH)\b", re.I)
+    # statements which may change the current schema, CREATE SCHEMA opens it
+    SCHEMA_STATEMENT_RE = re.compile(r"\s*(OPEN|CLOSE|CREATE|DROP)\s+SCHEMA\b", re.I)
+
+    def create_cursor(self):
+        if (
+            self.dialect.supports_http_transport
+            and self.execution_options.get(transport.EXPORT_STREAM_OPTION, False)
+            and self._is_export_streamable()
+        ):
+            if self.execution_options.get(profiling.PROFILE_OPTION, False):
+                # the profile would be read through the connection used by the
+                # export thread, which pyexasol doesn't allow
+                raise sa_exc.ArgumentError(
+                    f"The execution options {transport.EXPORT_STREAM_OPTION} and "
+                    f"{profiling.PROFILE_OPTION} can't be combined"
+                )
+            cursor = self.create_export_cursor()
+        else:
+            cursor = super().create_cursor()
+        statement = getattr(self, "unicode_statement", None)
+        if self.dialect.metrics is None or statement is None:
+            return cursor
+        self._statement_metrics = self.dialect.metrics.statement(statement)
+        return metrics.MeasuredCursor(cursor, self._statement_metrics)
+
+    def _is_export_streamable(self):
+        if self.compiled is not None and isinstance(
+            self.compiled.statement, expression.Selectable
+        ):
+            return True
+        return bool(
+            self.is_text and self.SELECT_STATEMENT_RE.match(self.unicode_statement)
+        )
+
+    def create_export_cursor(self):
+        result_types = None
+        if self.compiled is not None and self.compiled._result_columns:
+            result_types = [column[3] for column in self.compiled._result_columns]
+        return transport.ExportCursor(
+            self.dialect.loaded_dbapi,
+            self.dialect._get_pyexasol_connection(
+                self._dbapi_connection.dbapi_connection
+            ),
+            chunk_size=self.execution_options.get(
+                transport.EXPORT_CHUNK_SIZE_OPTION, transport.DEFAULT_EXPORT_CHUNK_SIZE
+            ),
+            result_types=result_types,
+        )
+
+    def create_server_side_cursor(self):
+        # The websocket driver keeps the result set handle open and fetches
+        # further rows in chunks of fetch_size_bytes only when they are requested.
+        return self._dbapi_connection.cursor()
+
+    def pre_exec(self):
+        statement = getattr(self, "unicode_statement", None)
+        info = _connection_info(self._dbapi_connection)
+        if (
+            info is not None
+            and statement is not None
+            and self.SCHEMA_STATEMENT_RE.match(statement)
+        ):
+            info.pop(_CURRENT_SCHEMA_KEY, None)
+        schema = self.execution_options.get(SCHEMA_OPTION)
+        if schema is not None:
+            try:
+                self.dialect._open_schema(
+                    self._dbapi_connection,
+                    schema,
+                    self.dialect._get_schema_from_url(self.root_connection, None),
+                )
+            # pre_exec runs outside of the error handling of the statement
+            except Exception as e:
+                sql_statement = self.dialect._schema_statement(
+                    self.dialect.denormalize_name(schema)
+                )
+                error = _translate_pyexasol_error(sql_statement, (), e)
+                self.root_connection._handle_dbapi_exception(
+                    error if error is not None else e,
+                    sql_statement,
+                    (),
+                    self.cursor,
+                    self,
+                )
+        if self.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            self._set_insertmanyvalues_page_size()
+        if self._statement_metrics is not None:
+            self._record_compile_time()
+            self._execute_start = time.perf_counter()
+
+    def _record_compile_time(self):
+        compiled = self.compiled
+        # DDL compilers are not timed
+        if getattr(compiled, "_exasol_compile_time", None) is None:
+            return
+        # a compiled statement is recorded once, on its first execution
+        self._statement_metrics.add("compilations", 1)
+        self._statement_metrics.add("compile_time", compiled._exasol_compile_time)
+        compiled._exasol_compile_time = None
+
+    def _set_insertmanyvalues_page_size(self):
+        """
+        Limit the rows per INSERT of "insertmanyvalues" to the maximum message size
+        and number of parameters, or fall back to ``executemany`` for a bulk import.
+        """
+        if transport.get_bulk_import(self, self.parameters) is not None:
+            self.execute_style = ExecuteStyle.EXECUTEMANY
+            return
+        # sum up the rows of all INSERTs, like executemany
+        options = {"preserve_rowcount": True}
+        if "insertmanyvalues_page_size" not in self.execution_options:
+            parameters = self.parameters
+            step = max(1, len(parameters) // _ROW_SIZE_SAMPLES)
+            row_size = max(metrics.estimate_row_size(row) for row in parameters[::step])
+            page_size = min(
+                self.dialect.insertmanyvalues_page_size,
+                self.dialect.insertmanyvalues_max_bytes // row_size,
+                # wide tables of small values reach the parameters limit first
+                self.dialect.insertmanyvalues_max_parameters
+                // max(len(parameters[0]), 1),
+            )
+            options["insertmanyvalues_page_size"] = max(page_size, 1)
+        self.execution_options = self.execution_options.union(options)
+
     def post_exec(self):
+        if self._execute_start is not None:
+            self._statement_metrics.add(
+                "execute_time", time.perf_counter() - self._execute_start
+            )
+            self._statement_metrics.add("executions", 1)
+        if self._bulk_import_rowcount is not None:
+            self._rowcount = self._bulk_import_rowcount
+            return
         self._rowcount = self.cursor.rowcount
 
+    def get_result_processor(self, type_, colname, coltype):
+        processor = super().get_result_processor(type_, colname, coltype)
+        if processor is None or self._statement_metrics is None:
+            return processor
+        return metrics.measure_processor(processor, self._statement_metrics)
+
     def fire_sequence(self, default, type_):
         raise NotImplemented
 
@@ -855,33 +1121,15 @@ class EXAExecutionContext(default.DefaultExecutionContext):
             util.warn(msg)
             raise Exception(msg)
 
-        id_col = self.dialect.denormalize_name(autoinc_pk_columns[0])
-        table = self.compiled.sql_compiler.statement.table.name
-        table = self.dialect.denormalize_name(table)
-
-        def _get_schema(sql_compiler, dialect):
-            """Get the schema while taking the translation-map and the de-normalization into account"""
-            translate_map = sql_compiler.schema_translate_map
-            schema_dispatcher = translate_map if translate_map else {}
-            tmp_schema = sql_compiler.statement.table.schema
-            tmp_schema = (
-                schema_dispatcher[tmp_schema]
-                if tmp_schema in schema_dispatcher
-                else tmp_schema
-            )
-            return dialect.denormalize_name(tmp_schema)
-
-        query = (
-            "SELECT column_identity FROM SYS.EXA_ALL_COLUMNS "
-            "WHERE column_object_type = 'TABLE' "
-            "AND column_table = ? "
-            "AND column_name = ?"
+        statement = self.compiled.sql_compiler.statement
+        schema = statement.table.schema
+        # take the schema translate map into account
+        translate_map = self.compiled.sql_compiler.schema_translate_map
+        if translate_map and schema in translate_map:
+            schema = translate_map[schema]
+        query, params = self.dialect._get_identity_query(
+            statement.table.name, autoinc_pk_columns[0], schema
         )
-        params = [table, id_col]
-
-        if found_schema := _get_schema(self.compiled.sql_compiler, self.dialect):
-            query += " AND column_schema = ?"
-            params.append(found_schema)
 
         with closing(self.create_cursor()) as cursor:
             cursor.execute(query, params)
@@ -925,34 +1173,93 @@ class EXADialect(default.DefaultDialect):
     colspecs = colspecs
     isolation_level = None
     server_version_info = None
-
-    def __init__(self, isolation_level=None, native_datetime=False, **kwargs):
+    supports_statement_cache = True
+    supports_server_side_cursors = True
+    supports_multivalues_insert = True
+    # multi-row INSERTs for executemany, as there is no RETURNING
+    use_insertmanyvalues = True
+    use_insertmanyvalues_wo_returning = True
+    insertmanyvalues_max_bytes = INSERTMANYVALUES_MAX_BYTES
+    # IMPORT and EXPORT through the HTTP transport of pyexasol
+    supports_http_transport = True
+
+    def __init__(
+        self,
+        isolation_level=None,
+        native_datetime=False,
+        reflection_cache=None,
+        bulk_import_threshold=None,
+        fast_decimals=False,
+        metrics=None,
+        name_cache_size=NAME_CACHE_SIZE,
+        **kwargs,
+    ):
         default.DefaultDialect.__init__(self, **kwargs)
         self.isolation_level = isolation_level
+        self.bulk_import_threshold = bulk_import_threshold
+        self.fast_decimals = fast_decimals
+        if metrics is True:
+            metrics = MetricsRegistry()
+        self.metrics = metrics or None
+        if reflection_cache is not None:
+            # imported on demand, the cache pulls in sqlite3
+            from sqlalchemy_exasol.reflection_cache import ReflectionCache
+
+            if not isinstance(reflection_cache, ReflectionCache):
+                reflection_cache = ReflectionCache(reflection_cache)
+        self.reflection_cache = reflection_cache
+        self._normalize_name_cached = functools.lru_cache(name_cache_size)(
+            self._normalize_name
+        )
+        self._denormalize_name_cached = functools.lru_cache(name_cache_size)(
+            self._denormalize_name
+        )
+        # schema named in the database part of the URL of an engine
+        self._url_schemas = {}
 
     _isolation_lookup = {"SERIALIZABLE": 0}
 
     def _get_server_version_info(self, connection):
         if self.server_version_info is None:
+            self.server_version_info = self._get_cached_server_version_info(connection)
+
+        # return cached info
+        return self.server_version_info
+
+    def _get_cached_server_version_info(self, connection):
+        """
+        The server version, reported at login or queried once per DSN and process.
+
+        Engines pointing at the same host and port share the version, so only the
+        first of them pays for the query when the driver does not report it.
+        """
+        version = self._get_login_server_version(connection)
+        if version is not None:
+            return _parse_server_version(version)
+        url = connection.engine.url
+        key = (url.host, url.port)
+        version_info = _server_version_infos.get(key) if url.host else None
+        if version_info is None:
             query = (
                 "select PARAM_VALUE from SYS.EXA_METADATA"
                 " where PARAM_NAME = 'databaseProductVersion'"
             )
-            result = connection.execute(sql.text(query)).fetchone()[0].split(".")
-            major, minor, patch = 0, 0, 0
-            major = int(result[0])
-            minor = int(result[1])
-            try:
-                # last version position can something like: '12-S' or 'RC2'
-                # might fail with ValueError
-                patch = int(result[2].split("-")[0])
-            except ValueError:
-                # ignore if there is some funky string in the patch field
-                pass
-            self.server_version_info = (major, minor, patch)
-
-        # return cached info
-        return self.server_version_info
+            version_info = _parse_server_version(
+                connection.execute(sql.text(query)).fetchone()[0]
+            )
+            if url.host:
+                _server_version_infos[key] = version_info
+        return version_info
+
+    def _get_login_server_version(self, connection):
+        """The release version pyexasol received with the login response, if any."""
+        pyexasol_connection = self._get_pyexasol_connection(
+            connection.connection.dbapi_connection
+        )
+        login_info = getattr(pyexasol_connection, "login_info", None)
+        if not isinstance(login_info, dict):
+            return None
+        return login_info.get("releaseVersion")
 
     def _get_default_schema_name(self, connection):
         """
@@ -966,10 +1273,13 @@ class EXADialect(default.DefaultDialect):
         return schema
 
     def _get_schema_from_url(self, connection, schema):
-        if connection.engine.url is not None and connection.engine.url != "":
-            schema = self.normalize_name(
-                connection.engine.url.translate_connect_args().get("database")
-            )
+        url = connection.engine.url
+        if url is not None and url != "":
+            if url not in self._url_schemas:
+                self._url_schemas[url] = self.normalize_name(
+                    url.translate_connect_args().get("database")
+                )
+            schema = self._url_schemas[url]
         return schema
 
     def normalize_name(self, name):
@@ -977,6 +1287,13 @@ class EXADialect(default.DefaultDialect):
         Converting Exasol case-insensitive identifiers (upper case)
         to  SQLAlchemy case-insensitive identifiers (lower case)
         """
+        # quoted_name instances compare equal to plain strings, but may convert
+        # differently, hence only plain strings are cached
+        if name.__class__ is str:
+            return self._normalize_name_cached(name)
+        return self._normalize_name(name)
+
+    def _normalize_name(self, name):
         if name is None:
             return None
         if name.upper() == name and not self.identifier_preparer._requires_quotes(
@@ -993,6 +1310,11 @@ class EXADialect(default.DefaultDialect):
         Converting SQLAlchemy case-insensitive identifiers (lower case)
         to  Exasol case-insensitive identifiers (upper case)
         """
+        if name.__class__ is str:
+            return self._denormalize_name_cached(name)
+        return self._denormalize_name(name)
+
+    def _denormalize_name(self, name):
         if name is None or len(name) == 0:
             return None
         elif name.lower() == name and not self.identifier_preparer._requires_quotes(
@@ -1001,6 +1323,18 @@ class EXADialect(default.DefaultDialect):
             name = name.upper()
         return name
 
+    def name_cache_info(self):
+        """
+        Statistics of the caches of :meth:`normalize_name` and
+        :meth:`denormalize_name`, as returned by ``functools.lru_cache``.
+
+        The size of the caches is set by the dialect option ``name_cache_size``.
+        """
+        return {
+            "normalize_name": self._normalize_name_cached.cache_info(),
+            "denormalize_name": self._denormalize_name_cached.cache_info(),
+        }
+
     def get_isolation_level(self, connection):
         return "SERIALIZABLE"
 
@@ -1008,6 +1342,56 @@ class EXADialect(default.DefaultDialect):
         # TODO: set isolation level
         pass
 
+    @classmethod
+    def engine_created(cls, engine):
+        event.listen(engine.pool, "checkin", engine.dialect._restore_schema)
+
+    def _open_schema(self, pooled_connection, schema, default_schema):
+        """
+        Open ``schema`` on the connection, unless it is its current schema already,
+        and remember ``default_schema`` to restore it on checkin.
+        """
+        schema = self.denormalize_name(schema)
+        info = pooled_connection.info
+        if info.get(_CURRENT_SCHEMA_KEY) == schema:
+            return
+        if _DEFAULT_SCHEMA_KEY not in info:
+            # need to convert to str as quoted text cannot be modified with
+            # the denormalize_name operations
+            info[_DEFAULT_SCHEMA_KEY] = (
+                self.denormalize_name(str(default_schema))
+                if default_schema is not None
+                else None
+            )
+        self._execute_open_schema(pooled_connection, schema)
+        info[_CURRENT_SCHEMA_KEY] = schema
+
+    def _restore_schema(self, dbapi_connection, connection_record):
+        """Open the schema a connection had before the ``exasol_schema`` option."""
+        info = connection_record.info
+        if dbapi_connection is None or _DEFAULT_SCHEMA_KEY not in info:
+            return
+        schema = info.pop(_DEFAULT_SCHEMA_KEY)
+        if _CURRENT_SCHEMA_KEY in info and info[_CURRENT_SCHEMA_KEY] == schema:
+            return
+        try:
+            self._execute_open_schema(dbapi_connection, schema)
+        except Exception as e:
+            # a connection in an unknown schema must not be handed out again
+            logger.warning("Failed to restore schema %s: %s", schema, e)
+            connection_record.invalidate(e)
+            return
+        info[_CURRENT_SCHEMA_KEY] = schema
+
+    def _execute_open_schema(self, dbapi_connection, schema):
+        with closing(dbapi_connection.cursor()) as cursor:
+            cursor.execute(self._schema_statement(schema))
+
+    def _schema_statement(self, schema):
+        if schema is None:
+            return "CLOSE SCHEMA"
+        return f"OPEN SCHEMA {self.identifier_preparer.quote_identifier(schema)}"
+
     def _get_schema_names_query(self, connection, **kw):
         return "select SCHEMA_NAME from SYS.EXA_SCHEMAS"
 
@@ -1032,7 +1416,9 @@ class EXADialect(default.DefaultDialect):
 
     def _get_schema_for_input(self, connection: Connection, schema: str | None):
         if not schema:
-            backup_schema = self._get_schema_from_url(connection, schema)
+            backup_schema = connection._execution_options.get(
+                SCHEMA_OPTION
+            ) or self._get_schema_from_url(connection, schema)
             if backup_schema:
                 # need to convert to str as quoted text cannot be modified with
                 # the denormalize_name operations
@@ -1042,13 +1428,27 @@ class EXADialect(default.DefaultDialect):
 
     @staticmethod
     def _get_current_schema(connection):
-        sql_statement = "SELECT CURRENT_SCHEMA"
-        current_schema = connection.execute(sql.text(sql_statement)).fetchone()[0]
-        return current_schema
+        """
+        The current schema of the DBAPI connection, queried once and kept until a
+        statement opens, closes, creates or drops a schema.
+        """
+        info = connection.info
+        if _CURRENT_SCHEMA_KEY not in info:
+            sql_statement = "SELECT CURRENT_SCHEMA"
+            info[_CURRENT_SCHEMA_KEY] = connection.execute(
+                sql.text(sql_statement)
+            ).fetchone()[0]
+        return info[_CURRENT_SCHEMA_KEY]
 
     @reflection.cache
     def get_table_names(self, connection, schema, **kw):
         schema = self._get_schema_for_input(connection, schema)
+        snapshot = self._get_persistent_snapshot(schema, kw.get("info_cache"))
+        if snapshot is not None:
+            return [
+                self.normalize_name(name)
+                for name in snapshot.get_object_names(connection, ["TABLE"])
+            ]
         sql_statement = (
             "SELECT table_name FROM  SYS.EXA_ALL_TABLES WHERE table_schema = "
         )
@@ -1068,6 +1468,12 @@ class EXADialect(default.DefaultDialect):
         self._ensure_has_table_connection(connection)
 
         schema = self._get_schema_for_input(connection, schema)
+        snapshot = self._get_catalog_snapshot(
+            schema, kw.get("info_cache"), self.denormalize_name(table_name)
+        )
+        if snapshot is not None:
+            return snapshot.has_table(connection, self.denormalize_name(table_name))
+
         sql_statement = (
             "SELECT OBJECT_NAME FROM SYS.EXA_ALL_OBJECTS "
             "WHERE OBJECT_TYPE IN ('TABLE', 'VIEW') "
@@ -1089,6 +1495,12 @@ class EXADialect(default.DefaultDialect):
     @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
         schema_name = self._get_schema_for_input(connection, schema)
+        snapshot = self._get_persistent_snapshot(schema_name, kw.get("info_cache"))
+        if snapshot is not None:
+            return [
+                self.normalize_name(name)
+                for name in snapshot.get_object_names(connection, ["VIEW"])
+            ]
         sql_statement = "SELECT view_name FROM  SYS.EXA_ALL_VIEWS WHERE view_schema = "
         if schema_name is None:
             sql_statement += "CURRENT_SCHEMA ORDER BY view_name"
@@ -1125,6 +1537,29 @@ class EXADialect(default.DefaultDialect):
     def quote_string_value(string_value):
         return "'%s'" % (string_value.replace("'", "''"))
 
+    def _get_identity_query(
+        self,
+        table_name: str,
+        column_name: str,
+        schema: str | None,
+        columns: str = "column_identity",
+    ) -> tuple[str, list[str]]:
+        """
+        Query for the current value of the identity number generator of a column,
+        which is the value generated last.
+        """
+        query = (
+            f"SELECT {columns} FROM SYS.EXA_ALL_COLUMNS "
+            "WHERE column_object_type = 'TABLE' "
+            "AND column_table = ? "
+            "AND column_name = ?"
+        )
+        params = [self.denormalize_name(table_name), self.denormalize_name(column_name)]
+        if found_schema := self.denormalize_name(schema):
+            query += " AND column_schema = ?"
+            params.append(found_schema)
+        return query, params
+
     @staticmethod
     def get_column_sql_query_str():
         return (
@@ -1172,17 +1607,72 @@ class EXADialect(default.DefaultDialect):
               AND object_name = :table_name
             """)
 
+    def _get_catalog_snapshot(
+        self,
+        schema: str | None,
+        info_cache: dict[Any, Any] | None,
+        table_name: str | None = None,
+    ) -> catalog.CatalogSnapshot | None:
+        """
+        Catalog snapshot of the schema bound to the current inspection.
+
+        Only reflection calls made through an :class:`~sqlalchemy.engine.Inspector`
+        carry an ``info_cache``; all other calls query the catalog directly. Lookups
+        of a single table use filtered queries until the inspection looked up
+        ``catalog.SNAPSHOT_TABLE_THRESHOLD`` tables of the schema.
+        """
+        if info_cache is None:
+            return None
+        return catalog._get_snapshot(
+            self, info_cache, schema, create=True, table_name=table_name
+        )
+
+    def _get_persistent_snapshot(
+        self, schema: str | None, info_cache: dict[Any, Any] | None
+    ) -> catalog.CatalogSnapshot | None:
+        """
+        Catalog snapshot of the schema, if it is backed by the reflection cache.
+
+        A snapshot restored from the persistent cache already holds the complete
+        catalog data of the schema, so lookups which otherwise run their own,
+        narrower queries are answered from it as well.
+        """
+        if self.reflection_cache is None:
+            return None
+        return self._get_catalog_snapshot(schema, info_cache)
+
+    def invalidate_reflection_cache(self, schema: str | None = None) -> None:
+        """
+        Drop persisted catalog data, so it is read again on next reflection.
+
+        Changes to the schema are detected automatically. Call this method
+        only if the catalog changed in a way the fingerprint does not reflect,
+        e.g. after a comment was altered by another session.
+
+        :param schema: name of the schema to drop. If omitted, the whole cache is
+                       cleared.
+        """
+        if self.reflection_cache is None:
+            return
+        self.reflection_cache.invalidate(
+            self.denormalize_name(schema) if schema is not None else None
+        )
+
     def _resolve_schema_table(
         self,
         connection: Connection,
         table: str,
         schema: str | None = None,
+        **kw: Any,
     ):
         normalized_schema = self._get_schema_for_input(connection, schema)
         normalized_table = self.denormalize_name(table)
 
         if not self.has_table(
-            connection=connection, table_name=normalized_table, schema=normalized_schema
+            connection=connection,
+            table_name=normalized_table,
+            schema=normalized_schema,
+            **kw,
         ):
             identifier = normalized_table
             if normalized_schema is not None:
@@ -1196,7 +1686,12 @@ class EXADialect(default.DefaultDialect):
         connection: Connection,
         table_name: str,
         schema: str | None = None,
+        info_cache: dict[Any, Any] | None = None,
     ) -> dict[str, str | None]:
+        snapshot = self._get_catalog_snapshot(schema, info_cache, table_name)
+        if snapshot is not None:
+            return snapshot.get_column_comments(connection, table_name)
+
         result = connection.execute(
             sql.text(self.get_column_comments_sql_query_str()),
             {
@@ -1215,13 +1710,21 @@ class EXADialect(default.DefaultDialect):
         connection: Connection,
         table_name: str,
         schema: str | None = None,
-        **kw: Any,  # pylint: disable=unused-argument
+        **kw: Any,
     ) -> ReflectedTableComment:
         schema_name, table_name = self._resolve_schema_table(
             connection=connection,
             table=table_name,
             schema=schema,
+            **kw,
+        )
+        snapshot = self._get_catalog_snapshot(
+            schema_name, kw.get("info_cache"), table_name
         )
+        if snapshot is not None:
+            return ReflectedTableComment(
+                text=snapshot.get_table_comment(connection, table_name)
+            )
 
         result = (
             connection.execute(
@@ -1246,6 +1749,13 @@ class EXADialect(default.DefaultDialect):
         schema: str | None = None,
         **kw: Any,
     ):
+        snapshot = self._get_catalog_snapshot(schema, kw.get("info_cache"), table_name)
+        if snapshot is not None:
+            return [
+                ColumnMetadata(*column_metadata)
+                for column_metadata in snapshot.get_columns(connection, table_name)
+            ]
+
         sql_statement = self.get_column_sql_query_str().format(
             schema=self._get_schema_replacement_string(schema_name=schema),
             table=":table",
@@ -1272,7 +1782,7 @@ class EXADialect(default.DefaultDialect):
             return []
 
         schema_name, table_name = self._resolve_schema_table(
-            connection=connection, table=table_name, schema=schema
+            connection=connection, table=table_name, schema=schema, **kw
         )
 
         column_metadata_rows = self._get_columns(
@@ -1285,33 +1795,40 @@ class EXADialect(default.DefaultDialect):
             connection=connection,
             table_name=table_name,
             schema=schema_name,
+            info_cache=kw.get("info_cache"),
         )
 
-        columns: list[ReflectedColumn] = []
-        for column_metadata in column_metadata_rows:
-            coltype = self._get_coltype(column_metadata)
-
-            reflected_column: Any = {
-                "name": self.normalize_name(column_metadata.colname),
-                "type": coltype,
-                "nullable": column_metadata.nullable,
-                "default": column_metadata.default,
-                "is_distribution_key": column_metadata.is_distribution_key,
-                "comment": column_comments.get(column_metadata.colname.upper()),
-            }
-            identity = column_metadata.identity
-            if identity:
-                identity = int(identity)
-            # if we have a positive identity value add a sequence
-            if identity is not None and identity >= 0:
-                reflected_column["sequence"] = {"name": ""}
-                # TODO: we have to possibility to encode the current identity value count
-                # into the column metadata. But the consequence is that it would also be used
-                # as start value in CREATE statements. For now the current value is ignored.
-                # Add it by changing the dict to: {'name':'', 'start': int(identity)}
-
-            columns.append(reflected_column)
-        return columns
+        return [
+            self._get_reflected_column(
+                column_metadata,
+                column_comments.get(column_metadata.colname.upper()),
+            )
+            for column_metadata in column_metadata_rows
+        ]
+
+    def _get_reflected_column(
+        self, column_metadata: ColumnMetadata, comment: str | None
+    ) -> ReflectedColumn:
+        """Build the SQLAlchemy column description for one catalog row."""
+        reflected_column: Any = {
+            "name": self.normalize_name(column_metadata.colname),
+            "type": self._get_coltype(column_metadata),
+            "nullable": column_metadata.nullable,
+            "default": column_metadata.default,
+            "is_distribution_key": column_metadata.is_distribution_key,
+            "comment": comment,
+        }
+        identity = column_metadata.identity
+        if identity:
+            identity = int(identity)
+        # if we have a positive identity value add a sequence
+        if identity is not None and identity >= 0:
+            reflected_column["sequence"] = {"name": ""}
+            # TODO: we have to possibility to encode the current identity value count
+            # into the column metadata. But the consequence is that it would also be used
+            # as start value in CREATE statements. For now the current value is ignored.
+            # Add it by changing the dict to: {'name':'', 'start': int(identity)}
+        return reflected_column
 
     def _get_coltype(self, column_metadata: ColumnMetadata) -> TypeEngine:
         """Map reflected column metadata to a SQLAlchemy type."""
@@ -1365,21 +1882,25 @@ class EXADialect(default.DefaultDialect):
     @reflection.cache
     def _get_pk_constraint(self, connection, table_name, schema, **kw):
         schema_name, table_name = self._resolve_schema_table(
-            connection=connection, table=table_name, schema=schema
+            connection=connection, table=table_name, schema=schema, **kw
         )
 
-        sql_statement = self._get_constraint_sql_str(
-            schema=self._get_schema_replacement_string(schema_name=schema_name),
-            table_name=":table",
-            contraint_type="PRIMARY KEY",
-        )
-        result = connection.execute(
-            sql.text(sql_statement),
-            {
-                "schema": schema_name,
-                "table": table_name,
-            },
-        )
+        snapshot = self._get_persistent_snapshot(schema_name, kw.get("info_cache"))
+        if snapshot is not None:
+            result = snapshot.get_constraints(connection, table_name, "PRIMARY KEY")
+        else:
+            sql_statement = self._get_constraint_sql_str(
+                schema=self._get_schema_replacement_string(schema_name=schema_name),
+                table_name=":table",
+                contraint_type="PRIMARY KEY",
+            )
+            result = connection.execute(
+                sql.text(sql_statement),
+                {
+                    "schema": schema_name,
+                    "table": table_name,
+                },
+            )
         pkeys = []
         constraint_name = None
         for row in list(result):
@@ -1406,9 +1927,13 @@ class EXADialect(default.DefaultDialect):
         **kw: Any,
     ):
         schema_name, table_name = self._resolve_schema_table(
-            connection=connection, table=table_name, schema=schema
+            connection=connection, table=table_name, schema=schema, **kw
         )
 
+        snapshot = self._get_persistent_snapshot(schema_name, kw.get("info_cache"))
+        if snapshot is not None:
+            return snapshot.get_constraints(connection, table_name, "FOREIGN KEY")
+
         sql_statement = self._get_constraint_sql_str(
             schema=self._get_schema_replacement_string(schema_name=schema_name),
             table_name=":table",
@@ -1436,6 +1961,13 @@ class EXADialect(default.DefaultDialect):
             return []
 
         schema_int = self._get_schema_for_input_or_current(connection, schema)
+        constraints = self._get_foreign_keys(
+            connection, table_name=table_name, schema=schema_int, **kw
+        )
+        return self._build_foreign_keys(constraints, schema, schema_int)
+
+    def _build_foreign_keys(self, constraints, schema, schema_int):
+        """Group foreign key constraint column rows into reflected foreign keys."""
 
         def fkey_rec():
             return {
@@ -1447,9 +1979,6 @@ class EXADialect(default.DefaultDialect):
             }
 
         fkeys: defaultdict[str, dict[str, Any]] = defaultdict(fkey_rec)
-        constraints = self._get_foreign_keys(
-            connection, table_name=table_name, schema=schema_int, **kw
-        )
         for row in constraints:
             cons_name, local_column, remote_schema, remote_table, remote_column = (
                 row[0],
@@ -1481,6 +2010,341 @@ class EXADialect(default.DefaultDialect):
 
         return list(fkeys.values())
 
+    @staticmethod
+    def _get_object_types(kind: ObjectKind) -> list[str]:
+        """Exasol object types matching the requested kind of reflected objects."""
+        object_types = []
+        if ObjectKind.TABLE in kind:
+            object_types.append("TABLE")
+        if ObjectKind.VIEW in kind:
+            object_types.append("VIEW")
+        # Exasol has neither materialized views nor temporary tables
+        return object_types
+
+    @staticmethod
+    def get_multi_objects_sql_query_str(
+        object_types: list[str], schema: str, has_filter_names: bool
+    ) -> str:
+        sql_statement = (
+            "SELECT object_name, object_comment, object_type "
+            "FROM SYS.EXA_ALL_OBJECTS "
+            f"WHERE object_type IN ({', '.join(repr(t) for t in object_types)}) "
+            f"AND root_name = {schema} "
+        )
+        if has_filter_names:
+            sql_statement += "AND object_name IN :filter_names "
+        return sql_statement + "ORDER BY object_name"
+
+    @staticmethod
+    def get_schema_fingerprint_sql_query_str(schema: str) -> str:
+        """
+        Cheap summary of a schema, which changes whenever one of its objects is
+        created, dropped or altered.
+        """
+        return (
+            "SELECT COUNT(*), MAX(created), MAX(last_commit) "
+            "FROM SYS.EXA_ALL_OBJECTS "
+            f"WHERE root_name = {schema}"
+        )
+
+    @staticmethod
+    def get_multi_column_sql_query_str(
+        object_types: list[str], schema: str, has_filter_names: bool
+    ) -> str:
+        sql_statement = (
+            "SELECT "
+            "column_table, "
+            "column_name, "
+            "column_type, "
+            "column_maxsize, "
+            "column_num_prec, "
+            "column_num_scale, "
+            "column_is_nullable, "
+            "column_default, "
+            "column_identity, "
+            "column_is_distribution_key, "
+            "column_comment "
+            "FROM sys.exa_all_columns "
+            "WHERE "
+            f"column_object_type IN ({', '.join(repr(t) for t in object_types)}) AND "
+            f"column_schema = {schema} "
+        )
+        if has_filter_names:
+            sql_statement += "AND column_table IN :filter_names "
+        return sql_statement + "ORDER BY column_table, column_ordinal_position"
+
+    @staticmethod
+    def _get_multi_constraint_sql_str(schema, contraint_type, has_filter_names):
+        sql_statement = (
+            "SELECT "
+            "constraint_name, "
+            "column_name, "
+            "referenced_schema, "
+            "referenced_table, "
+            "referenced_column, "
+            "constraint_table, "
+            "constraint_type "
+            "FROM SYS.EXA_ALL_CONSTRAINT_COLUMNS "
+            "WHERE "
+            f"constraint_schema={schema} AND "
+            f"constraint_type='{contraint_type}' "
+        )
+        if has_filter_names:
+            sql_statement += "AND constraint_table IN :filter_names "
+        return sql_statement + "ORDER BY constraint_table, ordinal_position"
+
+    def _execute_multi_reflection(
+        self,
+        connection: Connection,
+        sql_statement: str,
+        schema: str | None,
+        filter_names: tuple[str, ...] | None,
+    ):
+        statement = sql.text(sql_statement)
+        params: dict[str, Any] = {"schema": schema}
+        if filter_names:
+            statement = statement.bindparams(
+                sql.bindparam("filter_names", expanding=True)
+            )
+            params["filter_names"] = list(filter_names)
+        return connection.execute(statement, params)
+
+    def _prepare_multi_reflection(self, connection, schema, filter_names):
+        """Resolve the schema and the denormalized table names to reflect."""
+        schema_name = self._get_schema_for_input(connection, schema)
+        if filter_names:
+            filter_names = tuple(self.denormalize_name(name) for name in filter_names)
+        else:
+            filter_names = None
+        return schema_name, filter_names
+
+    @reflection.cache
+    def _get_multi_objects(
+        self,
+        connection: Connection,
+        schema: str | None = None,
+        filter_names: tuple[str, ...] | None = None,
+        kind: ObjectKind = ObjectKind.TABLE,
+        scope: ObjectScope = ObjectScope.DEFAULT,
+        **kw: Any,
+    ) -> dict[str, str | None]:
+        """Denormalized names and comments of all requested objects of a schema."""
+        object_types = self._get_object_types(kind)
+        if ObjectScope.DEFAULT not in scope or not object_types:
+            return {}
+        snapshot = self._get_persistent_snapshot(schema, kw.get("info_cache"))
+        if snapshot is not None:
+            return snapshot.get_objects(connection, object_types, filter_names)
+
+        sql_statement = self.get_multi_objects_sql_query_str(
+            object_types=object_types,
+            schema=self._get_schema_replacement_string(schema_name=schema),
+            has_filter_names=filter_names is not None,
+        )
+        result = self._execute_multi_reflection(
+            connection, sql_statement, schema, filter_names
+        )
+        return {row[0]: row[1] for row in result}
+
+    def _get_multi_constraint_rows(
+        self,
+        connection: Connection,
+        schema: str | None,
+        sql_schema: str,
+        schema_param: str | None,
+        constraint_type: str,
+        objects: dict[str, str | None],
+        filter_names: tuple[str, ...] | None,
+        info_cache: dict[Any, Any] | None,
+    ):
+        """Constraint column rows of the requested objects, see ``_get_constraint_sql_str``."""
+        snapshot = self._get_persistent_snapshot(schema, info_cache)
+        if snapshot is not None:
+            return [
+                row
+                for table in objects
+                for row in snapshot.get_constraints(connection, table, constraint_type)
+            ]
+        sql_statement = self._get_multi_constraint_sql_str(
+            schema=sql_schema,
+            contraint_type=constraint_type,
+            has_filter_names=filter_names is not None,
+        )
+        return self._execute_multi_reflection(
+            connection, sql_statement, schema_param, filter_names
+        )
+
+    def get_multi_columns(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None,
+        filter_names,
+        scope: ObjectScope,
+        kind: ObjectKind,
+        **kw: Any,
+    ):
+        schema_name, filter_names = self._prepare_multi_reflection(
+            connection, schema, filter_names
+        )
+        object_types = self._get_object_types(kind)
+        if ObjectScope.DEFAULT not in scope or not object_types:
+            return []
+
+        snapshot = self._get_persistent_snapshot(schema_name, kw.get("info_cache"))
+        if snapshot is not None:
+            objects = snapshot.get_objects(connection, object_types, filter_names)
+            rows: Any = (
+                (table, *column, comment)
+                for table in objects
+                for column, comment in snapshot.get_column_rows(connection, table)
+            )
+        else:
+            sql_statement = self.get_multi_column_sql_query_str(
+                object_types=object_types,
+                schema=self._get_schema_replacement_string(schema_name=schema_name),
+                has_filter_names=filter_names is not None,
+            )
+            rows = self._execute_multi_reflection(
+                connection, sql_statement, schema_name, filter_names
+            )
+        columns: defaultdict[str, list[ReflectedColumn]] = defaultdict(list)
+        for row in rows:
+            column_metadata = ColumnMetadata(*row[1:-1])
+            columns[row[0]].append(
+                self._get_reflected_column(column_metadata, comment=row[-1])
+            )
+        return (
+            ((schema, self.normalize_name(table)), table_columns)
+            for table, table_columns in columns.items()
+        )
+
+    def get_multi_pk_constraint(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None,
+        filter_names,
+        scope: ObjectScope,
+        kind: ObjectKind,
+        **kw: Any,
+    ):
+        schema_name, filter_names = self._prepare_multi_reflection(
+            connection, schema, filter_names
+        )
+        objects = self._get_multi_objects(
+            connection,
+            schema=schema_name,
+            filter_names=filter_names,
+            kind=kind,
+            scope=scope,
+            **kw,
+        )
+        if not objects:
+            return []
+
+        result = self._get_multi_constraint_rows(
+            connection,
+            schema=schema_name,
+            sql_schema=self._get_schema_replacement_string(schema_name=schema_name),
+            schema_param=schema_name,
+            constraint_type="PRIMARY KEY",
+            objects=objects,
+            filter_names=filter_names,
+            info_cache=kw.get("info_cache"),
+        )
+        pkeys: dict[str, Any] = {}
+        for row in result:
+            pk = pkeys.setdefault(row[5], ReflectionDefaults.pk_constraint())
+            pk["constrained_columns"].append(self.normalize_name(row[1]))
+            pk["name"] = self.normalize_name(row[0])
+        return (
+            (
+                (schema, self.normalize_name(table)),
+                pkeys.get(table, ReflectionDefaults.pk_constraint()),
+            )
+            for table in objects
+        )
+
+    def get_multi_foreign_keys(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None,
+        filter_names,
+        scope: ObjectScope,
+        kind: ObjectKind,
+        **kw: Any,
+    ):
+        schema_name, filter_names = self._prepare_multi_reflection(
+            connection, schema, filter_names
+        )
+        objects = self._get_multi_objects(
+            connection,
+            schema=schema_name,
+            filter_names=filter_names,
+            kind=kind,
+            scope=scope,
+            **kw,
+        )
+        if not objects:
+            return []
+
+        schema_int = self._get_schema_for_input_or_current(connection, schema)
+        result = self._get_multi_constraint_rows(
+            connection,
+            schema=schema_name,
+            sql_schema=":schema",
+            schema_param=schema_int,
+            constraint_type="FOREIGN KEY",
+            objects=objects,
+            filter_names=filter_names,
+            info_cache=kw.get("info_cache"),
+        )
+        constraints = defaultdict(list)
+        for row in result:
+            constraints[row[5]].append(row)
+        return (
+            (
+                (schema, self.normalize_name(table)),
+                self._build_foreign_keys(constraints[table], schema, schema_int),
+            )
+            for table in objects
+        )
+
+    def get_multi_table_comment(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None,
+        filter_names,
+        scope: ObjectScope,
+        kind: ObjectKind,
+        **kw: Any,
+    ):
+        schema_name, filter_names = self._prepare_multi_reflection(
+            connection, schema, filter_names
+        )
+        objects = self._get_multi_objects(
+            connection,
+            schema=schema_name,
+            filter_names=filter_names,
+            kind=kind,
+            scope=scope,
+            **kw,
+        )
+        return (
+            (
+                (schema, self.normalize_name(table)),
+                (
+                    ReflectedTableComment(text=comment)
+                    if comment is not None
+                    else ReflectionDefaults.table_comment()
+                ),
+            )
+            for table, comment in objects.items()
+        )
+
     @reflection.cache
     def get_indexes(self, connection, table_name, schema=None, **kw):
         """Exasol has no explicit indexes"""
@@ -1492,18 +2356,161 @@ class EXADialect(default.DefaultDialect):
             return EXATimestring()
         return super().type_descriptor(typeobj)
 
-    def do_execute(self, cursor, statement, parameters, context=None):
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        bulk_import = (
+            transport.get_bulk_import(context, parameters)
+            if context is not None
+            else None
+        )
+        if bulk_import is None:
+            with self._profile(context):
+                return self._call_with_retries(
+                    context,
+                    super().do_executemany,
+                    cursor,
+                    statement,
+                    parameters,
+                    context,
+                )
+
+        pyexasol_connection = self._get_pyexasol_connection(
+            context._dbapi_connection.dbapi_connection
+        )
         try:
-            return super().do_execute(cursor, statement, parameters, context)
+            context._bulk_import_rowcount = transport.import_rows(
+                pyexasol_connection, bulk_import, parameters
+            )
+            self._record_transaction_work(context)
+
+        # Problems while streaming the rows or running the IMPORT
+        except Exception as e:
+            exceptions = _pyexasol_exceptions()
+            if exceptions is None or not isinstance(e, exceptions.ExaError):
+                raise
+            raise sa_exc.DatabaseError(statement, parameters, e) from e
 
-        # Query-specific server errors
-        except ExaQueryError as e:
-            raise sa_exc.ProgrammingError(statement, parameters, e) from e
+    def do_begin(self, dbapi_connection):
+        info = _connection_info(dbapi_connection)
+        if info is not None:
+            info.pop(_TRANSACTION_WORK_KEY, None)
 
-        # Connection/auth/request/transport problems
-        except (ExaAuthError, ExaRequestError, ExaCommunicationError) as e:
-            raise sa_exc.OperationalError(statement, parameters, e) from e
+    def is_retryable(self, e):
+        """
+        Whether ``e`` aborted a transaction which can be run again, e.g. after a
+        transaction collision, see :mod:`sqlalchemy_exasol.retry`.
+        """
+        return retry.is_retryable_error(e)
 
-        # Everything else from pyexasol
-        except (ExaRuntimeError, ExaError) as e:
-            raise sa_exc.DatabaseError(statement, parameters, e) from e
+    def _call_with_retries(self, context, function, *args):
+        """
+        Call ``function``, again after transaction collisions if the statement is
+        executed with the ``exasol_retry`` execution option.
+        """
+        policy = (
+            context.execution_options.get(retry.RETRY_OPTION)
+            if context is not None
+            else None
+        )
+        if not policy or not self._is_statement_retryable(context):
+            result = function(*args)
+        else:
+            if policy is True:
+                policy = retry.DEFAULT_RETRY_POLICY
+            statement_metrics = context._statement_metrics
+            result = policy.call(
+                functools.partial(function, *args),
+                (
+                    (lambda e: statement_metrics.add("retries", 1))
+                    if statement_metrics is not None
+                    else None
+                ),
+                self._sleep,
+            )
+        # "insertmanyvalues" executes several statements for one context, a
+        # collision of the next one rolls this one back as well
+        self._record_transaction_work(context)
+        return result
+
+    def _record_transaction_work(self, context):
+        if context is None:
+            return
+        info = _connection_info(context._dbapi_connection)
+        if info is not None:
+            info[_TRANSACTION_WORK_KEY] = True
+
+    def _sleep(self, seconds):
+        """Wait between the attempts of a statement."""
+        time.sleep(seconds)
+
+    def _is_statement_retryable(self, context):
+        """
+        Whether a statement can be retried on its own, which is only the case if it
+        is the first statement of its transaction or the driver commits every
+        statement, as a collision rolls back the whole transaction.
+        """
+        pooled_connection = context._dbapi_connection
+        info = _connection_info(pooled_connection)
+        if info is None or _TRANSACTION_WORK_KEY not in info:
+            return True
+        options = getattr(
+            self._get_pyexasol_connection(pooled_connection.dbapi_connection),
+            "options",
+            None,
+        )
+        return bool(options and options.get("autocommit"))
+
+    def _get_pyexasol_connection(self, dbapi_connection):
+        """The pyexasol connection used by a connection of the websocket driver."""
+        return dbapi_connection.connection
+
+    @contextmanager
+    def _fetch_size_bytes(self, context):
+        """
+        Apply the ``exasol_fetch_size_bytes`` execution option to the statements
+        created by pyexasol while executing the current statement.
+        """
+        fetch_size_bytes = (
+            context.execution_options.get(FETCH_SIZE_BYTES_OPTION)
+            if context is not None
+            else None
+        )
+        if fetch_size_bytes is None:
+            yield
+            return
+        options = self._get_pyexasol_connection(
+            context._dbapi_connection.dbapi_connection
+        ).options
+        default_fetch_size_bytes = options["fetch_size_bytes"]
+        options["fetch_size_bytes"] = fetch_size_bytes
+        try:
+            yield
+        finally:
+            options["fetch_size_bytes"] = default_fetch_size_bytes
+
+    @contextmanager
+    def _profile(self, context):
+        """
+        Capture the profile of the statements executed for ``context`` if requested
+        by the ``exasol_profile`` execution option.
+        """
+        if context is None or not context.execution_options.get(
+            profiling.PROFILE_OPTION, False
+        ):
+            yield
+            return
+        with profiling.capture_profile(context._dbapi_connection.cursor) as profile:
+            yield
+        # "insertmanyvalues" executes several statements for one context
+        context.exasol_profile = (context.exasol_profile or []) + profile
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        try:
+            with self._fetch_size_bytes(context), self._profile(context):
+                return self._call_with_retries(
+                    context, super().do_execute, cursor, statement, parameters, context
+                )
+        except Exception as e:
+            error = _translate_pyexasol_error(statement, parameters, e)
+            if error is None:
+                raise
+            raise error from e
@@ -0,0 +1,293 @@
+"""Per-inspection snapshot of the Exasol catalog.
+
+Reflecting many tables through an :class:`~sqlalchemy.engine.Inspector` used to
+query ``SYS.EXA_ALL_OBJECTS`` for every table and every kind of metadata and
+``SYS.EXA_ALL_COLUMNS`` twice per table (columns and comments). Once
+``SNAPSHOT_TABLE_THRESHOLD`` tables of a schema were looked up, a
+:class:`CatalogSnapshot` loads the object list and the column data of the schema
+once and answers all further lookups of the same inspection from memory.
+
+Snapshots live in the ``info_cache`` of the inspector, hence they are discarded
+together with the inspector or by :meth:`~sqlalchemy.engine.Inspector.clear_cache`.
+If the dialect is configured with a persistent
+:class:`~sqlalchemy_exasol.reflection_cache.ReflectionCache`, snapshots are
+restored from and saved to it.
+"""
+
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from sqlalchemy import sql
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.engine import Inspector
+
+    from sqlalchemy_exasol.base import EXADialect
+    from sqlalchemy_exasol.reflection_cache import ReflectionCache
+
+INFO_CACHE_KEY = "exasol_catalog_snapshot"
+# info_cache key of the tables looked up individually per schema
+_LOOKUPS_KEY = "exasol_catalog_lookups"
+
+# Number of tables of a schema looked up individually within one inspection
+# before the catalog of the whole schema is loaded into a snapshot. Reflecting
+# a single table keeps using the filtered catalog queries.
+SNAPSHOT_TABLE_THRESHOLD = 3
+
+_OBJECT_TYPES = ["TABLE", "VIEW"]
+
+CONSTRAINT_TYPES = ("PRIMARY KEY", "FOREIGN KEY")
+
+
+class CatalogSnapshot:
+    """Catalog data of one schema, loaded on first use and answered from memory.
+
+    Attributes:
+        schema: denormalized schema name, ``None`` stands for the current schema.
+        hits: number of lookups answered from memory.
+        misses: number of lookups which required a catalog query.
+    """
+
+    def __init__(
+        self,
+        dialect: "EXADialect",
+        schema: str | None,
+        persistent_cache: "ReflectionCache | None" = None,
+    ):
+        self.dialect = dialect
+        self.schema = schema
+        self.persistent_cache = persistent_cache
+        self.hits = 0
+        self.misses = 0
+        self._restored = persistent_cache is None
+        # object name -> (object type, comment)
+        self._objects: dict[str, tuple[str, str | None]] | None = None
+        # column rows in the field order of ``ColumnMetadata``, with their comment
+        self._columns: dict[str, list[tuple[tuple, str | None]]] | None = None
+        # constraint type -> table name -> constraint column rows
+        self._constraints: dict[str, dict[str, list[tuple]]] = {}
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} schema={self.schema!r} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def _execute(self, connection: "Connection", sql_statement: str):
+        return connection.execute(sql.text(sql_statement), {"schema": self.schema})
+
+    def _schema_replacement(self) -> str:
+        return self.dialect._get_schema_replacement_string(schema_name=self.schema)
+
+    def _restore(self, connection: "Connection") -> None:
+        if self._restored:
+            return
+        self._restored = True
+        assert self.persistent_cache is not None
+        self.persistent_cache.restore(connection, self)
+
+    def _get_objects(
+        self, connection: "Connection"
+    ) -> dict[str, tuple[str, str | None]]:
+        self._restore(connection)
+        if self._objects is not None:
+            self.hits += 1
+            return self._objects
+        self.misses += 1
+        sql_statement = self.dialect.get_multi_objects_sql_query_str(
+            object_types=_OBJECT_TYPES,
+            schema=self._schema_replacement(),
+            has_filter_names=False,
+        )
+        result = self._execute(connection, sql_statement)
+        self._objects = {row[0]: (row[2], row[1]) for row in result}
+        return self._objects
+
+    def _get_all_columns(
+        self, connection: "Connection"
+    ) -> dict[str, list[tuple[tuple, str | None]]]:
+        self._restore(connection)
+        if self._columns is not None:
+            self.hits += 1
+            return self._columns
+        self.misses += 1
+        sql_statement = self.dialect.get_multi_column_sql_query_str(
+            object_types=_OBJECT_TYPES,
+            schema=self._schema_replacement(),
+            has_filter_names=False,
+        )
+        result = self._execute(connection, sql_statement)
+        columns: defaultdict[str, list[tuple[tuple, str | None]]] = defaultdict(list)
+        for row in result:
+            columns[row[0]].append((tuple(row[1:-1]), row[-1]))
+        self._columns = dict(columns)
+        return self._columns
+
+    def _get_all_constraints(
+        self, connection: "Connection", constraint_type: str
+    ) -> dict[str, list[tuple]]:
+        self._restore(connection)
+        if constraint_type in self._constraints:
+            self.hits += 1
+            return self._constraints[constraint_type]
+        self.misses += 1
+        sql_statement = self.dialect._get_multi_constraint_sql_str(
+            schema=self._schema_replacement(),
+            contraint_type=constraint_type,
+            has_filter_names=False,
+        )
+        result = self._execute(connection, sql_statement)
+        constraints: defaultdict[str, list[tuple]] = defaultdict(list)
+        for row in result:
+            constraints[row[5]].append(tuple(row))
+        self._constraints[constraint_type] = dict(constraints)
+        return self._constraints[constraint_type]
+
+    def load_all(self, connection: "Connection") -> None:
+        """Load every section of the snapshot which is not loaded yet."""
+        self._get_objects(connection)
+        self._get_all_columns(connection)
+        for constraint_type in CONSTRAINT_TYPES:
+            self._get_all_constraints(connection, constraint_type)
+
+    def dump_state(self) -> dict[str, Any]:
+        """Plain data representation of a completely loaded snapshot."""
+        return {
+            "objects": self._objects,
+            "columns": self._columns,
+            "constraints": self._constraints,
+        }
+
+    def load_state(self, state: dict[str, Any]) -> None:
+        """Replace the content of the snapshot with data from :meth:`dump_state`."""
+        self._objects = {name: tuple(value) for name, value in state["objects"].items()}
+        self._columns = {
+            table: [(tuple(row), comment) for row, comment in rows]
+            for table, rows in state["columns"].items()
+        }
+        self._constraints = {
+            constraint_type: {
+                table: [tuple(row) for row in rows] for table, rows in tables.items()
+            }
+            for constraint_type, tables in state["constraints"].items()
+        }
+
+    def has_table(self, connection: "Connection", table_name: str) -> bool:
+        """Check if a table or view exists, ``table_name`` is denormalized."""
+        return table_name in self._get_objects(connection)
+
+    def get_object_names(
+        self, connection: "Connection", object_types: list[str]
+    ) -> list[str]:
+        """Denormalized names of all objects of the given types, ordered by name."""
+        objects = self._get_objects(connection)
+        return sorted(
+            name
+            for name, (object_type, _) in objects.items()
+            if object_type in object_types
+        )
+
+    def get_objects(
+        self,
+        connection: "Connection",
+        object_types: list[str],
+        filter_names: tuple[str, ...] | None = None,
+    ) -> dict[str, str | None]:
+        """
+        Denormalized names and comments of the objects of the given types,
+        optionally restricted to ``filter_names``, ordered by name.
+        """
+        objects = self._get_objects(connection)
+        return {
+            name: comment
+            for name, (object_type, comment) in sorted(objects.items())
+            if object_type in object_types
+            and (filter_names is None or name in filter_names)
+        }
+
+    def get_table_comment(
+        self, connection: "Connection", table_name: str
+    ) -> str | None:
+        _, comment = self._get_objects(connection).get(table_name, (None, None))
+        return comment
+
+    def get_columns(self, connection: "Connection", table_name: str) -> list[tuple]:
+        """Column rows of a table, in the field order of ``ColumnMetadata``."""
+        columns = self._get_all_columns(connection).get(table_name, [])
+        return [column for column, _ in columns]
+
+    def get_column_rows(
+        self, connection: "Connection", table_name: str
+    ) -> list[tuple[tuple, str | None]]:
+        """Column rows of a table together with the comment of each column."""
+        return self._get_all_columns(connection).get(table_name, [])
+
+    def get_column_comments(
+        self, connection: "Connection", table_name: str
+    ) -> dict[str, str | None]:
+        columns = self._get_all_columns(connection).get(table_name, [])
+        return {column[0].upper(): comment for column, comment in columns}
+
+    def get_constraints(
+        self, connection: "Connection", table_name: str, constraint_type: str
+    ) -> list[tuple]:
+        """Constraint column rows of a table, see ``_get_constraint_sql_str``."""
+        return self._get_all_constraints(connection, constraint_type).get(
+            table_name, []
+        )
+
+
+def _get_snapshot(
+    dialect: "EXADialect",
+    info_cache: dict[Any, Any],
+    schema: str | None,
+    create: bool,
+    table_name: str | None = None,
+) -> CatalogSnapshot | None:
+    snapshots = info_cache.get(INFO_CACHE_KEY)
+    if snapshots is None:
+        if not create:
+            return None
+        snapshots = info_cache[INFO_CACHE_KEY] = {}
+    snapshot = snapshots.get(schema)
+    if snapshot is None and create:
+        if (
+            table_name is not None
+            and dialect.reflection_cache is None
+            and not _reached_threshold(info_cache, schema, table_name)
+        ):
+            return None
+        snapshot = snapshots[schema] = CatalogSnapshot(
+            dialect, schema, persistent_cache=dialect.reflection_cache
+        )
+    return snapshot
+
+
+def _reached_threshold(
+    info_cache: dict[Any, Any], schema: str | None, table_name: str
+) -> bool:
+    """Record the lookup of a table, whether the schema is worth a snapshot."""
+    tables = info_cache.setdefault(_LOOKUPS_KEY, {}).setdefault(schema, set())
+    tables.add(str(table_name).upper())
+    return len(tables) >= SNAPSHOT_TABLE_THRESHOLD
+
+
+def get_catalog_snapshot(
+    inspector: "Inspector", schema: str | None = None
+) -> CatalogSnapshot | None:
+    """
+    Return the catalog snapshot an inspector has built for a schema, if any.
+
+    :param inspector: inspector created for an Exasol engine or connection.
+    :param schema: schema name as passed to the inspector methods.
+
+    :returns: the :class:`CatalogSnapshot` or ``None`` if the inspector has not
+              reflected anything from this schema yet.
+    """
+    dialect = inspector.dialect
+    schema_name = dialect._get_schema_for_input(inspector.bind, schema)
+    return _get_snapshot(dialect, inspector.info_cache, schema_name, create=False)
@@ -0,0 +1,342 @@
+"""Columnar access to query results.
+
+Building a :class:`~sqlalchemy.engine.Row` for every row and transposing the rows
+back into columns is a significant overhead when results are fed into analytics
+libraries. The functions of this module read the raw rows of a
+:class:`~sqlalchemy.engine.CursorResult` in batches from its DBAPI cursor, apply
+the result processors of the column types and return the batches column by
+column:
+
+.. code-block:: python
+
+    from sqlalchemy_exasol.columnar import iter_arrow_batches
+
+    with engine.connect() as connection:
+        result = connection.execute(select(table))
+        for batch in iter_arrow_batches(result, batch_size=100_000):
+            ...
+
+Column types are derived from the result metadata of the database, using the
+same mapping as reflection (``ischema_names``), so ``DECIMAL``, ``DATE`` and
+``TIMESTAMP`` columns become native Arrow and NumPy types. ``pyarrow`` and
+``numpy`` are optional and only imported by the functions which need them.
+
+The rows are read from the DBAPI cursor directly, so no rows may have been
+fetched through the result before, and the result is closed once all rows are
+read.
+"""
+
+import datetime
+import decimal
+import itertools
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from sqlalchemy.sql import sqltypes
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import CursorResult
+
+DEFAULT_BATCH_SIZE = 10_000
+
+# largest precision of an integral DECIMAL which fits into a 64 bit integer
+_MAX_INT64_PRECISION = 18
+
+
+def _get_description_type(dialect, column_description) -> sqltypes.TypeEngine | None:
+    """SQLAlchemy type of a result column described by the DBAPI cursor."""
+    type_code = column_description[1]
+    type_name = getattr(type_code, "value", type_code)
+    if not isinstance(type_name, str):
+        return None
+    type_class = dialect.ischema_names.get(type_name)
+    if type_class is None:
+        return None
+    if type_name == "DECIMAL":
+        return type_class(precision=column_description[4], scale=column_description[5])
+    return type_class()
+
+
+def _get_compiled_types(context, count: int) -> list[Any]:
+    """
+    Types of the result columns of the compiled statement, or None per column if
+    they don't correspond to the ``count`` columns of the cursor.
+    """
+    compiled = context.compiled
+    if compiled is not None and len(compiled._result_columns or ()) == count:
+        return [column[3] for column in compiled._result_columns]
+    return [None] * count
+
+
+def get_result_types(result: "CursorResult") -> list[sqltypes.TypeEngine]:
+    """
+    SQLAlchemy types of the columns of a result.
+
+    The types are taken from the cursor description. Where the database did not
+    report a known type, the type of the corresponding column of the compiled
+    statement is used, otherwise :class:`~sqlalchemy.types.NullType`.
+    """
+    context = result.context
+    description = result.cursor.description or []
+    compiled_types = _get_compiled_types(context, len(description))
+    return [
+        _get_description_type(context.dialect, column_description)
+        or compiled_type
+        or sqltypes.NULLTYPE
+        for column_description, compiled_type in zip(description, compiled_types)
+    ]
+
+
+def _is_int64(type_: sqltypes.TypeEngine) -> bool:
+    if isinstance(type_, sqltypes.Integer):
+        return True
+    return (
+        isinstance(type_, sqltypes.Numeric)
+        and not isinstance(type_, sqltypes.Float)
+        and type_.scale == 0
+        and type_.precision is not None
+        and type_.precision <= _MAX_INT64_PRECISION
+    )
+
+
+def _to_decimal(value):
+    if value is None or isinstance(value, decimal.Decimal):
+        return value
+    return decimal.Decimal(str(value))
+
+
+def _to_int(value):
+    if value is None or isinstance(value, int):
+        return value
+    return int(value)
+
+
+def _to_float(value):
+    if value is None or isinstance(value, float):
+        return value
+    return float(value)
+
+
+def _to_date(value):
+    if value is None or isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value)
+
+
+def _to_datetime(value):
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.fromisoformat(value)
+
+
+def _get_value_converter(type_: sqltypes.TypeEngine):
+    """Convert processed values into the Python type matching the column type."""
+    if _is_int64(type_):
+        return _to_int
+    if isinstance(type_, sqltypes.Float):
+        return _to_float
+    if isinstance(type_, sqltypes.Numeric):
+        return _to_decimal
+    if isinstance(type_, sqltypes.DateTime):
+        return _to_datetime
+    if isinstance(type_, sqltypes.Date):
+        return _to_date
+    return None
+
+
+def _get_batch_processor(processor):
+    """
+    Processor converting a whole column of a batch. Result processors may provide
+    a vectorized ``process_batch`` method, otherwise they are applied per value.
+    """
+    if processor is None:
+        return list
+    process_batch = getattr(processor, "process_batch", None)
+    if process_batch is not None:
+        return process_batch
+    return lambda values: [processor(value) for value in values]
+
+
+def _iter_raw_column_batches(result: "CursorResult", batch_size: int):
+    """
+    Fetch the rows of a result from its DBAPI cursor and convert them per column
+    with the result processors of the column types of the compiled statement,
+    like the rows of the result itself. The result is closed once all rows are
+    read.
+    """
+    context = result.context
+    cursor = result.cursor
+    description = cursor.description or []
+    processors = [
+        _get_batch_processor(
+            context.get_result_processor(
+                type_ or sqltypes.NULLTYPE, column_description[0], column_description[1]
+            )
+        )
+        for column_description, type_ in zip(
+            description, _get_compiled_types(context, len(description))
+        )
+    ]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            result.close()
+            return
+        yield [processor(values) for processor, values in zip(processors, zip(*rows))]
+
+
+def iter_column_batches(
+    result: "CursorResult", batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[dict[str, list[Any]]]:
+    """
+    Iterate over a result in batches of columns.
+
+    :param result: result of a statement which returns rows.
+    :param batch_size: maximum number of rows per batch.
+
+    :returns: an iterator of dictionaries mapping each column name to the list of
+              its values in the batch.
+    """
+    keys = list(result.keys())
+    for columns in _iter_raw_column_batches(result, batch_size):
+        yield dict(zip(keys, columns))
+
+
+def _get_arrow_type(pyarrow, type_: sqltypes.TypeEngine):
+    if _is_int64(type_):
+        return pyarrow.int64()
+    if isinstance(type_, sqltypes.Float):
+        return pyarrow.float64()
+    if isinstance(type_, sqltypes.Numeric):
+        if type_.precision is None:
+            return pyarrow.decimal128(36, type_.scale or 0)
+        return pyarrow.decimal128(type_.precision, type_.scale or 0)
+    if isinstance(type_, sqltypes.DateTime):
+        return pyarrow.timestamp("us")
+    if isinstance(type_, sqltypes.Date):
+        return pyarrow.date32()
+    if isinstance(type_, sqltypes.Boolean):
+        return pyarrow.bool_()
+    if isinstance(type_, sqltypes.String):
+        return pyarrow.string()
+    # let pyarrow infer the type
+    return None
+
+
+def _make_arrow_batch(pyarrow, keys, columns, arrow_types, converters):
+    arrays = [
+        pyarrow.array(
+            [converter(value) for value in values] if converter else values,
+            type=arrow_type,
+        )
+        for values, arrow_type, converter in zip(columns, arrow_types, converters)
+    ]
+    return pyarrow.RecordBatch.from_arrays(arrays, names=keys)
+
+
+def iter_arrow_batches(result: "CursorResult", batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Iterate over a result in Arrow record batches.
+
+    Requires ``pyarrow``.
+
+    :param result: result of a statement which returns rows.
+    :param batch_size: maximum number of rows per batch.
+
+    :returns: an iterator of :class:`pyarrow.RecordBatch` objects.
+    """
+    import pyarrow
+
+    keys = list(result.keys())
+    result_types = get_result_types(result)
+    arrow_types = [_get_arrow_type(pyarrow, type_) for type_ in result_types]
+    converters = [_get_value_converter(type_) for type_ in result_types]
+    for columns in _iter_raw_column_batches(result, batch_size):
+        yield _make_arrow_batch(pyarrow, keys, columns, arrow_types, converters)
+
+
+def iter_arrow_batches_from_rows(
+    rows: Iterable[tuple],
+    keys: list[str],
+    result_types: list[sqltypes.TypeEngine],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+):
+    """
+    Iterate over processed rows in Arrow record batches.
+
+    Requires ``pyarrow``.
+
+    :param rows: rows whose values already passed the result processors.
+    :param keys: names of the columns.
+    :param result_types: SQLAlchemy types of the columns.
+    :param batch_size: maximum number of rows per batch.
+
+    :returns: an iterator of :class:`pyarrow.RecordBatch` objects.
+    """
+    import pyarrow
+
+    arrow_types = [_get_arrow_type(pyarrow, type_) for type_ in result_types]
+    converters = [_get_value_converter(type_) for type_ in result_types]
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        columns = [list(values) for values in zip(*batch)]
+        yield _make_arrow_batch(pyarrow, keys, columns, arrow_types, converters)
+
+
+def _get_numpy_dtype(type_: sqltypes.TypeEngine) -> str:
+    if _is_int64(type_):
+        return "int64"
+    if isinstance(type_, sqltypes.Float):
+        return "float64"
+    if isinstance(type_, sqltypes.DateTime):
+        return "datetime64[us]"
+    if isinstance(type_, sqltypes.Date):
+        return "datetime64[D]"
+    if isinstance(type_, sqltypes.Boolean):
+        return "bool"
+    return "object"
+
+
+# dtypes which cannot represent NULL; such columns fall back to ``object``
+_NOT_NULLABLE_DTYPES = {"int64", "bool"}
+
+
+def iter_numpy_batches(result: "CursorResult", batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Iterate over a result in batches of NumPy arrays.
+
+    Requires ``numpy``. ``NULL`` values are represented as ``NaN`` in floating point
+    columns and as ``NaT`` in date and timestamp columns. Integer and boolean
+    columns containing ``NULL`` values are returned with dtype ``object``.
+
+    :param result: result of a statement which returns rows.
+    :param batch_size: maximum number of rows per batch.
+
+    :returns: an iterator of dictionaries mapping each column name to an array.
+    """
+    import numpy
+
+    keys = list(result.keys())
+    result_types = get_result_types(result)
+    dtypes = [_get_numpy_dtype(type_) for type_ in result_types]
+    converters = [_get_value_converter(type_) for type_ in result_types]
+    for columns in _iter_raw_column_batches(result, batch_size):
+        arrays = {}
+        for key, values, dtype, converter in zip(keys, columns, dtypes, converters):
+            if converter is not None:
+                values = [converter(value) for value in values]
+            if dtype in _NOT_NULLABLE_DTYPES and None in values:
+                dtype = "object"
+            elif dtype == "float64":
+                values = [numpy.nan if value is None else value for value in values]
+            arrays[key] = numpy.array(values, dtype=dtype)
+        yield arrays
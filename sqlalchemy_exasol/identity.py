@@ -0,0 +1,175 @@
+"""Allocation of ``IDENTITY`` primary key values in batches.
+
+After an ``INSERT`` without a value for the ``IDENTITY`` column, the dialect
+reads the generated value from ``SYS.EXA_ALL_COLUMNS``, as Exasol supports
+neither ``RETURNING`` nor a ``lastrowid``. An ORM flush of many new objects
+therefore runs one ``INSERT`` and one catalog query per object.
+
+:func:`enable_batched_identities` instead reserves a range of identity values for
+all new objects of a table with one catalog query and one ``ALTER TABLE``, assigns
+them to the objects before the flush, and lets the ORM insert all rows of a table
+with a single ``executemany``. It is enabled per mapped class:
+
+.. code-block:: python
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy_exasol.identity import enable_batched_identities
+
+    enable_batched_identities(User, Order, target=Session)
+
+    with Session(engine) as session:
+        session.add_all(User(name=name) for name in names)
+        session.commit()
+
+The range is reserved by moving the identity generator of the column behind it
+with ``ALTER TABLE ... MODIFY COLUMN ... IDENTITY``, a DDL statement which runs
+in the transaction of the session:
+
+* it locks the table until the session commits or rolls back, so other
+  transactions writing to the table, including other reservations, wait for it
+  or are aborted with a transaction collision, see :mod:`sqlalchemy_exasol.retry`.
+  Concurrent sessions therefore never receive the same values,
+* the reservation is only committed together with the inserted rows, a rollback
+  releases the values again,
+* keep such transactions short, and only enable batches for classes whose objects
+  are created in bulk.
+"""
+
+import weakref
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    event,
+)
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from sqlalchemy import (
+        Column,
+        Connection,
+        Table,
+    )
+    from sqlalchemy.orm import Mapper
+
+
+def _get_identity_column(table: "Table") -> "Column":
+    column = table.autoincrement_column
+    if column is None:
+        raise sa_exc.ArgumentError(
+            f"Table {table.fullname} has no autoincrement primary key column"
+        )
+    return column
+
+
+def reserve_identity_values(
+    connection: "Connection", table: "Table", count: int
+) -> range:
+    """
+    Reserve ``count`` consecutive values of the ``IDENTITY`` primary key column of
+    a table, which are not generated for other rows anymore.
+
+    The reservation is part of the transaction of the connection.
+
+    :returns: the reserved values.
+    """
+    column = _get_identity_column(table)
+    if count < 1:
+        raise sa_exc.ArgumentError("At least one value must be reserved")
+    dialect = connection.dialect
+    schema = table.schema
+    schema_translate_map = connection._execution_options.get("schema_translate_map")
+    if schema_translate_map:
+        schema = schema_translate_map.get(schema, schema)
+    if schema is None:
+        # tables of the same name in other schemas must not be matched, and the
+        # ALTER TABLE must change the table whose identity was read
+        current_schema = dialect._get_current_schema(connection)
+        if current_schema is None:
+            raise sa_exc.InvalidRequestError(
+                f"Table {table.fullname} has no schema and no schema is open"
+            )
+        schema = dialect.normalize_name(current_schema)
+
+    query, params = dialect._get_identity_query(
+        table.name, column.name, schema, "column_identity, column_type"
+    )
+    identity, column_type = connection.exec_driver_sql(query, tuple(params)).one()
+    if identity is None:
+        raise sa_exc.InvalidRequestError(
+            f"Column {column.name} of table {table.fullname} is no IDENTITY column"
+        )
+    first = int(identity) + 1
+
+    preparer = dialect.identifier_preparer
+    name = f"{preparer.quote_schema(schema)}.{preparer.quote(table.name)}"
+    # the identity number of MODIFY COLUMN is the next value to be generated
+    connection.exec_driver_sql(
+        f"ALTER TABLE {name} MODIFY COLUMN {preparer.quote(column.name)}"
+        f" {column_type} IDENTITY {first + count}"
+    )
+    return range(first, first + count)
+
+
+# mappers of the classes with batched identities
+_batched_mappers: "weakref.WeakSet[Mapper]" = weakref.WeakSet()
+
+
+def _is_batched(mapper) -> bool:
+    return any(m in _batched_mappers for m in mapper.iterate_to_root())
+
+
+def _assign_identities(session, flush_context, instances):
+    pending = defaultdict(list)
+    for instance in session.new:
+        state = inspect(instance)
+        mapper = state.mapper
+        if not _is_batched(mapper):
+            continue
+        for table in mapper.tables:
+            column = table.autoincrement_column
+            if column is None:
+                continue
+            key = mapper.get_property_by_column(column).key
+            if state.dict.get(key) is None:
+                pending[table].append((mapper, state, key))
+
+    for table, targets in pending.items():
+        connection = session.connection(bind_arguments={"mapper": targets[0][0]})
+        if connection.dialect.name != "exasol":
+            continue
+        values = reserve_identity_values(connection, table, len(targets))
+        for (_, state, key), value in zip(targets, values):
+            setattr(state.obj(), key, value)
+
+
+def enable_batched_identities(*classes, target=Session) -> None:
+    """
+    Assign values of ``IDENTITY`` primary key columns to all new objects of the
+    given mapped classes, and their subclasses, in batches before a session
+    flushes them.
+
+    :param classes: mapped classes whose identities are reserved in batches.
+    :param target: :class:`~sqlalchemy.orm.Session` class or subclass,
+                   :class:`~sqlalchemy.orm.sessionmaker` or session to enable the
+                   batches for.
+    """
+    if not classes:
+        raise sa_exc.ArgumentError("At least one mapped class is required")
+    for cls in classes:
+        _batched_mappers.add(inspect(cls))
+    if not event.contains(target, "before_flush", _assign_identities):
+        event.listen(target, "before_flush", _assign_identities)
+
+
+def disable_batched_identities(*classes, target=Session) -> None:
+    """
+    Revert :func:`enable_batched_identities` for the given classes, or for
+    ``target`` if no classes are given.
+    """
+    for cls in classes:
+        _batched_mappers.discard(inspect(cls))
+    if not classes and event.contains(target, "before_flush", _assign_identities):
+        event.remove(target, "before_flush", _assign_identities)
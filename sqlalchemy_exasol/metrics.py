@@ -0,0 +1,185 @@
+"""Opt-in metrics of the statements executed by the dialect.
+
+An engine created with ``metrics=True``, or with a shared :class:`MetricsRegistry`,
+records per statement how often it was executed and how much time was spent
+compiling it, executing it in ``do_execute``, fetching its rows from the driver,
+and converting them with the result processors of the column types:
+
+.. code-block:: python
+
+    engine = create_engine(url, metrics=True)
+    ...
+    for statement, values in engine.dialect.metrics.snapshot().items():
+        print(statement, values["execute_time"], values["rows"])
+
+Statements are keyed by their SQL string, which corresponds to one entry of the
+statement cache. The values of :meth:`MetricsRegistry.snapshot` are plain numbers,
+ready to be logged or exported, e.g. as Prometheus counters. Without metrics, the
+dialect only checks once per statement whether they are enabled.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+# names of the values recorded per statement, times are in seconds
+FIELDS = (
+    "executions",
+    "compilations",
+    "compile_time",
+    "execute_time",
+    "fetch_time",
+    "processing_time",
+    "rows",
+    "bytes",
+    "retries",
+)
+
+
+def estimate_row_size(row) -> int:
+    """Approximate size of a row in the JSON messages of the driver."""
+    size = 2
+    for value in row:
+        size += 5 if value is None else len(str(value)) + 3
+    return size
+
+
+class StatementMetrics:
+    """Values recorded for one statement."""
+
+    __slots__ = (*FIELDS, "_lock", "_local", "_processing_times")
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, 0)
+        self._lock = threading.Lock()
+        # processing times are summed up per thread, see add_processing_time
+        self._local = threading.local()
+        self._processing_times = []
+
+    def add(self, field: str, value: float) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + value)
+
+    def add_processing_time(self, seconds: float) -> None:
+        """
+        Add to ``processing_time`` without taking the lock, as result processors
+        are called for every value. Each thread sums up its own total.
+        """
+        try:
+            total = self._local.processing_time
+        except AttributeError:
+            total = self._local.processing_time = [0.0]
+            with self._lock:
+                self._processing_times.append(total)
+        total[0] += seconds
+
+    def as_dict(self) -> dict[str, float]:
+        with self._lock:
+            values = {field: getattr(self, field) for field in FIELDS}
+            values["processing_time"] += sum(
+                total[0] for total in self._processing_times
+            )
+            return values
+
+
+class MetricsRegistry:
+    """
+    Metrics of statements, keyed by their SQL string.
+
+    A registry can be shared by several engines, and is safe to use from
+    several threads.
+    """
+
+    def __init__(self):
+        self._statements: dict[str, StatementMetrics] = {}
+        self._lock = threading.Lock()
+
+    def statement(self, key: str) -> StatementMetrics:
+        """The metrics of a statement, created on first use."""
+        metrics = self._statements.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._statements.setdefault(key, StatementMetrics())
+        return metrics
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """The current values of all statements."""
+        with self._lock:
+            statements = list(self._statements.items())
+        return {key: metrics.as_dict() for key, metrics in statements}
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        with self._lock:
+            self._statements.clear()
+
+
+def measure_processor(
+    processor: Callable[[Any], Any], metrics: StatementMetrics
+) -> Callable[[Any], Any]:
+    """
+    Wrap a result processor to record its time as ``processing_time``. A
+    ``process_batch`` method of the processor is wrapped as well, and measured
+    once per batch.
+    """
+    add_processing_time = metrics.add_processing_time
+    perf_counter = time.perf_counter
+
+    def process(value):
+        start = perf_counter()
+        try:
+            return processor(value)
+        finally:
+            add_processing_time(perf_counter() - start)
+
+    process_batch = getattr(processor, "process_batch", None)
+    if process_batch is not None:
+
+        def measure_batch(values):
+            start = perf_counter()
+            try:
+                return process_batch(values)
+            finally:
+                add_processing_time(perf_counter() - start)
+
+        process.process_batch = measure_batch
+    return process
+
+
+class MeasuredCursor:
+    """DBAPI cursor which records the time, rows and bytes of its fetches."""
+
+    def __init__(self, cursor, metrics: StatementMetrics):
+        self._cursor = cursor
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def _fetch(self, fetch, *args):
+        start = time.perf_counter()
+        rows = fetch(*args)
+        self._metrics.add("fetch_time", time.perf_counter() - start)
+        return rows
+
+    def _count(self, rows):
+        self._metrics.add("rows", len(rows))
+        self._metrics.add("bytes", sum(estimate_row_size(row) for row in rows))
+        return rows
+
+    def fetchone(self):
+        row = self._fetch(self._cursor.fetchone)
+        if row is not None:
+            self._count([row])
+        return row
+
+    def fetchmany(self, *args):
+        return self._count(self._fetch(self._cursor.fetchmany, *args))
+
+    def fetchall(self):
+        return self._count(self._fetch(self._cursor.fetchall))
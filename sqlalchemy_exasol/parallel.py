@@ -0,0 +1,460 @@
+"""Parallel data transfer through the HTTP transport of pyexasol.
+
+Parallel EXPORT
+---------------
+
+:func:`export_parallel` splits the result of a single query across several worker
+processes. Each worker opens an HTTP transport sub-connection to one of the Exasol
+nodes and receives its partition of the ``EXPORT`` as CSV, bypassing the websocket
+connection completely:
+
+.. code-block:: python
+
+    from sqlalchemy_exasol.parallel import export_parallel
+
+    def count_rows(rows):
+        return sum(1 for _ in rows)
+
+    with engine.connect() as connection:
+        counts = export_parallel(connection, select(table), count_rows, workers=16)
+
+The consumer is called once per worker process with an iterator over the rows of
+its partition, or over Arrow record batches with ``output="arrow"``, and the
+values it returns are collected into a list. Consumers must be picklable, i.e.
+defined at module level. The partitions contain disjoint, arbitrarily ordered
+subsets of the result.
+
+Parallel IMPORT
+---------------
+
+:func:`bulk_load` is the counterpart for loading data. It streams partitions of
+rows through several worker processes into a table, using a single ``IMPORT``
+statement, which is part of the transaction of the connection:
+
+.. code-block:: python
+
+    from sqlalchemy_exasol.parallel import bulk_load
+
+    with engine.begin() as connection:
+        bulk_load(connection, table, partitions, workers=8)
+
+The values are converted with the bind processors of the column types. Partitions
+are sent to the worker processes, hence they must be picklable, e.g. lists or
+callables defined at module level which produce the rows in the worker.
+"""
+
+import csv
+import io
+import multiprocessing
+import os
+import queue
+import signal
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import pyexasol
+from pyexasol.callback import import_from_iterable
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.sql import sqltypes
+
+from sqlalchemy_exasol import (
+    columnar,
+    transport,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import (
+        Connection,
+        Table,
+    )
+    from sqlalchemy.sql.expression import Select
+
+OUTPUT_ROWS = "rows"
+OUTPUT_ARROW = "arrow"
+
+# seconds to wait for a worker to report the address of its HTTP transport
+_ADDRESS_POLL_INTERVAL = 0.1
+
+
+def _render_query(compiled) -> str:
+    """
+    Render the bind parameters of a compiled query as literals, as ``EXPORT``
+    accepts no bind parameters.
+    """
+    parameters = compiled.construct_params()
+    processors = dict(compiled._bind_processors)
+    statement, positiontup = compiled.string, compiled.positiontup
+    if compiled.literal_execute_params or compiled.post_compile_params:
+        expanded = compiled._process_parameters_for_postcompile(parameters)
+        statement, positiontup = expanded.statement, expanded.positiontup
+        parameters = expanded.parameters
+        processors.update(expanded.processors)
+    values = []
+    for name in positiontup or ():
+        value = parameters[name]
+        if name in processors:
+            value = processors[name](value)
+        values.append(value)
+    return transport.inline_parameters(statement, values)
+
+
+class _Partition:
+    """Reads the CSV partition of a worker and hands it to the consumer."""
+
+    def __init__(
+        self, dialect_cls, dialect_kwargs, keys, result_types, output, batch_size
+    ):
+        self.dialect_cls = dialect_cls
+        self.dialect_kwargs = dialect_kwargs
+        self.keys = keys
+        self.result_types = result_types
+        self.output = output
+        self.batch_size = batch_size
+
+    def _get_value_processors(self, dialect, count):
+        result_types = self.result_types
+        if result_types is None or len(result_types) != count:
+            result_types = [None] * count
+        processors = []
+        for type_ in result_types:
+            converter = transport._get_csv_converter(type_)
+            processor = (
+                type_.dialect_impl(dialect).result_processor(dialect, None)
+                if type_ is not None
+                else None
+            )
+            processors.append((converter, processor))
+        return processors
+
+    def _iter_rows(self, reader, processors) -> Iterator[tuple]:
+        for row in reader:
+            values = []
+            for value, (converter, processor) in zip(row, processors):
+                if value == "":
+                    value = None
+                elif converter is not None:
+                    value = converter(value)
+                if processor is not None:
+                    value = processor(value)
+                values.append(value)
+            yield tuple(values)
+
+    def __call__(self, pipe, dst, consumer):
+        reader = csv.reader(io.TextIOWrapper(pipe, encoding="utf-8", newline="\n"))
+        header = next(reader, None) or []
+        dialect = self.dialect_cls(**self.dialect_kwargs)
+        processors = self._get_value_processors(dialect, len(header))
+        rows = self._iter_rows(reader, processors)
+        if self.output == OUTPUT_ARROW:
+            keys = self.keys
+            if keys is None or len(keys) != len(header):
+                keys = [dialect.normalize_name(name) for name in header]
+            result_types = self.result_types
+            if result_types is None or len(result_types) != len(header):
+                result_types = [sqltypes.NULLTYPE] * len(header)
+            batches = columnar.iter_arrow_batches_from_rows(
+                rows, keys, result_types, self.batch_size
+            )
+            return consumer(batches)
+        return consumer(rows)
+
+
+def _run_worker(target, node, options, addresses, *args):
+    """
+    Body of a worker process: opens an HTTP transport sub-connection, reports its
+    address and process ID, and transfers the data of the worker with ``target``.
+    """
+    wrapper = pyexasol.http_transport(
+        node["ipaddr"],
+        node["port"],
+        compression=options["compression"],
+        encryption=options["encryption"],
+    )
+    addresses.put((node["idx"], wrapper.exa_address, os.getpid()))
+    return target(wrapper, *args)
+
+
+def _collect_addresses(addresses, results, count: int, pids: list[int]) -> list[str]:
+    """
+    Wait for the addresses of ``count`` workers, and record the process IDs of
+    the workers which reported theirs in ``pids``.
+    """
+    collected = []
+    while len(collected) < count:
+        try:
+            collected.append(addresses.get(timeout=_ADDRESS_POLL_INTERVAL))
+            pids.append(collected[-1][2])
+        except queue.Empty:
+            for result in results:
+                # re-raises the exception of a worker which failed early
+                if result.done() and result.exception() is not None:
+                    raise result.exception()
+    return [address for _, address, _ in sorted(collected)]
+
+
+def _terminate_workers(executor, pids: list[int]) -> None:
+    """
+    Stop the workers after the statement failed. They wait for Exasol to connect
+    to their HTTP transport, which it won't do anymore, so shutting the pool down
+    alone would wait forever.
+    """
+    executor.shutdown(wait=False, cancel_futures=True)
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _run_parallel(
+    pyexasol_connection, target, worker_args, run_statement, mp_context=None
+) -> list[Any]:
+    """
+    Run ``target`` in one worker process per element of ``worker_args``, and the
+    ``IMPORT`` or ``EXPORT`` statement connecting to the workers in this process.
+
+    If the statement fails, the workers are terminated and its error is raised.
+
+    :returns: the values returned by ``target`` in the workers.
+    """
+    nodes = pyexasol_connection.get_nodes(len(worker_args))
+    options = {
+        "compression": pyexasol_connection.options["compression"],
+        "encryption": pyexasol_connection.options["encryption"],
+    }
+    mp_context = mp_context or multiprocessing.get_context()
+    with (
+        mp_context.Manager() as manager,
+        ProcessPoolExecutor(len(nodes), mp_context=mp_context) as executor,
+    ):
+        addresses = manager.Queue()
+        results = [
+            executor.submit(_run_worker, target, node, options, addresses, *args)
+            for node, args in zip(nodes, worker_args)
+        ]
+        pids = []
+        try:
+            run_statement(_collect_addresses(addresses, results, len(nodes), pids))
+        except BaseException:
+            _terminate_workers(executor, pids)
+            raise
+        return [result.result() for result in results]
+
+
+def _check_http_transport(dialect, operation: str) -> None:
+    if not dialect.supports_http_transport:
+        raise sa_exc.InvalidRequestError(
+            f"{operation} is not supported by the {dialect.name}+{dialect.driver}"
+            " dialect"
+        )
+
+
+def _export_partition(wrapper, partition, consumer):
+    return wrapper.export_to_callback(
+        partition, None, callback_params={"consumer": consumer}
+    )
+
+
+def export_parallel(
+    connection: "Connection",
+    query: "Select",
+    consumer: Callable[[Iterator], Any],
+    workers: int,
+    output: str = OUTPUT_ROWS,
+    batch_size: int = columnar.DEFAULT_BATCH_SIZE,
+    mp_context=None,
+) -> list[Any]:
+    """
+    Export the result of a query in parallel through several worker processes.
+
+    :param connection: connection of the ``exa+websocket`` dialect which runs the
+                       ``EXPORT`` statement.
+    :param query: query to export, compiled with the dialect of the connection.
+    :param consumer: picklable callable which is called in each worker process with
+                     an iterator over the partition of the worker.
+    :param workers: number of worker processes and HTTP transport sub-connections.
+    :param output: ``"rows"`` to pass an iterator of tuples to the consumer,
+                   ``"arrow"`` for an iterator of :class:`pyarrow.RecordBatch`
+                   objects of at most ``batch_size`` rows.
+    :param batch_size: maximum number of rows per Arrow record batch.
+    :param mp_context: :mod:`multiprocessing` context used to start the workers.
+
+    :returns: the values returned by the consumer, one per worker.
+    """
+    dialect = connection.dialect
+    _check_http_transport(dialect, "Parallel export")
+    if output not in (OUTPUT_ROWS, OUTPUT_ARROW):
+        raise sa_exc.ArgumentError(f"Unknown output {output!r}")
+    if workers < 1:
+        raise sa_exc.ArgumentError("At least one worker is required")
+
+    compiled = query.compile(
+        dialect=dialect,
+        schema_translate_map=connection._execution_options.get("schema_translate_map"),
+    )
+    keys, result_types = None, None
+    if compiled._result_columns:
+        keys = [column[0] for column in compiled._result_columns]
+        result_types = [column[3] for column in compiled._result_columns]
+    sql = _render_query(compiled)
+    partition = _Partition(
+        type(dialect),
+        {"fast_decimals": dialect.fast_decimals},
+        keys,
+        result_types,
+        output,
+        batch_size,
+    )
+
+    pyexasol_connection = dialect._get_pyexasol_connection(
+        connection.connection.dbapi_connection
+    )
+
+    def run_export(exa_addresses):
+        pyexasol_connection.export_parallel(
+            exa_addresses, sql, export_params={"with_column_names": True}
+        )
+
+    return _run_parallel(
+        pyexasol_connection,
+        _export_partition,
+        [(partition, consumer)] * workers,
+        run_export,
+        mp_context,
+    )
+
+
+class _PartitionRows:
+    """Converts the rows of partitions into CSV rows of the imported columns."""
+
+    def __init__(self, dialect_cls, dialect_kwargs, keys, types):
+        self.dialect_cls = dialect_cls
+        self.dialect_kwargs = dialect_kwargs
+        self.keys = keys
+        self.types = types
+        self.rowcount = 0
+
+    def _get_bind_processors(self):
+        dialect = self.dialect_cls(**self.dialect_kwargs)
+        return [
+            type_.dialect_impl(dialect).bind_processor(dialect) for type_ in self.types
+        ]
+
+    def __call__(self, partitions) -> Iterator[list]:
+        processors = self._get_bind_processors()
+        keys = self.keys
+        for partition in partitions:
+            if callable(partition):
+                partition = partition()
+            for row in partition:
+                if isinstance(row, Mapping):
+                    try:
+                        row = [row[key] for key in keys]
+                    except KeyError as ex:
+                        raise sa_exc.ArgumentError(
+                            f"A value is required for column {ex.args[0]!r}"
+                        ) from None
+                elif len(row) != len(keys):
+                    raise ValueError(
+                        f"Expected {len(keys)} values per row, got {len(row)}"
+                    )
+                yield [
+                    transport._to_csv_value(
+                        processor(value) if processor is not None else value
+                    )
+                    for value, processor in zip(row, processors)
+                ]
+                self.rowcount += 1
+
+
+def _import_partitions(wrapper, rows, partitions):
+    wrapper.import_from_callback(import_from_iterable, rows(partitions))
+    return rows.rowcount
+
+
+def bulk_load(
+    connection: "Connection",
+    table: "Table",
+    partitions: Sequence[Iterable | Callable[[], Iterable]],
+    workers: int | None = None,
+    columns: Sequence[str] | None = None,
+    mp_context=None,
+) -> int:
+    """
+    Import partitions of rows into a table in parallel through several worker
+    processes, using a single ``IMPORT`` statement.
+
+    The rows become visible when the transaction of the connection is committed.
+
+    :param connection: connection of the ``exa+websocket`` dialect which runs the
+                       ``IMPORT`` statement.
+    :param table: table to import into.
+    :param partitions: picklable iterables of rows, or picklable callables
+                       returning them in the worker process. Rows are mappings
+                       with a value for every column key or sequences of values
+                       in column order.
+    :param workers: number of worker processes and HTTP transport
+                    sub-connections, by default one per partition. Partitions
+                    are distributed round robin over the workers.
+    :param columns: keys of the imported columns, by default all columns of the
+                    table.
+    :param mp_context: :mod:`multiprocessing` context used to start the workers.
+
+    :returns: the number of imported rows.
+    """
+    dialect = connection.dialect
+    _check_http_transport(dialect, "Parallel import")
+    if not partitions:
+        return 0
+    workers = min(workers or len(partitions), len(partitions))
+    if workers < 1:
+        raise sa_exc.ArgumentError("At least one worker is required")
+
+    table_columns = (
+        list(table.columns) if columns is None else [table.c[key] for key in columns]
+    )
+    bulk_import = transport.get_table_import(
+        dialect,
+        table,
+        table_columns,
+        connection._execution_options.get("schema_translate_map"),
+    )
+    if bulk_import is None:
+        raise sa_exc.ArgumentError(
+            f"Parallel import into {table.fullname} is not supported, as it has"
+            " identifiers which require quotes"
+        )
+    rows = _PartitionRows(
+        type(dialect),
+        {"fast_decimals": dialect.fast_decimals},
+        [column.key for column in table_columns],
+        [column.type for column in table_columns],
+    )
+    pyexasol_connection = dialect._get_pyexasol_connection(
+        connection.connection.dbapi_connection
+    )
+
+    def run_import(exa_addresses):
+        pyexasol_connection.import_parallel(
+            exa_addresses, bulk_import.target, import_params=bulk_import.import_params
+        )
+
+    rowcounts = _run_parallel(
+        pyexasol_connection,
+        _import_partitions,
+        [(rows, partitions[index::workers]) for index in range(workers)],
+        run_import,
+        mp_context,
+    )
+    rowcount = pyexasol_connection.last_statement().rowcount()
+    return rowcount if rowcount is not None else sum(rowcounts)
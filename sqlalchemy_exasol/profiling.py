@@ -0,0 +1,122 @@
+"""Server-side profiles of single statements.
+
+Exasol records a profile of every statement which runs while the session parameter
+``PROFILE`` is switched on. Executing a statement with the ``exasol_profile``
+execution option switches profiling on for this statement only, and attaches its
+profile to the execution context of the result:
+
+.. code-block:: python
+
+    result = connection.execute(
+        select(table).execution_options(exasol_profile=True)
+    )
+    for part in result.context.exasol_profile:
+        print(part.part_name, part.object_name, part.duration, part.out_rows)
+
+The option can also be set for a connection or an engine. The profile is
+available to the ``after_cursor_execute`` event as well, so profiles can be
+collected by an event listener:
+
+.. code-block:: python
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_profile(conn, cursor, statement, parameters, context, executemany):
+        if context.exasol_profile:
+            logger.info("%s: %s", statement, context.exasol_profile)
+
+Capturing the profile takes five additional round trips per statement, hence it
+is meant for analyzing selected statements, not for every statement.
+"""
+
+from collections import namedtuple
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from contextlib import (
+    closing,
+    contextmanager,
+)
+from typing import Any
+
+# execution option capturing the profile of a statement
+PROFILE_OPTION = "exasol_profile"
+
+ProfilePart = namedtuple(
+    "ProfilePart",
+    [
+        "stmt_id",
+        "command_name",
+        "part_id",
+        "part_name",
+        "part_info",
+        "object_schema",
+        "object_name",
+        "object_rows",
+        "out_rows",
+        "duration",
+        "cpu",
+        "temp_db_ram_peak",
+        "percentage_in_memory",
+        "hdd_read",
+        "hdd_write",
+        "net",
+        "remarks",
+    ],
+)
+
+
+def _profile_query(fields: tuple[str, ...]) -> str:
+    # The session parameter is switched on and off by ALTER SESSION statements,
+    # which are profiled themselves.
+    return (
+        f"SELECT {', '.join(fields)}"
+        " FROM EXA_STATISTICS.EXA_USER_PROFILE_LAST_DAY"
+        " WHERE session_id = CURRENT_SESSION"
+        " AND stmt_id > ?"
+        " AND command_name <> 'ALTER SESSION'"
+        " ORDER BY stmt_id, part_id"
+    )
+
+
+_PROFILE_QUERY = _profile_query(ProfilePart._fields)
+# for databases whose profiles have no in-memory share, it is reported as None
+_FIELDS_WITHOUT_IN_MEMORY = tuple(
+    field for field in ProfilePart._fields if field != "percentage_in_memory"
+)
+_PROFILE_QUERY_WITHOUT_IN_MEMORY = _profile_query(_FIELDS_WITHOUT_IN_MEMORY)
+
+
+@contextmanager
+def capture_profile(cursor_factory: Callable[[], Any]) -> Iterator[list[ProfilePart]]:
+    """
+    Profile the statements executed on a DBAPI connection within the block.
+
+    :param cursor_factory: creates a DBAPI cursor of the connection.
+
+    :returns: a list, which is filled with the parts of the profiles once the
+              block finished successfully.
+    """
+    profile: list[ProfilePart] = []
+    with closing(cursor_factory()) as cursor:
+        cursor.execute("SELECT CURRENT_STATEMENT")
+        (last_statement,) = cursor.fetchone()
+        cursor.execute("ALTER SESSION SET PROFILE = 'ON'")
+        try:
+            yield profile
+        finally:
+            cursor.execute("ALTER SESSION SET PROFILE = 'OFF'")
+        cursor.execute("FLUSH STATISTICS")
+        try:
+            cursor.execute(_PROFILE_QUERY, [int(last_statement)])
+        except Exception:
+            cursor.execute(_PROFILE_QUERY_WITHOUT_IN_MEMORY, [int(last_statement)])
+            profile.extend(
+                ProfilePart(
+                    percentage_in_memory=None,
+                    **dict(zip(_FIELDS_WITHOUT_IN_MEMORY, row)),
+                )
+                for row in cursor.fetchall()
+            )
+        else:
+            profile.extend(ProfilePart(*row) for row in cursor.fetchall())
@@ -0,0 +1,148 @@
+"""Persistent reflection cache shared across processes.
+
+The ``@reflection.cache`` decorators and the
+:class:`~sqlalchemy_exasol.catalog.CatalogSnapshot` only live as long as one
+:class:`~sqlalchemy.engine.Inspector`. Services which reflect the same schemas
+on every start can opt into a :class:`ReflectionCache`, which stores the catalog
+data of each schema in a local SQLite database:
+
+.. code-block:: python
+
+    engine = create_engine(url, reflection_cache="/var/cache/app/exasol.sqlite")
+
+Before cached data is used, a single query against ``SYS.EXA_ALL_OBJECTS``
+computes a fingerprint of the schema (number of objects, latest ``CREATED`` and
+latest ``LAST_COMMIT`` timestamp). Only if the fingerprint differs from the
+stored one, the catalog is read again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from sqlalchemy import sql
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+
+    from sqlalchemy_exasol.catalog import CatalogSnapshot
+
+# Increase whenever the layout of the stored snapshot data changes
+_FORMAT_VERSION = 1
+
+
+class ReflectionCache:
+    """
+    Catalog snapshots of Exasol schemas, persisted in a SQLite database.
+
+    Entries are keyed by the database (user, host and port of the engine URL) and
+    the schema name.
+
+    Attributes:
+        path: location of the SQLite database file.
+        hits: number of snapshots restored from the cache.
+        misses: number of snapshots which had to be read from the catalog.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = os.fspath(path)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS reflection_cache ("
+                "database TEXT NOT NULL, "
+                "schema TEXT NOT NULL, "
+                "fingerprint TEXT NOT NULL, "
+                "data TEXT NOT NULL, "
+                "PRIMARY KEY (database, schema))"
+            )
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} path={self.path!r} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _database_key(connection: "Connection") -> str:
+        url = connection.engine.url
+        return f"{url.username}@{url.host}:{url.port}"
+
+    @staticmethod
+    def _schema_key(connection: "Connection", snapshot: "CatalogSnapshot") -> str:
+        if snapshot.schema is not None:
+            return snapshot.schema
+        return snapshot.dialect._get_current_schema(connection)
+
+    @staticmethod
+    def _fingerprint(connection: "Connection", snapshot: "CatalogSnapshot") -> str:
+        dialect = snapshot.dialect
+        sql_statement = dialect.get_schema_fingerprint_sql_query_str(
+            schema=dialect._get_schema_replacement_string(schema_name=snapshot.schema)
+        )
+        row = connection.execute(
+            sql.text(sql_statement), {"schema": snapshot.schema}
+        ).fetchone()
+        return json.dumps([_FORMAT_VERSION, *row], default=str)
+
+    def _load(self, database: str, schema: str, fingerprint: str) -> Any | None:
+        with self._lock, closing(self._connect()) as db:
+            row = db.execute(
+                "SELECT fingerprint, data FROM reflection_cache "
+                "WHERE database = ? AND schema = ?",
+                (database, schema),
+            ).fetchone()
+        if row is None or row[0] != fingerprint:
+            return None
+        return json.loads(row[1])
+
+    def _store(self, database: str, schema: str, fingerprint: str, data: Any) -> None:
+        serialized = json.dumps(data, default=str)
+        with self._lock, closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT OR REPLACE INTO reflection_cache "
+                "(database, schema, fingerprint, data) VALUES (?, ?, ?, ?)",
+                (database, schema, fingerprint, serialized),
+            )
+
+    def restore(self, connection: "Connection", snapshot: "CatalogSnapshot") -> None:
+        """
+        Fill a snapshot from the cache or, if the schema changed, from the catalog.
+
+        A snapshot read from the catalog is stored for subsequent inspections.
+        """
+        database = self._database_key(connection)
+        schema = self._schema_key(connection, snapshot)
+        fingerprint = self._fingerprint(connection, snapshot)
+        state = self._load(database, schema, fingerprint)
+        if state is not None:
+            self.hits += 1
+            snapshot.load_state(state)
+            return
+        self.misses += 1
+        snapshot.load_all(connection)
+        self._store(database, schema, fingerprint, snapshot.dump_state())
+
+    def invalidate(self, schema: str | None = None) -> None:
+        """
+        Drop cached catalog data, so it is read again on next reflection.
+
+        :param schema: denormalized name of the schema to drop, e.g. ``"MY_SCHEMA"``.
+                       If omitted, the whole cache is cleared.
+        """
+        with self._lock, closing(self._connect()) as db, db:
+            if schema is None:
+                db.execute("DELETE FROM reflection_cache")
+            else:
+                db.execute("DELETE FROM reflection_cache WHERE schema = ?", (schema,))
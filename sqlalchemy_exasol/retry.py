@@ -0,0 +1,172 @@
+"""Retries of transactions aborted by transaction collisions.
+
+When concurrent transactions conflict, Exasol aborts one of them with a
+``GlobalTransactionRollback`` error of SQL state ``40001`` and rolls it back
+completely. Running the transaction again usually succeeds.
+:func:`is_retryable_error` recognizes these errors, also when they are wrapped
+by the driver and SQLAlchemy, and a :class:`RetryPolicy` runs a transaction
+again after a jittered exponential backoff:
+
+.. code-block:: python
+
+    policy = RetryPolicy(max_attempts=5)
+
+    def transfer(connection):
+        connection.execute(update(accounts)...)
+        connection.execute(insert(transfers)...)
+
+    policy.run(engine, transfer)
+
+As the whole transaction is rolled back, retrying only the failed statement
+would silently lose the statements executed before it. The execution option
+``exasol_retry`` therefore retries a single statement only if nothing else ran
+in its transaction before, or the driver commits every statement on its own:
+
+.. code-block:: python
+
+    connection.execute(
+        insert(events).values(...), execution_options={"exasol_retry": True}
+    )
+
+Its value is ``True`` for the default policy, or a :class:`RetryPolicy`. With
+metrics enabled, the retries are counted as ``retries`` of the failed statement.
+The ``exa+websocket_async`` dialect awaits the backoff, so it doesn't block the
+event loop.
+"""
+
+import logging
+import random
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger("sqlalchemy_exasol")
+
+# execution option retrying a statement after a transaction collision
+RETRY_OPTION = "exasol_retry"
+
+# SQL states of errors after which the transaction can be run again
+RETRYABLE_SQL_STATES = frozenset({"40001"})
+
+_RETRYABLE_MESSAGE = re.compile(
+    r"GlobalTransactionRollback|transaction collision", re.IGNORECASE
+)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Whether ``error`` aborted a transaction which can be run again.
+
+    The exceptions the error was raised from are checked as well, as the driver
+    and SQLAlchemy wrap the errors of pyexasol.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if getattr(error, "code", None) in RETRYABLE_SQL_STATES:
+            return True
+        message = getattr(error, "message", None)
+        if isinstance(message, str) and _RETRYABLE_MESSAGE.search(message):
+            return True
+        error = getattr(error, "orig", None) or error.__cause__ or error.__context__
+    return False
+
+
+class RetryPolicy:
+    """
+    Run a transaction again after a retryable error, with exponential backoff.
+
+    :param max_attempts: number of attempts, including the first one.
+    :param initial_backoff: upper bound of the seconds to wait before the first
+                            retry.
+    :param max_backoff: upper bound of the seconds to wait before any retry.
+    :param multiplier: factor by which the bound grows with every retry.
+
+    The backoff is drawn uniformly between zero and the bound ("full jitter"),
+    so colliding transactions don't collide again at the same time.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        initial_backoff: float = 0.05,
+        max_backoff: float = 2.0,
+        multiplier: float = 2.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} max_attempts={self.max_attempts} "
+            f"initial_backoff={self.initial_backoff} max_backoff={self.max_backoff}>"
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before the ``retry``-th retry, starting at 1."""
+        bound = min(
+            self.max_backoff, self.initial_backoff * self.multiplier ** (retry - 1)
+        )
+        return random.uniform(0, bound)
+
+    def call(
+        self,
+        function: Callable[[], Any],
+        on_retry: Callable[[Exception], None] | None = None,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> Any:
+        """
+        Call ``function`` until it succeeds, raises an error which is not
+        retryable, or ``max_attempts`` are used up.
+
+        :param on_retry: called with each retryable error before the backoff.
+        :param sleep: called with the seconds of each backoff.
+        """
+        for retry in range(1, self.max_attempts):
+            try:
+                return function()
+            except Exception as e:
+                if not is_retryable_error(e):
+                    raise
+                if on_retry is not None:
+                    on_retry(e)
+                backoff = self.backoff(retry)
+                logger.info(
+                    "Retrying after a transaction collision in %.3fs (%d/%d): %s",
+                    backoff,
+                    retry,
+                    self.max_attempts - 1,
+                    e,
+                )
+                sleep(backoff)
+        return function()
+
+    def run(self, engine, work: Callable[[Any], Any]) -> Any:
+        """
+        Call ``work`` with a connection of ``engine`` in a transaction, which is
+        run again as a whole after a retryable error.
+        """
+
+        def transaction():
+            with engine.begin() as connection:
+                return work(connection)
+
+        metrics = engine.dialect.metrics
+        if metrics is None:
+            return self.call(transaction)
+
+        def count_retry(error):
+            statement = getattr(error, "statement", None)
+            if statement is not None:
+                metrics.statement(statement).add("retries", 1)
+
+        return self.call(transaction, count_retry)
+
+
+# policy of the execution option exasol_retry=True
+DEFAULT_RETRY_POLICY = RetryPolicy()
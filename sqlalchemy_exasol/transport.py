@@ -0,0 +1,477 @@
+"""Bulk data transfer through the pyexasol HTTP transport.
+
+Bulk INSERTs
+------------
+
+``executemany`` on the websocket DBAPI sends all parameters as JSON through the
+websocket connection, which limits large INSERTs to a few thousand rows per
+second. Above a configurable number of rows, :class:`~sqlalchemy_exasol.base.EXADialect`
+instead streams the rows as CSV through ``IMPORT FROM LOCAL CSV``:
+
+.. code-block:: python
+
+    engine = create_engine(url, bulk_import_threshold=10_000)
+
+    with engine.begin() as connection:
+        connection.execute(insert(table), rows)
+
+The threshold can also be set or disabled (``None``) per statement with the
+``exasol_bulk_import_threshold`` execution option. Only plain
+``INSERT INTO table (columns) VALUES (?, ...)`` statements qualify; all other
+statements and tables with identifiers requiring quotes keep using
+``executemany``.
+
+Streaming SELECTs
+-----------------
+
+Results of a ``SELECT`` executed with the ``exasol_export_stream`` execution option
+are transferred as CSV through ``EXPORT ... INTO LOCAL CSV`` instead of being
+fetched in JSON chunks through the websocket connection:
+
+.. code-block:: python
+
+    with engine.connect() as connection:
+        result = connection.execution_options(
+            exasol_export_stream=True, exasol_export_chunk_size=50_000
+        ).execute(select(table))
+        for row in result:
+            ...
+
+At most two chunks of ``exasol_export_chunk_size`` rows are buffered, the export
+waits until the result is consumed. Until then, the connection must not be used
+for other statements, which is why the option can't be combined with
+``exasol_profile``.
+"""
+
+import collections
+import csv
+import datetime
+import decimal
+import io
+import queue
+import re
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from sqlalchemy.sql import sqltypes
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.default import DefaultExecutionContext
+
+BULK_IMPORT_THRESHOLD_OPTION = "exasol_bulk_import_threshold"
+EXPORT_STREAM_OPTION = "exasol_export_stream"
+EXPORT_CHUNK_SIZE_OPTION = "exasol_export_chunk_size"
+
+DEFAULT_EXPORT_CHUNK_SIZE = 10_000
+
+TIMESTAMP_FORMAT = "YYYY-MM-DD HH24:MI:SS.FF6"
+DATE_FORMAT = "YYYY-MM-DD"
+
+# identifiers pyexasol accepts without quoting, see ExaFormatter.safe_ident
+_SAFE_IDENTIFIER = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+
+# attribute caching the import target on the (cached) compiled statement
+_COMPILED_ATTRIBUTE = "_exasol_bulk_import"
+
+
+class BulkImport:
+    """
+    Target of the ``IMPORT`` replacing the ``executemany`` of a compiled INSERT.
+
+    Attributes:
+        table: denormalized schema and table name, the schema may be ``None``.
+        columns: denormalized names of the inserted columns in parameter order.
+        csv_cols: column formats for the ``IMPORT`` statement.
+    """
+
+    def __init__(
+        self,
+        table: tuple[str | None, str],
+        columns: list[str],
+        csv_cols: list[str],
+    ):
+        self.table = table
+        self.columns = columns
+        self.csv_cols = csv_cols
+
+    @property
+    def import_params(self) -> dict[str, Any]:
+        params: dict[str, Any] = {"columns": self.columns}
+        if self.csv_cols:
+            params["csv_cols"] = self.csv_cols
+        return params
+
+    @property
+    def target(self) -> str | tuple[str, str]:
+        schema, table = self.table
+        if schema is None:
+            return table
+        return schema, table
+
+
+def _csv_format(type_: sqltypes.TypeEngine) -> str | None:
+    affinity = type_._type_affinity
+    if affinity is sqltypes.DateTime:
+        return TIMESTAMP_FORMAT
+    if affinity is sqltypes.Date:
+        return DATE_FORMAT
+    return None
+
+
+def _get_bulk_import(context: "DefaultExecutionContext") -> BulkImport | None:
+    compiled = context.compiled
+    statement = compiled.statement
+    if (
+        statement.select is not None
+        or statement._post_values_clause is not None
+        or compiled.effective_returning
+        or not compiled.positiontup
+    ):
+        return None
+
+    # all values must be plain parameters, not SQL expressions or defaults
+    placeholders = ", ".join(["?"] * len(compiled.positiontup))
+    if not compiled.string.endswith(f" VALUES ({placeholders})"):
+        return None
+
+    table = statement.table
+    columns = []
+    for name in compiled.positiontup:
+        column = table.c.get(name)
+        if column is None:
+            return None
+        columns.append(column)
+    return get_table_import(
+        context.dialect,
+        table,
+        columns,
+        context.execution_options.get("schema_translate_map"),
+    )
+
+
+def get_table_import(
+    dialect, table, columns, schema_translate_map=None
+) -> BulkImport | None:
+    """
+    The ``IMPORT`` target for the given columns of a table.
+
+    :returns: the :class:`BulkImport` or ``None`` if one of the identifiers
+              requires quotes, which pyexasol does not support.
+    """
+    names, formats = [], []
+    for column in columns:
+        names.append(dialect.denormalize_name(column.name))
+        formats.append(_csv_format(column.type))
+    # as soon as one column has a format, all columns need to be listed
+    csv_cols = []
+    if any(formats):
+        csv_cols = [
+            f"{position} FORMAT='{csv_format}'" if csv_format else str(position)
+            for position, csv_format in enumerate(formats, start=1)
+        ]
+
+    schema = table.schema
+    if schema_translate_map and schema in schema_translate_map:
+        schema = schema_translate_map[schema]
+    identifiers = (
+        dialect.denormalize_name(schema) if schema is not None else None,
+        dialect.denormalize_name(table.name),
+    )
+    if not all(
+        _SAFE_IDENTIFIER.match(identifier)
+        for identifier in (*identifiers, *names)
+        if identifier is not None
+    ):
+        return None
+    return BulkImport(identifiers, names, csv_cols)
+
+
+def get_bulk_import(
+    context: "DefaultExecutionContext", parameters: list[Any]
+) -> BulkImport | None:
+    """
+    The ``IMPORT`` target for an ``executemany``, if it should be used instead.
+
+    :param context: execution context of the statement.
+    :param parameters: positional parameter sets passed to ``executemany``.
+
+    :returns: the :class:`BulkImport` or ``None`` if the statement is not a plain
+              INSERT or has fewer parameter sets than the configured threshold.
+    """
+    if not context.dialect.supports_http_transport:
+        return None
+    threshold = context.execution_options.get(
+        BULK_IMPORT_THRESHOLD_OPTION, context.dialect.bulk_import_threshold
+    )
+    if threshold is None or len(parameters) < threshold:
+        return None
+    if context.compiled is None or not context.isinsert:
+        return None
+    if context.execution_options.get("schema_translate_map"):
+        # depends on the execution options, cannot be cached on the statement
+        return _get_bulk_import(context)
+    compiled = context.compiled
+    if not hasattr(compiled, _COMPILED_ATTRIBUTE):
+        setattr(compiled, _COMPILED_ATTRIBUTE, _get_bulk_import(context))
+    return getattr(compiled, _COMPILED_ATTRIBUTE)
+
+
+def _to_csv_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _to_csv_rows(parameters: list[Any]):
+    for row in parameters:
+        yield [_to_csv_value(value) for value in row]
+
+
+def import_rows(pyexasol_connection, bulk_import: BulkImport, parameters) -> int:
+    """
+    Stream already bind-processed parameter sets into a table via ``IMPORT``.
+
+    :returns: the number of imported rows.
+    """
+    pyexasol_connection.import_from_iterable(
+        _to_csv_rows(parameters),
+        bulk_import.target,
+        import_params=bulk_import.import_params,
+    )
+    rowcount = pyexasol_connection.last_statement().rowcount()
+    return rowcount if rowcount is not None else len(parameters)
+
+
+# string literals, quoted identifiers, comments and qmark parameters
+_SQL_TOKENS = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/|\?""", re.DOTALL
+)
+
+
+def _to_sql_literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, decimal.Decimal):
+        return format(value, "f")
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, datetime.datetime):
+        return f"TIMESTAMP '{value.strftime('%Y-%m-%d %H:%M:%S.%f')}'"
+    if isinstance(value, datetime.date):
+        return f"DATE '{value.isoformat()}'"
+    from pyexasol import ExaFormatter
+
+    return ExaFormatter.quote(str(value))
+
+
+_END = object()
+
+
+def inline_parameters(statement: str, parameters) -> str:
+    """
+    Replace the qmark parameters of a statement with SQL literals.
+
+    ``EXPORT`` accepts no bind parameters, hence the values are rendered into
+    the exported query.
+    """
+    if not parameters:
+        return statement
+    values = iter(parameters)
+
+    def replace(match):
+        token = match.group(0)
+        if token != "?":
+            return token
+        try:
+            return _to_sql_literal(next(values))
+        except StopIteration:
+            raise ValueError("Statement has more placeholders than parameters")
+
+    statement = _SQL_TOKENS.sub(replace, statement)
+    if next(values, _END) is not _END:
+        raise ValueError("Statement has fewer placeholders than parameters")
+    return statement
+
+
+def _to_bool(value: str) -> bool:
+    return value.upper() in ("1", "TRUE", "T", "Y", "YES")
+
+
+# CSV values are strings. Convert them into the values the websocket driver
+# returns, so the result processors of the column types work unchanged.
+_CSV_CONVERTERS = {
+    sqltypes.Integer: int,
+    sqltypes.Float: float,
+    sqltypes.Boolean: _to_bool,
+    sqltypes.Date: datetime.date.fromisoformat,
+}
+
+
+def _get_csv_converter(type_: sqltypes.TypeEngine | None):
+    if type_ is None:
+        return None
+    affinity = type_._type_affinity
+    for type_class, converter in _CSV_CONVERTERS.items():
+        if affinity is not None and issubclass(affinity, type_class):
+            return converter
+    return None
+
+
+class _ExportCancelled(Exception):
+    """Raised inside the export callback when the cursor is closed early."""
+
+
+class ExportCursor:
+    """
+    DBAPI cursor reading the result of a query from an ``EXPORT`` CSV stream.
+
+    The export runs in a background thread, which hands over chunks of rows
+    through a bounded queue.
+    """
+
+    arraysize = 1
+
+    def __init__(
+        self,
+        dbapi,
+        pyexasol_connection,
+        chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+        result_types: list[sqltypes.TypeEngine] | None = None,
+    ):
+        self._dbapi = dbapi
+        self._connection = pyexasol_connection
+        self._chunk_size = chunk_size
+        self._result_types = result_types
+        self._queue: queue.Queue = queue.Queue(maxsize=2)
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._rows: collections.deque[tuple] = collections.deque()
+        self._exhausted = False
+        self.description = None
+        self.rowcount = -1
+
+    def _put(self, item) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _ExportCancelled()
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _read_csv(self, pipe, dst) -> None:
+        reader = csv.reader(io.TextIOWrapper(pipe, encoding="utf-8", newline="\n"))
+        header = next(reader, None)
+        self._put(("header", header or []))
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= self._chunk_size:
+                self._put(("rows", chunk))
+                chunk = []
+        if chunk:
+            self._put(("rows", chunk))
+
+    def _export(self, query: str) -> None:
+        try:
+            self._connection.export_to_callback(
+                self._read_csv,
+                None,
+                query,
+                export_params={"with_column_names": True},
+            )
+            last_item: tuple[str, Any] = ("end", None)
+        except Exception as ex:
+            last_item = ("error", ex)
+        try:
+            self._put(last_item)
+        except _ExportCancelled:
+            pass
+
+    def _next_item(self):
+        kind, value = self._queue.get()
+        if kind == "error":
+            self._exhausted = True
+            raise self._dbapi.Error(str(value)) from value
+        if kind == "end":
+            self._exhausted = True
+        return kind, value
+
+    def execute(self, operation: str, parameters=None) -> None:
+        query = inline_parameters(operation, parameters)
+        self._thread = threading.Thread(
+            target=self._export, args=(query,), name="exasol-export", daemon=True
+        )
+        self._thread.start()
+        kind, header = self._next_item()
+        if kind != "header":
+            raise self._dbapi.Error("EXPORT returned no column names")
+        self.description = [
+            (name, None, None, None, None, None, True) for name in header
+        ]
+        result_types = self._result_types
+        if result_types is None or len(result_types) != len(header):
+            result_types = [None] * len(header)
+        self._converters = [_get_csv_converter(type_) for type_ in result_types]
+
+    def executemany(self, operation, seq_of_parameters):
+        raise self._dbapi.NotSupportedError(
+            "EXPORT streaming is only supported for queries"
+        )
+
+    def _convert(self, row: list[str]) -> tuple:
+        return tuple(
+            (
+                None
+                if value == ""
+                else converter(value) if converter is not None else value
+            )
+            for value, converter in zip(row, self._converters)
+        )
+
+    def _fill(self, size: int | None) -> None:
+        while not self._exhausted and (size is None or len(self._rows) < size):
+            kind, chunk = self._next_item()
+            if kind == "rows":
+                self._rows.extend(self._convert(row) for row in chunk)
+
+    def fetchone(self):
+        self._fill(1)
+        if not self._rows:
+            return None
+        return self._rows.popleft()
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        self._fill(size)
+        return [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+
+    def fetchall(self):
+        self._fill(None)
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._cancelled.set()
+        self._thread.join()
+        self._thread = None
+        self._rows.clear()
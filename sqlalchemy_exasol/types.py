@@ -7,32 +7,65 @@ from datetime import (
 from sqlalchemy import String
 from sqlalchemy.sql import sqltypes
 
+# number of significant decimal digits a float represents exactly (DBL_DIG)
+MAX_FLOAT_PRECISION = 15
+
+
+def _to_int(value):
+    if value is None or value.__class__ is int:
+        return value
+    return int(value)
+
 
 class ExaDecimal(sqltypes.DECIMAL):
     def bind_processor(self, dialect):
         return super().bind_processor(dialect)
 
-    def to_decimal(self, value):
-        fstring = "%%.%df" % self._effective_decimal_return_scale
-
-        if value is None:
-            return None
-        if isinstance(value, decimal.Decimal):
-            return value
-        if isinstance(value, float):
-            return decimal.Decimal(fstring % value)
-        return decimal.Decimal(value)
-
     @staticmethod
     def handle_not_as_decimal(value):
         if value is None:
             return None
         return float(value)
 
+    def _get_decimal_processor(self):
+        fstring = "%%.%df" % self._effective_decimal_return_scale
+        Decimal = decimal.Decimal
+
+        def to_decimal(value):
+            if value is None:
+                return None
+            value_type = value.__class__
+            if value_type is Decimal:
+                return value
+            if value_type is float:
+                return Decimal(fstring % value)
+            return Decimal(value)
+
+        return to_decimal
+
+    def _get_native_processor(self):
+        """
+        Processor returning ``int`` or ``float`` instead of ``Decimal`` where the
+        value can be represented exactly, or ``None`` if it can't.
+        """
+        if self.scale == 0:
+            return _to_int
+        if (
+            self.precision is not None
+            and self.precision <= MAX_FLOAT_PRECISION
+            and self.scale is not None
+        ):
+            return self.handle_not_as_decimal
+        return None
+
     def result_processor(self, dialect, coltype):
-        if self.asdecimal:
-            return self.to_decimal
-        return self.handle_not_as_decimal
+        if not self.asdecimal:
+            return self.handle_not_as_decimal
+        if getattr(dialect, "fast_decimals", False):
+            processor = self._get_native_processor()
+            if processor is not None:
+                return processor
+        return self._get_decimal_processor()
 
 
 class EXATimestamp(sqltypes.TypeDecorator):
@@ -1,5 +1,4 @@
 import datetime
-import time
 from collections import (
     ChainMap,
     defaultdict,
@@ -54,29 +53,66 @@ class DateTime(sqltypes.DATETIME):
         return process
 
     def result_processor(self, dialect, coltype):
-        def datetime_fmt(v):
-            formats = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f")
-            for fmt in formats:
-                try:
-                    time.strptime(v, fmt)
-                except ValueError:
-                    continue
-                return fmt
-            raise ValueError("Unknown date/time format")
-
-        def to_datetime(v):
-            if not isinstance(v, str):
-                return v
-            fmt = datetime_fmt(v)
-            timestamp = time.strptime(v, fmt)
-            return datetime.datetime.fromtimestamp(time.mktime(timestamp))
-
-        return to_datetime
+        return TimestampParser()
+
+
+# length of a timestamp without fractional seconds: YYYY-MM-DD HH:MM:SS
+_TIMESTAMP_LENGTH = 19
+
+
+def _parse_padded_timestamp(value):
+    """
+    Parse timestamps whose fractional seconds don't have 3 or 6 digits,
+    e.g. of ``TIMESTAMP(9)`` columns, by padding or truncating them to
+    microseconds.
+    """
+    timestamp, fraction = value[:_TIMESTAMP_LENGTH], value[_TIMESTAMP_LENGTH + 1 :]
+    return datetime.datetime.fromisoformat(f"{timestamp}.{fraction[:6]:0<6}")
+
+
+# parsers of timestamps by their length, fromisoformat handles 0, 3 or 6
+# fractional digits, all other lengths are parsed by _parse_padded_timestamp
+_TIMESTAMP_PARSERS = {
+    _TIMESTAMP_LENGTH: datetime.datetime.fromisoformat,
+    _TIMESTAMP_LENGTH + 4: datetime.datetime.fromisoformat,
+    _TIMESTAMP_LENGTH + 7: datetime.datetime.fromisoformat,
+}
+
+
+class TimestampParser:
+    """
+    Result processor for ``TIMESTAMP`` values, which the websocket API returns as
+    strings like ``YYYY-MM-DD HH:MM:SS[.FFFFFF]``.
+
+    The parser of a value is looked up by its length, which tells the number of
+    fractional digits. The processor keeps no state, so it can be shared by the
+    threads using a cached statement. :meth:`process_batch` converts a whole list
+    of fetched values at once.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, value):
+        if not isinstance(value, str):
+            return value
+        return _TIMESTAMP_PARSERS.get(len(value), _parse_padded_timestamp)(value)
+
+    def process_batch(self, values):
+        """Convert a list of fetched values, returns a new list."""
+        get_parser = _TIMESTAMP_PARSERS.get
+        return [
+            (
+                get_parser(len(value), _parse_padded_timestamp)(value)
+                if value.__class__ is str
+                else self(value)
+            )
+            for value in values
+        ]
 
 
 class EXADialect_websocket(EXADialect):
     driver = "exasol.driver.websocket.dbapi2"
-    supports_statement_cache = False
+    supports_statement_cache = True
     colspecs = {
         sqltypes.Integer: Integer,
         sqltypes.Numeric: ExaDecimal,
@@ -0,0 +1,150 @@
+"""
+Stand-ins for the connections of the websocket DBAPI and of pyexasol, shared by
+the unit tests and the benchmarks.
+"""
+
+DEFAULT_FETCH_SIZE_BYTES = 5 * 1024 * 1024
+
+
+class FakeCursor:
+    """
+    DBAPI cursor which records statements and answers queries with canned rows.
+
+    Queries containing one of the markers in ``connection.responses`` return the
+    associated columns and rows, all other ``SELECT`` queries return a single row
+    with the value 1. Columns are given by name or as complete description entries.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+
+    def execute(self, statement, parameters=None):
+        self.connection.statements.append((statement, parameters))
+        for marker, (columns, rows) in self.connection.responses.items():
+            if marker in statement:
+                break
+        else:
+            if "databaseProductVersion" in statement:
+                columns, rows = ["PARAM_VALUE"], [("8.29.1",)]
+            elif statement.lstrip().upper().startswith("SELECT"):
+                columns, rows = ["ID"], [(1,)]
+            else:
+                columns, rows = None, []
+        self.description = (
+            [
+                (
+                    column
+                    if isinstance(column, tuple)
+                    else (column, None, None, None, None, None, True)
+                )
+                for column in columns
+            ]
+            if columns is not None
+            else None
+        )
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def executemany(self, statement, seq_of_parameters):
+        seq_of_parameters = list(seq_of_parameters)
+        self.connection.executemany_calls.append((statement, seq_of_parameters))
+        for parameters in seq_of_parameters:
+            self.execute(statement, parameters)
+        self.rowcount = len(seq_of_parameters)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeDBAPIConnection:
+    """
+    DBAPI connection of the websocket driver, ``connection`` stands for the
+    underlying pyexasol connection.
+    """
+
+    def __init__(self, pyexasol_connection=None):
+        self.connection = pyexasol_connection
+        self.statements = []
+        self.executemany_calls = []
+        self.responses = {}
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeStatement:
+    def __init__(self, rowcount):
+        self._rowcount = rowcount
+
+    def rowcount(self):
+        return self._rowcount
+
+
+class FakePyexasolConnection:
+    """
+    Records HTTP transport imports and exports instead of running them.
+
+    ``error`` is raised by every import and export instead of recording it.
+    """
+
+    def __init__(self, error=None):
+        self.options = {
+            "compression": False,
+            "encryption": True,
+            "fetch_size_bytes": DEFAULT_FETCH_SIZE_BYTES,
+        }
+        self.imports = []
+        self.parallel_exports = []
+        self.parallel_imports = []
+        self._error = error
+        self._last_statement = FakeStatement(None)
+
+    def get_nodes(self, pool_size=None):
+        return [
+            {"ipaddr": f"10.0.0.{idx}", "port": 8563, "idx": idx}
+            for idx in range(1, pool_size + 1)
+        ]
+
+    def import_from_iterable(self, src, table, import_params=None):
+        self._raise_error()
+        rows = list(src)
+        self.imports.append((table, import_params, rows))
+        self._last_statement = FakeStatement(len(rows))
+
+    def export_parallel(self, exa_address_list, query, export_params=None):
+        self._raise_error()
+        self.parallel_exports.append((exa_address_list, query, export_params))
+
+    def import_parallel(self, exa_address_list, table, import_params=None):
+        self._raise_error()
+        self.parallel_imports.append((exa_address_list, table, import_params))
+
+    def last_statement(self):
+        return self._last_statement
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
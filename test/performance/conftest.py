@@ -0,0 +1,146 @@
+"""
+Offline benchmarks of the dialect.
+
+The benchmarks run against a :class:`replay.ReplayConnection`, which replays
+recorded responses of the database. The results are compared with the baselines
+in ``baselines.json``:
+
+* the statements sent to the database must match exactly, as each one is a
+  round trip to the database,
+* the durations are measured relative to a fixed pure Python workload, which
+  makes them comparable across machines, and must not exceed their baseline by
+  more than the factor given by ``--benchmark-tolerance``.
+
+After an intended change of the statements or the performance, the baselines are
+updated with ``--update-baselines``.
+"""
+
+import gc
+import json
+import time
+from pathlib import Path
+
+import pytest
+from replay import ReplayConnection
+
+BASELINES = Path(__file__).parent / "baselines.json"
+
+# minimal number of rounds and minimal total duration of a measurement
+_MIN_ROUNDS = 3
+_MIN_SECONDS = 0.5
+
+
+@pytest.fixture
+def make_replay_engine(make_fake_engine):
+    """Factory for engines whose connections replay a recording."""
+
+    def make(recording, *args, **kwargs):
+        return make_fake_engine(
+            *args, dbapi_connection=ReplayConnection(recording), **kwargs
+        )
+
+    return make
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="Write the measured results to the baselines instead of checking them.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=2.0,
+        help="Factor by which a duration may exceed its baseline.",
+    )
+
+
+def _measure(function, min_seconds=_MIN_SECONDS):
+    """Best duration of ``function`` over several rounds, without garbage collection."""
+    durations = []
+    start = time.perf_counter()
+    while len(durations) < _MIN_ROUNDS or time.perf_counter() - start < min_seconds:
+        gc.collect()
+        gc.disable()
+        try:
+            before = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - before)
+        finally:
+            gc.enable()
+    return min(durations)
+
+
+def _reference_workload():
+    values = {}
+    for i in range(20_000):
+        values[str(i)] = i * 2
+    return sorted(values.items(), key=lambda item: item[1])
+
+
+@pytest.fixture(scope="session")
+def measure():
+    """Best duration of a function over several rounds, see ``_measure``."""
+    return _measure
+
+
+@pytest.fixture(scope="session")
+def reference_duration():
+    return _measure(_reference_workload, min_seconds=1.0)
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    update = request.config.getoption("--update-baselines")
+    values = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    yield values
+    if update:
+        BASELINES.write_text(json.dumps(values, indent=2, sort_keys=True) + "\n")
+
+
+class Benchmark:
+    def __init__(self, name, baselines, reference_duration, update, tolerance):
+        self.name = name
+        self._baselines = baselines
+        self._reference_duration = reference_duration
+        self._update = update
+        self._tolerance = tolerance
+
+    def __call__(self, function, statements=None):
+        """
+        Measure ``function`` and compare its relative duration and the statements
+        it sent, given as a callable, with the baseline.
+        """
+        result = function()
+        measured = {
+            "relative_duration": round(_measure(function) / self._reference_duration, 3)
+        }
+        if statements is not None:
+            measured["statements"] = list(statements())
+        if self._update:
+            self._baselines[self.name] = measured
+            return result
+
+        baseline = self._baselines.get(self.name)
+        assert baseline is not None, f"No baseline for {self.name}"
+        if "statements" in baseline:
+            assert measured.get("statements") == baseline["statements"]
+        limit = baseline["relative_duration"] * self._tolerance
+        assert measured["relative_duration"] <= limit, (
+            f"{self.name} took {measured['relative_duration']} times the reference"
+            f" workload, the baseline is {baseline['relative_duration']}"
+        )
+        return result
+
+
+@pytest.fixture
+def benchmark(request, baselines, reference_duration):
+    return Benchmark(
+        request.node.name,
+        baselines,
+        reference_duration,
+        request.config.getoption("--update-baselines"),
+        request.config.getoption("--benchmark-tolerance"),
+    )
@@ -0,0 +1,273 @@
+"""
+Stand-in for connections of the websocket DBAPI (``exasol.driver.websocket.dbapi2``),
+which answers queries with recorded responses instead of sending them to a database.
+
+Responses can be recorded from a database by wrapping a DBAPI connection in a
+:class:`RecordingConnection`, and the catalog of the benchmarked schemas is
+generated in the same format by :func:`catalog_recording`.
+"""
+
+import json
+import re
+from pathlib import Path
+
+# collapses the parameter markers of IN lists, whose length depends on the schema
+_PARAMETER_LIST = re.compile(r"\(\?(?:, \?)*\)")
+
+
+def normalize_statement(statement):
+    return _PARAMETER_LIST.sub("(?)", " ".join(statement.split()))
+
+
+class ReplayCursor:
+    """DBAPI cursor which answers statements with recorded responses."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+
+    def execute(self, statement, parameters=None):
+        key = normalize_statement(statement)
+        self.connection.statements.append(key)
+        try:
+            response = self.connection.recording[key]
+        except KeyError:
+            raise AssertionError(f"No recorded response for: {key}") from None
+        columns = response["columns"]
+        self.description = (
+            [(column, None, None, None, None, None, True) for column in columns]
+            if columns is not None
+            else None
+        )
+        self._rows = [tuple(row) for row in response["rows"]]
+        self.rowcount = len(self._rows)
+
+    def executemany(self, statement, seq_of_parameters):
+        for parameters in seq_of_parameters:
+            self.execute(statement, parameters)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchmany(self, size=None):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class ReplayConnection:
+    """
+    DBAPI connection of the websocket driver replaying a recording.
+
+    ``recording`` maps normalized statements to their ``columns`` and ``rows``,
+    as written by :class:`RecordingConnection`.
+    """
+
+    connection = None
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.statements = []
+
+    def cursor(self):
+        return ReplayCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _RecordingCursor:
+    def __init__(self, cursor, recording):
+        self._cursor = cursor
+        self._recording = recording
+        self._key = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, statement, parameters=None):
+        self._cursor.execute(statement, parameters)
+        self._key = normalize_statement(statement)
+        description = self._cursor.description
+        self._recording[self._key] = {
+            "columns": (
+                [column[0] for column in description]
+                if description is not None
+                else None
+            ),
+            "rows": [],
+        }
+
+    def _record(self, rows):
+        self._recording[self._key]["rows"].extend(list(row) for row in rows)
+        return rows
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._record([row])
+        return row
+
+    def fetchmany(self, *args):
+        return self._record(self._cursor.fetchmany(*args))
+
+    def fetchall(self):
+        return self._record(self._cursor.fetchall())
+
+
+class RecordingConnection:
+    """
+    Records the responses of a DBAPI connection for :class:`ReplayConnection`.
+
+    .. code-block:: python
+
+        recording = RecordingConnection(dbapi_connection)
+        engine = create_engine(url, creator=lambda: recording)
+        ...
+        recording.save(path)
+    """
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.recording = {}
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def cursor(self):
+        return _RecordingCursor(self._connection.cursor(), self.recording)
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.recording, indent=1, default=str))
+
+
+def _response(columns, rows):
+    return {"columns": columns, "rows": rows}
+
+
+def _server_responses():
+    return {
+        normalize_statement(
+            "select PARAM_VALUE from SYS.EXA_METADATA"
+            " where PARAM_NAME = 'databaseProductVersion'"
+        ): _response(["PARAM_VALUE"], [["8.29.1"]]),
+    }
+
+
+# types of the columns in the generated catalog, cycled through per table
+_COLUMN_TYPES = [
+    ("DECIMAL(18,0)", None, 18, 0),
+    ("VARCHAR(200) UTF8", 200, None, None),
+    ("TIMESTAMP", 29, None, None),
+    ("DECIMAL(12,2)", None, 12, 2),
+    ("DATE", 10, None, None),
+    ("BOOLEAN", 1, None, None),
+]
+
+
+def catalog_recording(tables, columns):
+    """
+    Recording of the catalog of a schema with ``tables`` tables of ``columns``
+    columns each, for reflecting it with ``MetaData.reflect``.
+
+    The first column of each table is its primary key, and every table but the
+    first refers to its predecessor with a foreign key.
+    """
+    names = [f"TABLE_{table:03}" for table in range(tables)]
+    column_rows, objects, primary_keys, foreign_keys = [], [], [], []
+    for index, name in enumerate(names):
+        objects.append([name, f"table {index}", "TABLE"])
+        primary_keys.append(
+            [f"PK_{name}", "C_000", None, None, None, name, "PRIMARY KEY"]
+        )
+        if index:
+            foreign_keys.append(
+                [
+                    f"FK_{name}",
+                    "C_001",
+                    "MY_SCHEMA",
+                    names[index - 1],
+                    "C_000",
+                    name,
+                    "FOREIGN KEY",
+                ]
+            )
+        for column in range(columns):
+            coltype, length, precision, scale = _COLUMN_TYPES[
+                column % len(_COLUMN_TYPES)
+            ]
+            column_rows.append(
+                [
+                    name,
+                    f"C_{column:03}",
+                    coltype,
+                    length,
+                    precision,
+                    scale,
+                    column != 0,
+                    None,
+                    None,
+                    column == 0,
+                    None,
+                ]
+            )
+
+    recording = _server_responses()
+    constraint_query = (
+        "SELECT constraint_name, column_name, referenced_schema, referenced_table,"
+        " referenced_column, constraint_table, constraint_type"
+        " FROM SYS.EXA_ALL_CONSTRAINT_COLUMNS WHERE constraint_schema=?"
+        " AND constraint_type='{}' AND constraint_table IN (?)"
+        " ORDER BY constraint_table, ordinal_position"
+    )
+    recording.update(
+        {
+            "SELECT table_name FROM SYS.EXA_ALL_TABLES WHERE table_schema = ?"
+            " ORDER BY table_name": _response(
+                ["TABLE_NAME"], [[name] for name in names]
+            ),
+            "SELECT column_table, column_name, column_type, column_maxsize,"
+            " column_num_prec, column_num_scale, column_is_nullable,"
+            " column_default, column_identity, column_is_distribution_key,"
+            " column_comment FROM sys.exa_all_columns"
+            " WHERE column_object_type IN ('TABLE') AND column_schema = ?"
+            " AND column_table IN (?)"
+            " ORDER BY column_table, column_ordinal_position": _response(
+                [f"COLUMN_{i}" for i in range(11)], column_rows
+            ),
+            "SELECT object_name, object_comment, object_type"
+            " FROM SYS.EXA_ALL_OBJECTS WHERE object_type IN ('TABLE')"
+            " AND root_name = ? AND object_name IN (?)"
+            " ORDER BY object_name": _response(
+                ["OBJECT_NAME", "OBJECT_COMMENT", "OBJECT_TYPE"], objects
+            ),
+            constraint_query.format("PRIMARY KEY"): _response(
+                [f"COLUMN_{i}" for i in range(7)], primary_keys
+            ),
+            constraint_query.format("FOREIGN KEY"): _response(
+                [f"COLUMN_{i}" for i in range(7)], foreign_keys
+            ),
+        }
+    )
+    return recording
+
+
+def query_recording(statement, columns, rows):
+    """Recording of the server responses and a single query."""
+    recording = _server_responses()
+    recording[normalize_statement(statement)] = _response(columns, rows)
+    return recording
@@ -0,0 +1,125 @@
+import pytest
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    and_,
+    case,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.schema import CreateTable
+
+from sqlalchemy_exasol.base import EXADialect
+
+_TYPES = [
+    lambda: Integer(),
+    lambda: String(200),
+    lambda: DateTime(),
+    lambda: Numeric(12, 2),
+    lambda: Date(),
+    lambda: Boolean(),
+    lambda: BigInteger(),
+]
+
+
+@pytest.fixture
+def dialect():
+    return EXADialect()
+
+
+@pytest.fixture
+def tables():
+    metadata = MetaData()
+    customers = Table(
+        "customers",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(200)),
+        Column("region", String(20)),
+        schema="sales",
+    )
+    orders = Table(
+        "orders",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("customer_id", ForeignKey(customers.c.id)),
+        Column("ordered_at", DateTime),
+        Column("amount", Numeric(12, 2)),
+        Column("status", String(10)),
+        schema="sales",
+    )
+    return customers, orders
+
+
+def _complex_select(customers, orders):
+    totals = (
+        select(
+            orders.c.customer_id,
+            func.sum(orders.c.amount).label("total"),
+            func.count().label("orders"),
+        )
+        .where(orders.c.status.in_(["open", "paid", "shipped"]))
+        .group_by(orders.c.customer_id)
+        .cte("totals")
+    )
+    latest = (
+        select(func.max(orders.c.ordered_at))
+        .where(orders.c.customer_id == customers.c.id)
+        .scalar_subquery()
+    )
+    rank = func.rank().over(partition_by=customers.c.region, order_by=totals.c.total)
+    return (
+        select(
+            customers.c.name,
+            customers.c.region,
+            totals.c.total,
+            latest.label("latest"),
+            rank.label("rank"),
+            case((totals.c.total > 1000, "large"), else_="small").label("size"),
+        )
+        .join(totals, totals.c.customer_id == customers.c.id)
+        .where(
+            or_(
+                and_(customers.c.region == "EU", totals.c.orders > 5),
+                customers.c.name.like("A%"),
+            )
+        )
+        .order_by(totals.c.total.desc())
+        .limit(100)
+        .offset(10)
+    )
+
+
+def test_compile_complex_select(benchmark, dialect, tables):
+    statement = _complex_select(*tables)
+
+    compiled = benchmark(lambda: statement.compile(dialect=dialect))
+
+    assert "WITH totals AS" in str(compiled)
+
+
+@pytest.mark.parametrize("columns", [30, 300])
+def test_compile_wide_create_table(benchmark, dialect, columns):
+    table = Table(
+        "wide",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        *(
+            Column(f"c_{column:03}", _TYPES[column % len(_TYPES)]())
+            for column in range(columns)
+        ),
+    )
+
+    compiled = benchmark(lambda: CreateTable(table).compile(dialect=dialect))
+
+    assert str(compiled).count("\n\tc_") == columns
@@ -0,0 +1,56 @@
+import pytest
+from replay import catalog_recording
+from sqlalchemy import MetaData
+
+from sqlalchemy_exasol.websocket import EXADialect_websocket
+
+
+@pytest.mark.parametrize("columns", [3, 30, 300])
+@pytest.mark.parametrize("tables", [1, 50, 100])
+def test_reflect_schema(benchmark, make_replay_engine, tables, columns):
+    engine = make_replay_engine(catalog_recording(tables, columns))
+    with engine.connect():
+        pass
+    statements = engine.dbapi_connection.statements
+
+    def reflect():
+        statements.clear()
+        metadata = MetaData()
+        metadata.reflect(engine)
+        return metadata
+
+    metadata = benchmark(reflect, statements=lambda: statements)
+
+    assert len(metadata.tables) == tables
+    table = metadata.tables["table_000"]
+    assert len(table.columns) == columns
+    assert [column.name for column in table.primary_key] == ["c_000"]
+
+
+# upper case names as read from the catalog, e.g. of 10 tables with 1000 columns
+_CATALOG_NAMES = [f"C_{column:03}" for column in range(1000)] * 10
+
+
+def _convert_names(dialect):
+    normalize_name, denormalize_name = dialect.normalize_name, dialect.denormalize_name
+    for name in _CATALOG_NAMES:
+        denormalize_name(normalize_name(name))
+
+
+def _dialect(name_cache_size):
+    return EXADialect_websocket(name_cache_size=name_cache_size)
+
+
+@pytest.mark.parametrize("name_cache_size", [0, 10_000], ids=["uncached", "cached"])
+def test_convert_names(benchmark, name_cache_size):
+    dialect = _dialect(name_cache_size)
+
+    benchmark(lambda: _convert_names(dialect))
+
+
+def test_name_cache_speeds_up_name_conversion(measure):
+    uncached, cached = _dialect(0), _dialect(10_000)
+
+    assert measure(lambda: _convert_names(cached)) * 3 < measure(
+        lambda: _convert_names(uncached)
+    )
@@ -0,0 +1,169 @@
+import datetime
+import decimal
+import time
+
+import pytest
+from replay import query_recording
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    Table,
+    select,
+)
+
+from sqlalchemy_exasol.websocket import EXADialect_websocket
+
+ROWS = 10_000
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "facts",
+        MetaData(),
+        Column("id", Integer),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+        Column("amount", Numeric(18, 2)),
+        Column("price", Numeric(36, 8)),
+        Column("booked_on", Date),
+    )
+
+
+def _rows():
+    return [
+        [
+            i,
+            f"2024-01-{i % 28 + 1:02} 12:{i % 60:02}:00.123456",
+            f"2024-02-{i % 28 + 1:02} 08:30:{i % 60:02}.000000",
+            f"{i}.25",
+            f"{i * 3}.12345678",
+            f"2024-03-{i % 28 + 1:02}",
+        ]
+        for i in range(ROWS)
+    ]
+
+
+@pytest.mark.parametrize("fast_decimals", [False, True])
+def test_process_timestamp_decimal_and_date_rows(
+    benchmark, make_replay_engine, table, fast_decimals
+):
+    statement = select(table)
+    engine = make_replay_engine({}, fast_decimals=fast_decimals)
+    engine.dbapi_connection.recording.update(
+        query_recording(
+            str(statement.compile(engine)),
+            [column.name.upper() for column in table.columns],
+            _rows(),
+        )
+    )
+
+    def fetch():
+        with engine.connect() as connection:
+            return connection.execute(statement).all()
+
+    rows = benchmark(fetch)
+
+    assert len(rows) == ROWS
+    assert rows[1].created_at == datetime.datetime(2024, 1, 2, 12, 1, 0, 123456)
+    assert rows[1].booked_on == datetime.date(2024, 3, 2)
+    expected_amount = 1.25 if fast_decimals else decimal.Decimal("1.25")
+    assert rows[1].amount == expected_amount
+
+
+def legacy_to_datetime(v):
+    """Result processor of the websocket DateTime type in version 7.1.2."""
+
+    def datetime_fmt(v):
+        formats = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f")
+        for fmt in formats:
+            try:
+                time.strptime(v, fmt)
+            except ValueError:
+                continue
+            return fmt
+        raise ValueError("Unknown date/time format")
+
+    if not isinstance(v, str):
+        return v
+    fmt = datetime_fmt(v)
+    timestamp = time.strptime(v, fmt)
+    return datetime.datetime.fromtimestamp(time.mktime(timestamp))
+
+
+_TIMESTAMPS = [
+    f"2024-01-{day:02} {hour:02}:{minute:02}:00.123456"
+    for day in range(1, 29)
+    for hour in range(24)
+    for minute in (0, 30)
+]
+
+
+@pytest.fixture
+def to_datetime():
+    dialect = EXADialect_websocket()
+    return DateTime().dialect_impl(dialect).result_processor(dialect, None)
+
+
+def test_parse_timestamps_per_value(benchmark, to_datetime):
+    benchmark(lambda: [to_datetime(v) for v in _TIMESTAMPS])
+
+
+def test_parse_timestamps_in_batches(benchmark, to_datetime):
+    values = benchmark(lambda: to_datetime.process_batch(_TIMESTAMPS))
+
+    assert values == [to_datetime(v) for v in _TIMESTAMPS]
+
+
+def test_timestamp_parsing_is_faster_than_legacy_implementation(measure, to_datetime):
+    legacy = measure(lambda: [legacy_to_datetime(v) for v in _TIMESTAMPS])
+
+    assert measure(lambda: [to_datetime(v) for v in _TIMESTAMPS]) * 5 < legacy
+    assert measure(lambda: to_datetime.process_batch(_TIMESTAMPS)) * 5 < legacy
+
+
+def legacy_to_decimal(value, scale):
+    """Result processor of the ExaDecimal type in version 7.1.2."""
+    fstring = "%%.%df" % scale
+
+    if value is None:
+        return None
+    if isinstance(value, decimal.Decimal):
+        return value
+    if isinstance(value, float):
+        return decimal.Decimal(fstring % value)
+    return decimal.Decimal(value)
+
+
+_DECIMALS = [f"{i}.25" for i in range(10_000)] + [i + 0.5 for i in range(10_000)]
+
+
+def _decimal_processor(type_, **dialect_kwargs):
+    dialect = EXADialect_websocket(**dialect_kwargs)
+    return type_.dialect_impl(dialect).result_processor(dialect, None)
+
+
+@pytest.mark.parametrize("fast_decimals", [False, True])
+def test_convert_decimals(benchmark, fast_decimals):
+    processor = _decimal_processor(Numeric(15, 2), fast_decimals=fast_decimals)
+
+    benchmark(lambda: [processor(v) for v in _DECIMALS])
+
+
+def test_decimal_conversion_is_faster_than_legacy_implementation(measure):
+    processor = _decimal_processor(Numeric(18, 2))
+    fast_processor = _decimal_processor(Numeric(15, 2), fast_decimals=True)
+
+    legacy = measure(lambda: [legacy_to_decimal(v, 2) for v in _DECIMALS])
+    per_column = measure(lambda: [processor(v) for v in _DECIMALS])
+    fast = measure(lambda: [fast_processor(v) for v in _DECIMALS])
+
+    assert per_column < legacy
+    assert fast < per_column
+    assert [processor(v) for v in _DECIMALS] == [
+        legacy_to_decimal(v, 2) for v in _DECIMALS
+    ]
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    create_engine,
+    insert,
+    select,
+)
+
+from sqlalchemy_exasol.fake_server import FakeServer
+
+ROWS = 5_000
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def engine(server):
+    engine = create_engine(server.url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def table(engine):
+    table = Table(
+        "facts",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String(100)),
+        Column("amount", Numeric(18, 2)),
+        Column("created_at", DateTime),
+    )
+    with engine.begin() as connection:
+        table.create(connection)
+        connection.execute(
+            insert(table),
+            [
+                {
+                    "name": f"name {i}",
+                    "amount": f"{i}.50",
+                    "created_at": "2024-01-01 12:00:00.000000",
+                }
+                for i in range(ROWS)
+            ],
+        )
+    return table
+
+
+def _commands(server):
+    return lambda: [request.get("command") for request in server.requests]
+
+
+def test_fetch_rows_over_websocket(benchmark, server, engine, table):
+    def fetch():
+        del server.requests[:]
+        with engine.connect() as connection:
+            return connection.execute(select(table)).all()
+
+    rows = benchmark(fetch, statements=_commands(server))
+
+    assert len(rows) == ROWS
+
+
+def test_insert_rows_over_websocket(benchmark, server, engine, table):
+    rows = [
+        {"name": "new", "amount": "1.50", "created_at": "2024-01-01 12:00:00.000000"}
+    ] * 1_000
+
+    def execute():
+        del server.requests[:]
+        with engine.begin() as connection:
+            connection.execute(insert(table), rows)
+
+    benchmark(execute, statements=_commands(server))
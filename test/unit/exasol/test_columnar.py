@@ -0,0 +1,168 @@
+import datetime
+import decimal
+
+import pytest
+from exasol.driver.websocket._types import TypeCode
+from sqlalchemy import (
+    DateTime,
+    String,
+    TypeDecorator,
+    text,
+)
+
+from sqlalchemy_exasol import columnar
+
+_COLUMNS = [
+    ("ID", TypeCode.Decimal, None, None, 18, 0, True),
+    ("AMOUNT", TypeCode.Decimal, None, None, 18, 2, True),
+    ("RATIO", TypeCode.Double, None, None, None, None, True),
+    ("NAME", TypeCode.String, None, 20, None, None, True),
+    ("MEASURED_ON", TypeCode.Date, None, None, None, None, True),
+    ("CREATED", TypeCode.Timestamp, None, None, None, None, True),
+    ("VALID", TypeCode.Bool, None, None, None, None, True),
+]
+
+_ROWS = [
+    (
+        1,
+        "12.50",
+        0.5,
+        "a",
+        datetime.date(2024, 1, 2),
+        "2024-01-02 03:04:05.000006",
+        True,
+    ),
+    (2, None, None, None, None, None, None),
+    (
+        3,
+        "1.00",
+        1.5,
+        "c",
+        datetime.date(2024, 1, 4),
+        "2024-01-04 00:00:00.000000",
+        False,
+    ),
+]
+
+
+@pytest.fixture
+def engine(make_fake_engine):
+    engine = make_fake_engine()
+    engine.dbapi_connection.responses["FROM measurements"] = (_COLUMNS, _ROWS)
+    return engine
+
+
+def _execute(connection):
+    return connection.execute(
+        text(
+            "SELECT id, amount, ratio, name, measured_on, created, valid FROM measurements"
+        )
+    )
+
+
+def test_get_result_types_uses_reflection_type_mapping(engine):
+    with engine.connect() as connection:
+        result_types = columnar.get_result_types(_execute(connection))
+
+    assert [repr(type_) for type_ in result_types] == [
+        "DECIMAL(precision=18, scale=0)",
+        "DECIMAL(precision=18, scale=2)",
+        "FLOAT()",
+        "VARCHAR()",
+        "DATE()",
+        "TIMESTAMP()",
+        "BOOLEAN()",
+    ]
+
+
+def test_iter_column_batches(engine):
+    with engine.connect() as connection:
+        batches = list(columnar.iter_column_batches(_execute(connection), batch_size=2))
+
+    assert [len(batch["id"]) for batch in batches] == [2, 1]
+    assert batches[0]["id"] == [1, 2]
+    assert batches[0]["name"] == ["a", None]
+    assert batches[1]["valid"] == [False]
+
+
+class _Upper(TypeDecorator):
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return value.upper() if value is not None else None
+
+
+def test_iter_column_batches_applies_result_processors(engine):
+    engine.dbapi_connection.responses["FROM names"] = (["NAME"], [("a",), (None,)])
+
+    with engine.connect() as connection:
+        result = connection.execute(
+            text("SELECT name FROM names").columns(name=_Upper())
+        )
+        [batch] = columnar.iter_column_batches(result)
+
+    assert batch == {"name": ["A", None]}
+
+
+def test_iter_column_batches_with_metrics(make_fake_engine):
+    engine = make_fake_engine(metrics=True)
+    engine.dbapi_connection.responses["FROM events"] = (
+        ["CREATED"],
+        [("2024-01-02 03:04:05.000006",), (None,)],
+    )
+
+    with engine.connect() as connection:
+        result = connection.execute(
+            text("SELECT created FROM events").columns(created=DateTime())
+        )
+        [batch] = columnar.iter_column_batches(result)
+
+    assert batch == {"created": [datetime.datetime(2024, 1, 2, 3, 4, 5, 6), None]}
+    assert result.closed
+    [values] = engine.dialect.metrics.snapshot().values()
+    assert values["rows"] == 2
+    assert values["processing_time"] > 0
+
+
+def test_iter_arrow_batches(engine):
+    pyarrow = pytest.importorskip("pyarrow")
+
+    with engine.connect() as connection:
+        batches = list(columnar.iter_arrow_batches(_execute(connection), batch_size=2))
+
+    table = pyarrow.Table.from_batches(batches)
+    assert table.schema == pyarrow.schema(
+        [
+            ("id", pyarrow.int64()),
+            ("amount", pyarrow.decimal128(18, 2)),
+            ("ratio", pyarrow.float64()),
+            ("name", pyarrow.string()),
+            ("measured_on", pyarrow.date32()),
+            ("created", pyarrow.timestamp("us")),
+            ("valid", pyarrow.bool_()),
+        ]
+    )
+    assert table.column("amount").to_pylist() == [
+        decimal.Decimal("12.50"),
+        None,
+        decimal.Decimal("1.00"),
+    ]
+    assert table.column("created").to_pylist()[0] == datetime.datetime(
+        2024, 1, 2, 3, 4, 5, 6
+    )
+
+
+def test_iter_numpy_batches(engine):
+    numpy = pytest.importorskip("numpy")
+
+    with engine.connect() as connection:
+        [batch] = list(columnar.iter_numpy_batches(_execute(connection)))
+
+    assert batch["id"].dtype == numpy.int64
+    assert batch["ratio"].dtype == numpy.float64
+    assert numpy.isnan(batch["ratio"][1])
+    assert batch["measured_on"].dtype == numpy.dtype("datetime64[D]")
+    assert numpy.isnat(batch["created"][1])
+    assert batch["valid"].dtype == numpy.dtype("object")
+    assert batch["amount"][0] == decimal.Decimal("12.50")
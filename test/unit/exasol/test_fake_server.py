@@ -0,0 +1,125 @@
+import sys
+import time
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    exc,
+    insert,
+    inspect,
+    select,
+    text,
+)
+
+from sqlalchemy_exasol import fake_server
+from sqlalchemy_exasol.fake_server import FakeServer
+
+
+@pytest.fixture
+def server():
+    with FakeServer(max_rows_in_message=10) as server:
+        yield server
+
+
+@pytest.fixture
+def engine(server):
+    engine = create_engine(server.url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String(20)),
+        Column("created", Date),
+    )
+
+
+def _commands(server):
+    return [request.get("command") for request in server.requests]
+
+
+def test_rows_are_inserted_and_fetched_in_chunks(server, engine, table):
+    with engine.begin() as connection:
+        table.create(connection)
+        connection.execute(
+            insert(table),
+            [{"name": f"item {i}", "created": "2024-05-17"} for i in range(25)],
+        )
+        del server.requests[:]
+        rows = connection.execute(select(table).order_by(table.c.id)).all()
+
+    assert len(rows) == 25
+    assert rows[0].id == 1
+    assert rows[24].name == "item 24"
+    assert rows[0].created.isoformat() == "2024-05-17"
+    # the first 10 rows are in the response, the remaining ones fit into one fetch
+    assert _commands(server)[:3] == ["execute", "fetch", "closeResultSet"]
+
+
+def test_catalog_queries_are_answered_with_scripted_responses(server, engine):
+    server.add_response(
+        "FROM SYS.EXA_ALL_TABLES", ["TABLE_NAME"], [("PARENT",), ("CHILD",)]
+    )
+
+    with engine.connect() as connection:
+        assert inspect(connection).get_table_names() == ["parent", "child"]
+
+
+def test_schemas_are_created_and_opened(engine):
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT CURRENT_SCHEMA")).scalar() == (
+            "MY_SCHEMA"
+        )
+        connection.execute(text("CREATE SCHEMA other"))
+        connection.execute(text("CREATE TABLE other.t (id INTEGER)"))
+        connection.execute(text("INSERT INTO other.t VALUES (42)"))
+        assert connection.execute(text("SELECT CURRENT_SCHEMA")).scalar() == "OTHER"
+        assert connection.execute(text("SELECT id FROM other.t")).scalar() == 42
+        connection.execute(text("OPEN SCHEMA my_schema"))
+        assert connection.execute(text("SELECT CURRENT_SCHEMA")).scalar() == (
+            "MY_SCHEMA"
+        )
+
+
+def test_errors_are_raised_by_the_driver(engine):
+    with engine.connect() as connection:
+        with pytest.raises(exc.DBAPIError) as exc_info:
+            connection.execute(text("SELECT * FROM missing"))
+
+    assert "no such table" in str(exc_info.value.orig.__cause__)
+
+
+def test_responses_are_delayed(server, engine):
+    with engine.connect() as connection:
+        server.delay = 0.05
+        del server.requests[:]
+        start = time.perf_counter()
+        connection.execute(text("SELECT 1")).all()
+        duration = time.perf_counter() - start
+
+    assert duration >= 0.05
+    assert [request.get("sqlText") for request in server.requests] == [
+        "SELECT 1",
+        "ROLLBACK",
+    ]
+
+
+def test_missing_cryptography_is_reported_when_a_server_is_created(monkeypatch):
+    monkeypatch.setitem(sys.modules, "cryptography.hazmat.primitives.asymmetric", None)
+    fake_server._private_key.cache_clear()
+    try:
+        with pytest.raises(ImportError, match="requires the package cryptography"):
+            FakeServer()
+    finally:
+        fake_server._private_key.cache_clear()
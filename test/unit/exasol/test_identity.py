@@ -0,0 +1,316 @@
+import re
+
+import pytest
+from fakes import (
+    FakeCursor,
+    FakeDBAPIConnection,
+)
+from pyexasol.exceptions import ExaQueryError
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import insert
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+)
+
+from sqlalchemy_exasol.identity import (
+    disable_batched_identities,
+    enable_batched_identities,
+    reserve_identity_values,
+)
+from sqlalchemy_exasol.retry import is_retryable_error
+
+IDENTITY_COLUMNS = ["COLUMN_IDENTITY", "COLUMN_TYPE"]
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class User(Base):
+    __tablename__ = "users"
+    __table_args__ = {"schema": "app"}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(20))
+
+
+class Membership(Base):
+    __tablename__ = "memberships"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("app.users.id"), primary_key=True)
+    group: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+
+class Event(Base):
+    __tablename__ = "events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+def engine(make_fake_engine):
+    engine = make_fake_engine()
+    engine.dbapi_connection.responses["EXA_ALL_COLUMNS"] = (
+        IDENTITY_COLUMNS,
+        [(41, "DECIMAL(18,0)")],
+    )
+    engine.dbapi_connection.responses["CURRENT_SCHEMA"] = (
+        ["CURRENT_SCHEMA"],
+        [("MY_SCHEMA",)],
+    )
+    return engine
+
+
+@pytest.fixture
+def session_class():
+    class _Session(Session):
+        pass
+
+    enable_batched_identities(User, Membership, target=_Session)
+    yield _Session
+    disable_batched_identities(User, Membership)
+    disable_batched_identities(target=_Session)
+
+
+def _catalog_queries(engine):
+    return [
+        statement
+        for statement, _ in engine.dbapi_connection.statements
+        if "EXA_ALL_COLUMNS" in statement
+    ]
+
+
+def _inserts(engine):
+    return [
+        (statement, parameters)
+        for statement, parameters in engine.dbapi_connection.statements
+        if statement.startswith("INSERT")
+    ]
+
+
+def test_reserve_identity_values(engine):
+    table = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+
+    with engine.begin() as connection:
+        values = reserve_identity_values(
+            connection.execution_options(schema_translate_map={None: "shop"}),
+            table,
+            3,
+        )
+
+    assert values == range(42, 45)
+    statements = engine.dbapi_connection.statements
+    query, params = statements[-2]
+    assert "SELECT column_identity, column_type FROM SYS.EXA_ALL_COLUMNS" in query
+    assert params == ("ITEMS", "ID", "SHOP")
+    assert statements[-1] == (
+        "ALTER TABLE shop.items MODIFY COLUMN id DECIMAL(18,0) IDENTITY 45",
+        (),
+    )
+
+
+class _SchemasCursor(FakeCursor):
+    """Catalog of two schemas with a table ITEMS each, SHOP is the current one."""
+
+    IDENTITIES = {"SHOP": 41, "OTHER": 99}
+
+    def execute(self, statement, parameters=None):
+        if "EXA_ALL_COLUMNS" in statement:
+            schemas = parameters[2:] or tuple(self.IDENTITIES)
+            self.connection.responses["EXA_ALL_COLUMNS"] = (
+                IDENTITY_COLUMNS,
+                [(self.IDENTITIES[schema], "DECIMAL(18,0)") for schema in schemas],
+            )
+        super().execute(statement, parameters)
+
+
+class _SchemasConnection(FakeDBAPIConnection):
+    def __init__(self):
+        super().__init__()
+        self.responses["CURRENT_SCHEMA"] = (["CURRENT_SCHEMA"], [("SHOP",)])
+
+    def cursor(self):
+        return _SchemasCursor(self)
+
+
+def test_reserve_identity_values_of_table_in_current_schema(make_fake_engine):
+    engine = make_fake_engine(dbapi_connection=_SchemasConnection())
+    table = Table("items", MetaData(), Column("id", Integer, primary_key=True))
+
+    with engine.begin() as connection:
+        values = reserve_identity_values(connection, table, 3)
+
+    assert values == range(42, 45)
+    statements = engine.dbapi_connection.statements
+    assert statements[-2][1] == ("ITEMS", "ID", "SHOP")
+    assert statements[-1] == (
+        "ALTER TABLE shop.items MODIFY COLUMN id DECIMAL(18,0) IDENTITY 45",
+        (),
+    )
+
+
+def test_reserve_identity_values_requires_identity_column(engine):
+    table = Table("items", MetaData(), Column("name", String(20), primary_key=True))
+
+    with engine.begin() as connection:
+        with pytest.raises(sa_exc.ArgumentError):
+            reserve_identity_values(connection, table, 3)
+
+
+def test_flush_inserts_new_objects_in_one_batch(engine, session_class):
+    with session_class(engine) as session:
+        users = [User(name=name) for name in ("a", "b", "c")]
+        session.add_all(users)
+        session.add(User(id=7, name="d"))
+        session.flush()
+        ids = [user.id for user in users]
+        session.commit()
+
+    assert ids == [42, 43, 44]
+    assert len(_catalog_queries(engine)) == 1
+    [(statement, parameters)] = _inserts(engine)
+    assert statement.startswith("INSERT INTO app.users")
+    assert sorted(zip(parameters[::2], parameters[1::2])) == [
+        (7, "d"),
+        (42, "a"),
+        (43, "b"),
+        (44, "c"),
+    ]
+
+
+def test_flush_skips_tables_without_identity(engine, session_class):
+    with session_class(engine) as session:
+        session.add_all(Membership(user_id=1, group=group) for group in ("x", "y"))
+        session.commit()
+
+    assert _catalog_queries(engine) == []
+    assert len(_inserts(engine)) == 1
+
+
+def test_core_insert_of_explicit_identity_skips_catalog_query(engine):
+    with engine.begin() as connection:
+        result = connection.execute(insert(User.__table__).values(id=5, name="a"))
+
+    assert result.inserted_primary_key == (5,)
+    assert _catalog_queries(engine) == []
+
+
+def test_flush_of_classes_without_batches_reads_generated_identity(
+    engine, session_class
+):
+    with session_class(engine) as session:
+        event = Event()
+        session.add(event)
+        session.flush()
+        assert event.id == 41
+        session.commit()
+
+    assert not any("ALTER TABLE" in s for s, _ in engine.dbapi_connection.statements)
+    assert len(_inserts(engine)) == 1
+
+
+def test_batches_require_mapped_classes():
+    with pytest.raises(sa_exc.ArgumentError):
+        enable_batched_identities(target=Session)
+
+
+class _PyexasolConnection:
+    options = {"dsn": "dummy", "user": "dummy", "verbose_error": False}
+
+
+class _IdentityCatalog:
+    """Last generated identity value of a table, committed by transactions."""
+
+    def __init__(self, identity):
+        self.identity = identity
+        self.version = 0
+
+
+class _IdentityCursor(FakeCursor):
+    def execute(self, statement, parameters=None):
+        connection = self.connection
+        if "EXA_ALL_COLUMNS" in statement:
+            connection.read_version = connection.catalog.version
+            connection.responses["EXA_ALL_COLUMNS"] = (
+                IDENTITY_COLUMNS,
+                [(connection.catalog.identity, "DECIMAL(18,0)")],
+            )
+        elif match := re.search(r"IDENTITY (\d+)$", statement):
+            connection.next_identity = int(match[1])
+        super().execute(statement, parameters)
+
+
+class _IdentityConnection(FakeDBAPIConnection):
+    """
+    Commits reservations of identity values, like Exasol a transaction which
+    collides with a transaction committed after its reservation is rolled back.
+    """
+
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+        self.read_version = None
+        self.next_identity = None
+
+    def cursor(self):
+        return _IdentityCursor(self)
+
+    def commit(self):
+        next_identity, self.next_identity = self.next_identity, None
+        if next_identity is None:
+            return
+        if self.catalog.version != self.read_version:
+            raise ExaQueryError(
+                _PyexasolConnection(),
+                "COMMIT",
+                "40001",
+                "GlobalTransactionRollback msg: Transaction collision",
+            )
+        self.catalog.identity = next_identity - 1
+        self.catalog.version += 1
+
+    def rollback(self):
+        self.next_identity = None
+
+
+def test_concurrent_sessions_never_share_identity_values(
+    make_fake_engine, session_class
+):
+    catalog = _IdentityCatalog(41)
+    engines = [
+        make_fake_engine(dbapi_connection=_IdentityConnection(catalog))
+        for _ in range(3)
+    ]
+
+    first, second = session_class(engines[0]), session_class(engines[1])
+    first.add_all(User(name=name) for name in ("a", "b", "c"))
+    second.add_all(User(name=name) for name in ("d", "e"))
+    first.flush()
+    second.flush()
+    first.commit()
+    with pytest.raises(Exception) as exc_info:
+        second.commit()
+    first.close()
+    second.close()
+
+    assert is_retryable_error(exc_info.value)
+    assert catalog.identity == 44
+    # the retry of the second session reserves values behind the first one
+    with session_class(engines[2]) as retry:
+        users = [User(name=name) for name in ("d", "e")]
+        retry.add_all(users)
+        retry.flush()
+        assert [user.id for user in users] == [45, 46]
+        retry.commit()
+    assert catalog.identity == 46
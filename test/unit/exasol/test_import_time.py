@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+# Share of the time needed to import sqlalchemy_exasol spent in its own modules,
+# the remainder is spent importing SQLAlchemy and the standard library.
+IMPORT_TIME_BUDGET = 0.25
+
+LAZY_MODULES = ("pyexasol", "exasol", "websocket", "cryptography", "sqlite3")
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    """Self and cumulative import time in microseconds per imported module."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sqlalchemy_exasol"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+
+def test_driver_is_not_imported(import_times):
+    imported = [
+        module for module in import_times if module.split(".")[0] in LAZY_MODULES
+    ]
+
+    assert imported == []
+
+
+def test_import_time_is_within_budget(import_times):
+    own_time = sum(
+        self_time
+        for module, (self_time, _) in import_times.items()
+        if module.split(".")[0] == "sqlalchemy_exasol"
+    )
+    _, total_time = import_times["sqlalchemy_exasol"]
+
+    assert own_time <= total_time * IMPORT_TIME_BUDGET
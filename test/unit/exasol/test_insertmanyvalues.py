@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+)
+
+from sqlalchemy_exasol.base import EXADialect
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String(2000)),
+    )
+
+
+@pytest.fixture
+def engine(make_fake_engine, monkeypatch):
+    monkeypatch.setattr(EXADialect, "insertmanyvalues_max_bytes", 10_000)
+    return make_fake_engine()
+
+
+def _inserts(engine):
+    return [
+        parameters
+        for statement, parameters in engine.dbapi_connection.statements
+        if statement.startswith("INSERT")
+    ]
+
+
+def _rows(count, width):
+    return [{"id": i, "name": "x" * width} for i in range(count)]
+
+
+def test_narrow_rows_are_inserted_in_one_statement(engine, table):
+    with engine.begin() as connection:
+        result = connection.execute(insert(table), _rows(500, 1))
+
+    assert result.rowcount == 500
+    [parameters] = _inserts(engine)
+    assert len(parameters) == 1000
+    assert engine.dbapi_connection.executemany_calls == []
+
+
+def test_page_size_adapts_to_row_width(engine, table):
+    with engine.begin() as connection:
+        result = connection.execute(insert(table), _rows(50, 1000))
+
+    assert result.rowcount == 50
+    # rows of about 1 kB in pages of at most 10 kB
+    assert [len(parameters) // 2 for parameters in _inserts(engine)] == [9] * 5 + [5]
+
+
+def test_page_size_adapts_to_parameters_per_row(engine, monkeypatch):
+    monkeypatch.setattr(EXADialect, "insertmanyvalues_max_parameters", 500)
+    wide_table = Table(
+        "wide",
+        MetaData(),
+        *(Column(f"c{column}", Integer) for column in range(50)),
+    )
+
+    with engine.begin() as connection:
+        result = connection.execute(
+            insert(wide_table),
+            [{f"c{column}": 1 for column in range(50)} for _ in range(25)],
+        )
+
+    assert result.rowcount == 25
+    assert result.context.execution_options["insertmanyvalues_page_size"] == 10
+    assert [len(parameters) for parameters in _inserts(engine)] == [500, 500, 250]
+
+
+def test_explicit_page_size_is_kept(engine, table):
+    with engine.begin() as connection:
+        connection.execution_options(insertmanyvalues_page_size=20).execute(
+            insert(table), _rows(50, 1000)
+        )
+
+    assert [len(parameters) // 2 for parameters in _inserts(engine)] == [20, 20, 10]
+
+
+def test_insertmanyvalues_can_be_disabled(make_fake_engine, table):
+    engine = make_fake_engine(use_insertmanyvalues=False)
+
+    with engine.begin() as connection:
+        connection.execute(insert(table), _rows(3, 1))
+
+    assert len(engine.dbapi_connection.executemany_calls) == 1
@@ -0,0 +1,110 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    Table,
+    select,
+)
+
+from sqlalchemy_exasol.metrics import (
+    FIELDS,
+    MeasuredCursor,
+    MetricsRegistry,
+    StatementMetrics,
+    measure_processor,
+)
+from sqlalchemy_exasol.websocket import TimestampParser
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "big", MetaData(), Column("id", Integer), Column("amount", Numeric(18, 2))
+    )
+
+
+def _make_engine(make_fake_engine, **kwargs):
+    engine = make_fake_engine(**kwargs)
+    engine.dbapi_connection.responses["FROM big"] = (
+        ["ID", "AMOUNT"],
+        [(i, "1.50") for i in range(10)],
+    )
+    return engine
+
+
+def test_metrics_are_disabled_by_default(make_fake_engine, table):
+    engine = _make_engine(make_fake_engine)
+
+    with engine.connect() as connection:
+        result = connection.execute(select(table))
+        result.all()
+
+    assert engine.dialect.metrics is None
+    assert not isinstance(result.context.cursor, MeasuredCursor)
+
+
+def test_metrics_are_recorded_per_statement(make_fake_engine, table):
+    engine = _make_engine(make_fake_engine, metrics=True)
+    statement = select(table).where(table.c.id > 0)
+
+    with engine.connect() as connection:
+        for _ in range(2):
+            rows = connection.execute(statement).all()
+
+    assert len(rows) == 10
+    snapshot = engine.dialect.metrics.snapshot()
+    [key] = [key for key in snapshot if "FROM big" in key]
+    values = snapshot[key]
+    assert set(values) == set(FIELDS)
+    assert values["executions"] == 2
+    assert values["compilations"] == 1
+    assert values["rows"] == 20
+    # estimated as in the JSON messages: [0,"1.50"]
+    assert values["bytes"] == 20 * 13
+    for field in ("compile_time", "execute_time", "fetch_time", "processing_time"):
+        assert values[field] > 0, field
+
+
+def test_registry_can_be_shared_and_reset(make_fake_engine, table):
+    registry = MetricsRegistry()
+    engines = [_make_engine(make_fake_engine, metrics=registry) for _ in range(2)]
+
+    for engine in engines:
+        assert engine.dialect.metrics is registry
+        with engine.connect() as connection:
+            connection.execute(select(table)).all()
+
+    [values] = [
+        values for key, values in registry.snapshot().items() if "FROM big" in key
+    ]
+    assert values["executions"] == 2
+    registry.reset()
+    assert registry.snapshot() == {}
+
+
+def test_batch_processors_are_measured_per_batch():
+    metrics = StatementMetrics()
+    processor = measure_processor(TimestampParser(), metrics)
+
+    values = processor.process_batch(["2024-01-02 03:04:05", None])
+
+    assert values == [datetime.datetime(2024, 1, 2, 3, 4, 5), None]
+    assert metrics.as_dict()["processing_time"] > 0
+
+
+def test_processing_times_of_threads_are_summed_up():
+    metrics = StatementMetrics()
+
+    def add(_):
+        for _ in range(1000):
+            metrics.add_processing_time(1)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(add, range(8)))
+
+    assert metrics.as_dict()["processing_time"] == 8000
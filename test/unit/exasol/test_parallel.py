@@ -0,0 +1,338 @@
+import csv
+import datetime
+import decimal
+import io
+import multiprocessing
+import time
+
+import pyexasol
+import pytest
+from fakes import (
+    FakeDBAPIConnection,
+    FakePyexasolConnection,
+)
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+)
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import select
+
+from sqlalchemy_exasol import parallel
+from sqlalchemy_exasol.types import (
+    EXATimestamp,
+    EXATimestring,
+)
+
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:This process .* is multi-threaded:DeprecationWarning"
+)
+
+_PARTITIONS = {
+    "10.0.0.1": "ID,NAME,AMOUNT,CREATED\n1,a,1.50,2024-01-02 03:04:05.000006\n",
+    "10.0.0.2": "ID,NAME,AMOUNT,CREATED\n2,b,,2024-01-02 03:04:05.000000\n3,,2,\n",
+}
+
+
+class _FakeHttpTransport:
+    """Serves the canned partition of a node instead of receiving it from Exasol."""
+
+    def __init__(self, ipaddr, port, compression=False, encryption=True):
+        self.ipaddr = ipaddr
+        self.exa_address = f"{ipaddr}:{port}"
+
+    def export_to_callback(self, callback, dst, callback_params=None):
+        data = io.BytesIO(_PARTITIONS[self.ipaddr].encode("utf-8"))
+        return callback(data, dst, **(callback_params or {}))
+
+    def import_from_callback(self, callback, src, callback_params=None):
+        pipe = _ImportPipe(_IMPORT_DIRECTORY / self.ipaddr)
+        result = callback(pipe, src, **(callback_params or {}))
+        pipe.close()
+        return result
+
+
+class _BlockedHttpTransport(_FakeHttpTransport):
+    """Waits for Exasol to connect, which it doesn't after a failed statement."""
+
+    def export_to_callback(self, callback, dst, callback_params=None):
+        time.sleep(_BLOCKED_SECONDS)
+
+    def import_from_callback(self, callback, src, callback_params=None):
+        time.sleep(_BLOCKED_SECONDS)
+
+
+_BLOCKED_SECONDS = 30
+
+
+# directory receiving the imported CSV data, set before the workers are forked
+_IMPORT_DIRECTORY = None
+
+
+class _ImportPipe(io.BytesIO):
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            self.path.write_bytes(self.getvalue())
+        super().close()
+
+
+def _collect_rows(rows):
+    return list(rows)
+
+
+def _collect_arrow(batches):
+    return [batch.to_pylist() for batch in batches]
+
+
+@pytest.fixture
+def pyexasol_connection(monkeypatch):
+    monkeypatch.setattr(pyexasol, "http_transport", _FakeHttpTransport)
+    return FakePyexasolConnection()
+
+
+@pytest.fixture
+def engine(make_fake_engine, pyexasol_connection):
+    return make_fake_engine(dbapi_connection=FakeDBAPIConnection(pyexasol_connection))
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "events",
+        MetaData(),
+        Column("id", Integer),
+        Column("name", String(20)),
+        Column("amount", Numeric(18, 2)),
+        Column("created", DateTime),
+    )
+
+
+def _export(engine, query, consumer, **kwargs):
+    with engine.connect() as connection:
+        return parallel.export_parallel(
+            connection,
+            query,
+            consumer,
+            workers=2,
+            mp_context=multiprocessing.get_context("fork"),
+            **kwargs,
+        )
+
+
+def test_export_parallel_passes_partitions_to_consumers(
+    engine, table, pyexasol_connection
+):
+    query = select(table).where(table.c.name != "it's").limit(10)
+
+    partitions = _export(engine, query, _collect_rows)
+
+    assert partitions == [
+        [
+            (
+                1,
+                "a",
+                decimal.Decimal("1.50"),
+                datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+            )
+        ],
+        [
+            (2, "b", None, datetime.datetime(2024, 1, 2, 3, 4, 5)),
+            (3, None, decimal.Decimal("2.00"), None),
+        ],
+    ]
+    [(addresses, sql, export_params)] = pyexasol_connection.parallel_exports
+    assert addresses == ["10.0.0.1:8563", "10.0.0.2:8563"]
+    assert "events.name != 'it''s'" in sql
+    assert sql.rstrip().endswith("LIMIT 10")
+    assert export_params == {"with_column_names": True}
+
+
+def test_export_parallel_as_arrow_batches(engine, table):
+    pytest.importorskip("pyarrow")
+
+    partitions = _export(engine, select(table), _collect_arrow, output="arrow")
+
+    assert partitions[0] == [
+        [
+            {
+                "id": 1,
+                "name": "a",
+                "amount": decimal.Decimal("1.50"),
+                "created": datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+            }
+        ]
+    ]
+
+
+def test_export_parallel_requires_http_transport(engine, table):
+    engine.dialect.supports_http_transport = False
+
+    with pytest.raises(sa_exc.InvalidRequestError):
+        _export(engine, select(table), _collect_rows)
+
+
+@pytest.mark.parametrize("kwargs", [{"output": "json"}, {"workers": 0}], ids=str)
+def test_export_parallel_validates_arguments(engine, table, kwargs):
+    kwargs = {"workers": 2, **kwargs}
+
+    with pytest.raises(sa_exc.ArgumentError):
+        with engine.connect() as connection:
+            parallel.export_parallel(connection, select(table), _collect_rows, **kwargs)
+
+
+def _fail(rows):
+    raise ValueError("consumer failed")
+
+
+def test_export_parallel_raises_errors_of_consumers(engine, table):
+    with pytest.raises(ValueError, match="consumer failed"):
+        _export(engine, select(table), _fail)
+
+
+@pytest.fixture
+def failing_engine(make_fake_engine, monkeypatch):
+    monkeypatch.setattr(pyexasol, "http_transport", _BlockedHttpTransport)
+    pyexasol_connection = FakePyexasolConnection(error=RuntimeError("statement failed"))
+    return make_fake_engine(dbapi_connection=FakeDBAPIConnection(pyexasol_connection))
+
+
+def test_export_parallel_raises_errors_of_the_statement(failing_engine, table):
+    start = time.monotonic()
+
+    with pytest.raises(RuntimeError, match="statement failed"):
+        _export(failing_engine, select(table), _collect_rows)
+    assert time.monotonic() - start < _BLOCKED_SECONDS
+
+
+@pytest.fixture
+def import_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(f"{__name__}._IMPORT_DIRECTORY", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def load_table():
+    return Table(
+        "measurements",
+        MetaData(),
+        Column("id", Integer),
+        Column("name", String(20)),
+        Column("amount", Numeric(18, 2)),
+        Column("valid_from", Date),
+        Column("created", EXATimestamp),
+        Column("duration", EXATimestring),
+        schema="my_schema",
+    )
+
+
+def _third_partition():
+    return [(4, None, None, None, None, None)]
+
+
+def _read_import(import_directory, ipaddr):
+    with open(import_directory / ipaddr, newline="") as csv_file:
+        return list(csv.reader(csv_file))
+
+
+def _load(engine, load_table, partitions, **kwargs):
+    with engine.begin() as connection:
+        return parallel.bulk_load(
+            connection,
+            load_table,
+            partitions,
+            mp_context=multiprocessing.get_context("fork"),
+            **kwargs,
+        )
+
+
+def test_bulk_load_streams_partitions_into_one_import(
+    engine, load_table, pyexasol_connection, import_directory
+):
+    partitions = [
+        [
+            {
+                "id": 1,
+                "name": "a",
+                "amount": decimal.Decimal("1.5"),
+                "valid_from": datetime.date(2024, 1, 2),
+                "created": datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+                "duration": datetime.time(1, 2, 3),
+            },
+        ],
+        [(2, "b", None, None, None, None), (3, "c", 2, None, None, "x")],
+        _third_partition,
+    ]
+
+    rowcount = _load(engine, load_table, partitions, workers=2)
+
+    assert rowcount == 4
+    [(addresses, target, import_params)] = pyexasol_connection.parallel_imports
+    assert addresses == ["10.0.0.1:8563", "10.0.0.2:8563"]
+    assert target == ("MY_SCHEMA", "MEASUREMENTS")
+    assert import_params["columns"] == [
+        "ID",
+        "NAME",
+        "AMOUNT",
+        "VALID_FROM",
+        "CREATED",
+        "DURATION",
+    ]
+    assert import_params["csv_cols"][3:5] == [
+        "4 FORMAT='YYYY-MM-DD'",
+        "5 FORMAT='YYYY-MM-DD HH24:MI:SS.FF6'",
+    ]
+    # partitions are distributed round robin over the workers
+    assert _read_import(import_directory, "10.0.0.1") == [
+        ["1", "a", "1.5", "2024-01-02", "2024-01-02 03:04:05.000006", "01:02:03"],
+        ["4", "", "", "", "", ""],
+    ]
+    assert _read_import(import_directory, "10.0.0.2") == [
+        ["2", "b", "", "", "", ""],
+        ["3", "c", "2", "", "", "x"],
+    ]
+
+
+def test_bulk_load_of_selected_columns(
+    engine, load_table, pyexasol_connection, import_directory
+):
+    rowcount = _load(engine, load_table, [[(1, "a")]], columns=["id", "name"])
+
+    assert rowcount == 1
+    [(_, _, import_params)] = pyexasol_connection.parallel_imports
+    assert import_params == {"columns": ["ID", "NAME"]}
+    assert _read_import(import_directory, "10.0.0.1") == [["1", "a"]]
+
+
+def test_bulk_load_rejects_rows_of_wrong_length(engine, load_table, import_directory):
+    with pytest.raises(ValueError, match="Expected 6 values per row, got 2"):
+        _load(engine, load_table, [[(1, "a")]])
+
+
+def test_bulk_load_rejects_rows_missing_a_column(engine, load_table, import_directory):
+    with pytest.raises(sa_exc.ArgumentError, match="required for column 'name'"):
+        _load(engine, load_table, [[{"id": 1}]], columns=["id", "name"])
+
+
+def test_bulk_load_requires_unquoted_identifiers(engine):
+    table = Table("MixedCase", MetaData(), Column("id", Integer))
+
+    with pytest.raises(sa_exc.ArgumentError):
+        _load(engine, table, [[(1,)]])
+
+
+def test_bulk_load_raises_errors_of_the_statement(failing_engine, load_table):
+    start = time.monotonic()
+
+    with pytest.raises(RuntimeError, match="statement failed"):
+        _load(failing_engine, load_table, [[(1,)], [(2,)]], columns=["id"], workers=2)
+    assert time.monotonic() - start < _BLOCKED_SECONDS
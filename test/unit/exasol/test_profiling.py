@@ -0,0 +1,144 @@
+import pytest
+from sqlalchemy import (
+    event,
+    text,
+)
+
+from sqlalchemy_exasol.profiling import (
+    PROFILE_OPTION,
+    ProfilePart,
+)
+
+PROFILE_ROWS = [
+    (12, "SELECT", 1, "COMPILE / EXECUTE", None, None, None, None, None, 0.01)
+    + (None,) * 7,
+    (12, "SELECT", 2, "SCAN", None, "MY_SCHEMA", "BIG", 10, 10, 0.25)
+    + (None, None, 100.0, 0.5)
+    + (None,) * 3,
+]
+
+
+@pytest.fixture
+def engine(make_fake_engine):
+    engine = make_fake_engine()
+    responses = engine.dbapi_connection.responses
+    responses["CURRENT_STATEMENT"] = (["CURRENT_STATEMENT"], [(10,)])
+    responses["EXA_USER_PROFILE_LAST_DAY"] = (
+        [field.upper() for field in ProfilePart._fields],
+        PROFILE_ROWS,
+    )
+    responses["FROM big"] = (["ID"], [(i,) for i in range(10)])
+    return engine
+
+
+def _statements_since(engine, marker):
+    statements = [statement for statement, _ in engine.dbapi_connection.statements]
+    return statements[statements.index(marker) :]
+
+
+def test_profile_is_attached_to_result(engine):
+    with engine.connect() as connection:
+        result = connection.execute(
+            text("SELECT id FROM big").execution_options(**{PROFILE_OPTION: True})
+        )
+        rows = result.all()
+
+    assert rows == [(i,) for i in range(10)]
+    assert result.context.exasol_profile == [ProfilePart(*row) for row in PROFILE_ROWS]
+    assert result.context.exasol_profile[1].object_name == "BIG"
+    assert result.context.exasol_profile[1].percentage_in_memory == 100.0
+    statements = _statements_since(engine, "SELECT CURRENT_STATEMENT")
+    assert statements[:6] == [
+        "SELECT CURRENT_STATEMENT",
+        "ALTER SESSION SET PROFILE = 'ON'",
+        "SELECT id FROM big",
+        "ALTER SESSION SET PROFILE = 'OFF'",
+        "FLUSH STATISTICS",
+        statements[5],
+    ]
+    assert "EXA_USER_PROFILE_LAST_DAY" in statements[5]
+    assert engine.dbapi_connection.statements[-1][1] == [10]
+
+
+def test_statements_are_not_profiled_by_default(engine):
+    with engine.connect() as connection:
+        result = connection.execute(text("SELECT id FROM big"))
+
+    assert result.context.exasol_profile is None
+    assert not any(
+        "PROFILE" in statement for statement, _ in engine.dbapi_connection.statements
+    )
+
+
+def test_profile_is_available_to_events(engine):
+    profiles = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        profiles.append(context.exasol_profile)
+
+    with engine.connect() as connection:
+        connection.execution_options(**{PROFILE_OPTION: True}).execute(
+            text("SELECT id FROM big")
+        )
+
+    assert [len(profile) for profile in profiles] == [2]
+
+
+class _FailingCursor:
+    def __init__(self, cursor, marker):
+        self._cursor = cursor
+        self._marker = marker
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def execute(self, statement, parameters=None):
+        self._cursor.execute(statement, parameters)
+        if self._marker in statement:
+            raise RuntimeError("boom")
+
+
+def test_profiling_is_switched_off_after_errors(engine, monkeypatch):
+    connection = engine.dbapi_connection
+    cursor = connection.cursor
+    monkeypatch.setattr(
+        connection, "cursor", lambda: _FailingCursor(cursor(), "INSERT INTO")
+    )
+
+    with engine.connect() as sa_connection:
+        with pytest.raises(Exception, match="boom"):
+            sa_connection.execution_options(**{PROFILE_OPTION: True}).execute(
+                text("INSERT INTO big VALUES (1)")
+            )
+
+    statements = _statements_since(engine, "ALTER SESSION SET PROFILE = 'ON'")
+    assert statements[:3] == [
+        "ALTER SESSION SET PROFILE = 'ON'",
+        "INSERT INTO big VALUES (1)",
+        "ALTER SESSION SET PROFILE = 'OFF'",
+    ]
+
+
+def test_profiles_without_in_memory_share(engine, monkeypatch):
+    connection = engine.dbapi_connection
+    cursor = connection.cursor
+    # databases without the column fail the profile query which selects it
+    monkeypatch.setattr(
+        connection, "cursor", lambda: _FailingCursor(cursor(), "percentage_in_memory")
+    )
+    index = ProfilePart._fields.index("percentage_in_memory")
+    columns, rows = connection.responses["EXA_USER_PROFILE_LAST_DAY"]
+    connection.responses["EXA_USER_PROFILE_LAST_DAY"] = (
+        columns[:index] + columns[index + 1 :],
+        [row[:index] + row[index + 1 :] for row in rows],
+    )
+
+    with engine.connect() as sa_connection:
+        result = sa_connection.execute(
+            text("SELECT id FROM big").execution_options(**{PROFILE_OPTION: True})
+        )
+
+    [_, scan] = result.context.exasol_profile
+    assert scan.percentage_in_memory is None
+    assert (scan.object_name, scan.duration, scan.hdd_read) == ("BIG", 0.25, 0.5)
@@ -0,0 +1,146 @@
+import datetime
+import decimal
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import (
+    Float,
+    Numeric,
+)
+
+from sqlalchemy_exasol.types import ExaDecimal
+from sqlalchemy_exasol.websocket import (
+    DateTime,
+    EXADialect_websocket,
+)
+
+
+@pytest.fixture
+def to_datetime():
+    return DateTime().result_processor(EXADialect_websocket(), None)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-03-31 02:30:00", datetime.datetime(2024, 3, 31, 2, 30)),
+        ("2024-01-02 03:04:05.123", datetime.datetime(2024, 1, 2, 3, 4, 5, 123000)),
+        ("2024-01-02 03:04:05.000006", datetime.datetime(2024, 1, 2, 3, 4, 5, 6)),
+        ("2024-01-02 03:04:05.1", datetime.datetime(2024, 1, 2, 3, 4, 5, 100000)),
+        (
+            "2024-01-02 03:04:05.123456789",
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 123456),
+        ),
+        (None, None),
+    ],
+)
+def test_datetime_result_processor(to_datetime, value, expected):
+    assert to_datetime(value) == expected
+
+
+def test_datetime_result_processor_handles_changing_formats(to_datetime):
+    values = ["2024-01-02 03:04:05", "2024-01-02 03:04:05.5", None]
+
+    assert [to_datetime(value) for value in values] == [
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 500000),
+        None,
+    ]
+
+
+def test_datetime_batch_processing(to_datetime):
+    parsed = datetime.datetime(2024, 1, 2, 3, 4, 5, 6)
+    values = [None, "2024-01-02 03:04:05.000006", parsed, "2024-01-02 03:04:05"]
+
+    assert to_datetime.process_batch(values) == [
+        None,
+        parsed,
+        parsed,
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+    ]
+    assert to_datetime.process_batch((None, None)) == [None, None]
+
+
+def test_datetime_result_processor_is_shared_by_threads(to_datetime):
+    # values of different lengths, as of TIMESTAMP(0) and TIMESTAMP(6) columns
+    values = [f"2024-01-02 03:04:{second:02}" for second in range(60)] + [
+        f"2024-01-02 03:04:05.{micros:06}" for micros in range(60)
+    ]
+    expected = [datetime.datetime.fromisoformat(value) for value in values]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(
+                lambda values: [to_datetime(value) for value in values],
+                [values, values[::-1]] * 50,
+            )
+        )
+
+    assert results == [expected, expected[::-1]] * 50
+
+
+def _decimal_processor(type_, **dialect_kwargs):
+    dialect = EXADialect_websocket(**dialect_kwargs)
+    return type_.dialect_impl(dialect).result_processor(dialect, None)
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (Numeric(18, 2), "12.50", decimal.Decimal("12.50")),
+        (Numeric(18, 2), 12.5, decimal.Decimal("12.50")),
+        (Numeric(18, 0), 12, decimal.Decimal(12)),
+        (Numeric(), 0.1, decimal.Decimal("0.1000000000")),
+        (Numeric(18, 2), None, None),
+        (Numeric(18, 2, asdecimal=False), "12.50", 12.5),
+        (Float(), 12.5, 12.5),
+    ],
+    ids=repr,
+)
+def test_decimal_result_processor(type_, value, expected):
+    processor = _decimal_processor(type_)
+
+    actual = processor(value)
+
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+def test_decimal_result_processor_returns_given_decimals():
+    value = decimal.Decimal("1.5")
+
+    assert _decimal_processor(Numeric(18, 2))(value) is value
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (Numeric(18, 0), "12", 12),
+        (
+            Numeric(36, 0),
+            "123456789012345678901234567890",
+            123456789012345678901234567890,
+        ),
+        (Numeric(36, 0), decimal.Decimal(12), 12),
+        (Numeric(15, 2), "12.50", 12.5),
+        (Numeric(15, 2), None, None),
+        # a float can't represent all values of these types exactly
+        (Numeric(16, 2), "12.50", decimal.Decimal("12.50")),
+        (Numeric(), 12.5, decimal.Decimal("12.5000000000")),
+    ],
+    ids=repr,
+)
+def test_fast_decimals(type_, value, expected):
+    processor = _decimal_processor(type_, fast_decimals=True)
+
+    actual = processor(value)
+
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+def test_fast_decimals_is_used_by_engines(make_fake_engine):
+    engine = make_fake_engine(fast_decimals=True)
+
+    assert engine.dialect.fast_decimals is True
+    assert isinstance(Numeric(18, 0).dialect_impl(engine.dialect), ExaDecimal)
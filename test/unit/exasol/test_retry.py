@@ -0,0 +1,196 @@
+import pytest
+from fakes import (
+    FakeCursor,
+    FakeDBAPIConnection,
+)
+from pyexasol.exceptions import ExaQueryError
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    exc,
+    func,
+    insert,
+    select,
+    text,
+)
+
+from sqlalchemy_exasol.fake_server import FakeServer
+from sqlalchemy_exasol.retry import (
+    RetryPolicy,
+    is_retryable_error,
+)
+
+COLLISION = (
+    "40001",
+    "GlobalTransactionRollback msg: Transaction collision: automatic transaction "
+    "rollback.",
+)
+NO_BACKOFF = RetryPolicy(max_attempts=3, initial_backoff=0)
+
+
+class _Connection:
+    options = {"dsn": "dummy", "user": "dummy", "verbose_error": False}
+
+
+def _wrapped(error):
+    """The error as raised by SQLAlchemy for the websocket driver."""
+    try:
+        try:
+            raise error
+        except Exception as e:
+            raise RuntimeError() from e
+    except RuntimeError as e:
+        return exc.DBAPIError("INSERT", None, e)
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (ExaQueryError(_Connection(), "INSERT", "40001", "collision"), True),
+        (ExaQueryError(_Connection(), "INSERT", "42000", COLLISION[1]), True),
+        (ExaQueryError(_Connection(), "INSERT", "42000", "syntax error"), False),
+        (ValueError("40001"), False),
+    ],
+)
+def test_is_retryable_error(error, expected):
+    assert is_retryable_error(error) is expected
+    assert is_retryable_error(_wrapped(error)) is expected
+
+
+def test_backoff_grows_up_to_the_maximum(monkeypatch):
+    monkeypatch.setattr("random.uniform", lambda low, high: high)
+    policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.5)
+
+    assert [policy.backoff(retry) for retry in range(1, 5)] == [0.1, 0.2, 0.4, 0.5]
+
+
+def test_call_gives_up_after_max_attempts():
+    calls = []
+
+    def collide():
+        calls.append(1)
+        raise _wrapped(ExaQueryError(_Connection(), "INSERT", *COLLISION))
+
+    with pytest.raises(exc.DBAPIError):
+        NO_BACKOFF.call(collide)
+    assert len(calls) == 3
+
+
+@pytest.fixture
+def server():
+    with FakeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def table():
+    return Table("items", MetaData(), Column("id", Integer))
+
+
+def _engine(server, table, **kwargs):
+    engine = create_engine(server.url, **kwargs)
+    with engine.begin() as connection:
+        table.create(connection)
+    return engine
+
+
+def _count(engine, table):
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(table)).scalar()
+
+
+def test_statements_are_retried_with_the_execution_option(server, table):
+    engine = _engine(server, table, metrics=True)
+    server.add_error("INSERT INTO items", *COLLISION, times=2)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(table).values(id=1), execution_options={"exasol_retry": NO_BACKOFF}
+        )
+
+    assert _count(engine, table) == 1
+    [statement] = [key for key in engine.dialect.metrics.snapshot() if "INSERT" in key]
+    assert engine.dialect.metrics.snapshot()[statement]["retries"] == 2
+    engine.dispose()
+
+
+def test_statements_are_not_retried_after_other_statements(server, table):
+    engine = _engine(server, table, connect_args={"autocommit": False})
+    server.add_error("INSERT INTO items", *COLLISION)
+
+    with pytest.raises(exc.DBAPIError) as exc_info:
+        with engine.begin() as connection:
+            connection.execute(select(table)).all()
+            connection.execute(
+                insert(table).values(id=1),
+                execution_options={"exasol_retry": NO_BACKOFF},
+            )
+
+    assert engine.dialect.is_retryable(exc_info.value)
+    engine.dispose()
+
+
+def test_transactions_are_run_again(server, table):
+    engine = _engine(server, table)
+    server.add_error("INSERT INTO items", *COLLISION)
+    attempts = []
+
+    def work(connection):
+        attempts.append(connection.execute(select(table)).all())
+        connection.execute(insert(table).values(id=1))
+
+    NO_BACKOFF.run(engine, work)
+
+    assert len(attempts) == 2
+    assert _count(engine, table) == 1
+    engine.dispose()
+
+
+def test_other_errors_are_not_retried(server, table):
+    engine = _engine(server, table)
+    attempts = []
+
+    def work(connection):
+        attempts.append(1)
+        connection.execute(text("SELECT * FROM missing"))
+
+    with pytest.raises(exc.DBAPIError):
+        NO_BACKOFF.run(engine, work)
+    assert len(attempts) == 1
+    engine.dispose()
+
+
+class _CollidingCursor(FakeCursor):
+    """Fails the second INSERT with a transaction collision."""
+
+    def execute(self, statement, parameters=None):
+        super().execute(statement, parameters)
+        inserts = [s for s, _ in self.connection.statements if s.startswith("INSERT")]
+        if statement.startswith("INSERT") and len(inserts) == 2:
+            raise ExaQueryError(_Connection(), statement, *COLLISION)
+
+
+class _CollidingConnection(FakeDBAPIConnection):
+    def cursor(self):
+        return _CollidingCursor(self)
+
+
+def test_later_pages_of_insertmanyvalues_are_not_retried(make_fake_engine, table):
+    engine = make_fake_engine(dbapi_connection=_CollidingConnection())
+
+    with pytest.raises(exc.DBAPIError) as exc_info:
+        with engine.begin() as connection:
+            connection.execution_options(
+                insertmanyvalues_page_size=1, exasol_retry=NO_BACKOFF
+            ).execute(insert(table), [{"id": 1}, {"id": 2}, {"id": 3}])
+
+    assert engine.dialect.is_retryable(exc_info.value)
+    # the collision rolled back the first page, so the second one isn't retried
+    assert [
+        parameters
+        for statement, parameters in engine.dbapi_connection.statements
+        if statement.startswith("INSERT")
+    ] == [(1,), (2,)]
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import (
+    create_engine,
+    exc,
+    text,
+)
+
+from sqlalchemy_exasol.fake_server import FakeServer
+
+
+@pytest.fixture
+def server():
+    with FakeServer() as server:
+        yield server
+
+
+@pytest.fixture
+def engine(server):
+    engine = create_engine(server.url, pool_size=1, max_overflow=0)
+    with engine.connect() as connection:
+        connection.execute(text("CREATE SCHEMA tenant_a"))
+        connection.execute(text("CREATE SCHEMA tenant_b"))
+    yield engine
+    engine.dispose()
+
+
+def _current_schema(connection):
+    return connection.execute(text("SELECT CURRENT_SCHEMA")).scalar()
+
+
+def _schema_statements(server):
+    return [
+        request["sqlText"]
+        for request in server.requests
+        if "SCHEMA" in request.get("sqlText", "")
+        and "CURRENT_SCHEMA" not in request["sqlText"]
+    ]
+
+
+def test_tenants_share_one_pooled_connection(server, engine):
+    del server.requests[:]
+    for tenant in ("TENANT_A", "TENANT_B", "TENANT_A"):
+        with engine.connect().execution_options(exasol_schema=tenant) as connection:
+            assert _current_schema(connection) == tenant
+
+    assert [request.get("command") for request in server.requests].count("login") == 0
+
+
+def test_schema_is_only_opened_when_it_differs(server, engine):
+    with engine.connect() as connection:
+        del server.requests[:]
+        connection = connection.execution_options(exasol_schema="tenant_a")
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 1"))
+        connection.execution_options(exasol_schema="my_schema").execute(
+            text("SELECT 1")
+        )
+
+    assert _schema_statements(server) == [
+        'OPEN SCHEMA "TENANT_A"',
+        'OPEN SCHEMA "MY_SCHEMA"',
+    ]
+
+
+def test_schema_is_restored_on_checkin(server, engine):
+    with engine.connect().execution_options(exasol_schema="tenant_b") as connection:
+        connection.execute(text("SELECT 1"))
+
+    with engine.connect() as connection:
+        assert _current_schema(connection) == "MY_SCHEMA"
+    assert _schema_statements(server)[-2:] == [
+        'OPEN SCHEMA "TENANT_B"',
+        'OPEN SCHEMA "MY_SCHEMA"',
+    ]
+
+
+def test_schema_option_applies_to_engines(server, engine):
+    tenant_engine = engine.execution_options(exasol_schema="tenant_a")
+
+    with tenant_engine.connect() as connection:
+        assert _current_schema(connection) == "TENANT_A"
+    with engine.connect() as connection:
+        assert _current_schema(connection) == "MY_SCHEMA"
+
+
+def test_failing_schema_is_raised_as_dbapi_error(server, engine):
+    server.add_error('OPEN SCHEMA "MISSING"', "42000", "schema MISSING not found")
+
+    with pytest.raises(exc.DBAPIError) as exc_info:
+        with engine.connect().execution_options(exasol_schema="missing") as connection:
+            connection.execute(text("SELECT 1"))
+
+    assert exc_info.value.statement == 'OPEN SCHEMA "MISSING"'
+    with engine.connect() as connection:
+        assert _current_schema(connection) == "MY_SCHEMA"
@@ -0,0 +1,93 @@
+import pytest
+from fakes import (
+    DEFAULT_FETCH_SIZE_BYTES,
+    FakeCursor,
+    FakeDBAPIConnection,
+    FakePyexasolConnection,
+)
+from sqlalchemy import (
+    literal_column,
+    select,
+    table,
+    text,
+)
+
+from sqlalchemy_exasol.base import FETCH_SIZE_BYTES_OPTION
+
+
+class _RecordingCursor(FakeCursor):
+    """Records how rows are fetched and the fetch size of executed statements."""
+
+    def execute(self, statement, parameters=None):
+        self.connection.fetch_sizes.append(
+            self.connection.connection.options["fetch_size_bytes"]
+        )
+        super().execute(statement, parameters)
+
+    def fetchmany(self, size=None):
+        self.connection.fetches.append(("fetchmany", size))
+        return super().fetchmany(size)
+
+    def fetchall(self):
+        self.connection.fetches.append(("fetchall", None))
+        return super().fetchall()
+
+
+class _RecordingConnection(FakeDBAPIConnection):
+    def __init__(self):
+        super().__init__(FakePyexasolConnection())
+        self.fetches = []
+        self.fetch_sizes = []
+        self.responses = {"FROM big": (["ID"], [(i,) for i in range(10)])}
+
+    def cursor(self):
+        return _RecordingCursor(self)
+
+
+@pytest.fixture
+def engine(make_fake_engine):
+    return make_fake_engine(dbapi_connection=_RecordingConnection())
+
+
+def test_stream_results_uses_server_side_cursor(engine):
+    with engine.connect() as connection:
+        result = connection.execution_options(
+            stream_results=True, max_row_buffer=4
+        ).execute(text("SELECT id FROM big"))
+        is_server_side = result.context._is_server_side
+        rows = list(result)
+
+    assert is_server_side
+    assert rows == [(i,) for i in range(10)]
+    fetches = engine.dbapi_connection.fetches
+    assert ("fetchall", None) not in fetches
+    assert all(size <= 4 for _, size in fetches)
+
+
+def test_yield_per_fetches_partitions(engine):
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=3).execute(
+            select(literal_column("id")).select_from(table("big"))
+        )
+        partitions = [len(partition) for partition in result.partitions()]
+
+    assert partitions == [3, 3, 3, 1]
+    assert ("fetchall", None) not in engine.dbapi_connection.fetches
+
+
+def test_fetch_size_bytes_applies_to_single_statement(engine):
+    pyexasol_connection = engine.dbapi_connection.connection
+
+    with engine.connect() as connection:
+        connection.execute(
+            text("SELECT id FROM big").execution_options(
+                stream_results=True, **{FETCH_SIZE_BYTES_OPTION: 1024}
+            )
+        ).all()
+        connection.execute(text("SELECT id FROM big")).all()
+
+    assert engine.dbapi_connection.fetch_sizes[-2:] == [
+        1024,
+        DEFAULT_FETCH_SIZE_BYTES,
+    ]
+    assert pyexasol_connection.options["fetch_size_bytes"] == DEFAULT_FETCH_SIZE_BYTES
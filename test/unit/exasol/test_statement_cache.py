@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    event,
+    insert,
+    select,
+)
+from sqlalchemy.sql.cache_key import NO_CACHE
+
+from sqlalchemy_exasol.base import EXADialect
+from sqlalchemy_exasol.types import (
+    EXATimestamp,
+    EXATimestring,
+)
+from sqlalchemy_exasol.websocket import EXADialect_websocket
+from sqlalchemy_exasol.websocket_async import EXADialect_websocket_async
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "items",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(20)),
+        Column("price", Numeric(18, 2)),
+        Column("created", EXATimestamp),
+        Column("duration", EXATimestring),
+    )
+
+
+@pytest.mark.parametrize(
+    "dialect_cls", [EXADialect, EXADialect_websocket, EXADialect_websocket_async]
+)
+def test_dialect_supports_statement_cache(dialect_cls):
+    assert "supports_statement_cache" in dialect_cls.__dict__
+    assert dialect_cls.supports_statement_cache is True
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [
+        EXATimestamp(),
+        EXATimestring(),
+        *(EXADialect_websocket.colspecs.values()),
+    ],
+)
+def test_custom_types_produce_cache_keys(type_):
+    if isinstance(type_, type):
+        type_ = type_()
+    assert type_._static_cache_key is not NO_CACHE
+
+
+def test_cache_keys_are_stable_across_parameter_values(table):
+    def query(limit, name):
+        return (
+            select(table)
+            .where(table.c.name == name, table.c.price > 10)
+            .order_by(table.c.id)
+            .limit(limit)
+        )
+
+    first = query(5, "a")._generate_cache_key()
+    second = query(10, "b")._generate_cache_key()
+
+    assert first is not None
+    assert first == second
+    assert [p.value for p in first.bindparams] != [p.value for p in second.bindparams]
+
+
+def test_repeated_executions_hit_the_statement_cache(fake_engine, table):
+    cache_hits = []
+
+    @event.listens_for(fake_engine, "before_cursor_execute")
+    def record_cache_hit(conn, cursor, statement, parameters, context, executemany):
+        cache_hits.append(context.cache_hit)
+
+    with fake_engine.connect() as connection:
+        for limit in (1, 2, 3):
+            connection.execute(
+                select(table.c.id).where(table.c.name == "a").limit(limit)
+            ).fetchall()
+            connection.execute(
+                insert(table).values(id=limit, name="a", duration="10:00:00")
+            )
+
+    cache_miss, cache_hit = (
+        EXADialect_websocket.CACHE_MISS,
+        EXADialect_websocket.CACHE_HIT,
+    )
+    assert cache_hits == [cache_miss, cache_miss] + [cache_hit, cache_hit] * 2
+
+
+def test_cached_limit_is_rendered_with_the_current_value(fake_engine, table):
+    with fake_engine.connect() as connection:
+        for limit in (1, 2):
+            connection.execute(select(table.c.id).limit(limit).offset(limit * 10))
+
+    statements = [s for s, _ in fake_engine.dbapi_connection.statements if "LIMIT" in s]
+    assert [s.split("LIMIT", 1)[1].split() for s in statements] == [
+        ["1", "OFFSET", "10"],
+        ["2", "OFFSET", "20"],
+    ]
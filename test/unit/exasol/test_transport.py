@@ -0,0 +1,345 @@
+import datetime
+import decimal
+import io
+
+import pytest
+from fakes import (
+    FakeDBAPIConnection,
+    FakePyexasolConnection,
+)
+from pyexasol.exceptions import (
+    ExaExportError,
+    ExaRuntimeError,
+)
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+)
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import (
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+
+from sqlalchemy_exasol import transport
+from sqlalchemy_exasol.types import EXATimestamp
+
+
+@pytest.fixture
+def pyexasol_connection():
+    return FakePyexasolConnection()
+
+
+@pytest.fixture
+def engine(make_fake_engine, pyexasol_connection):
+    return make_fake_engine(
+        dbapi_connection=FakeDBAPIConnection(pyexasol_connection),
+        bulk_import_threshold=3,
+    )
+
+
+@pytest.fixture
+def table():
+    return Table(
+        "events",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("name", String(20)),
+        Column("amount", Numeric(18, 2)),
+        Column("created", DateTime),
+        Column("updated", EXATimestamp),
+        Column("valid_from", Date),
+        schema="my_schema",
+    )
+
+
+def _rows(count):
+    return [
+        {
+            "id": i,
+            "name": f"event {i}" if i else None,
+            "amount": decimal.Decimal("1E+1") * i,
+            "created": datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+            "updated": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "valid_from": datetime.date(2024, 1, 2),
+        }
+        for i in range(count)
+    ]
+
+
+def test_executemany_below_threshold_uses_dbapi(engine, table, pyexasol_connection):
+    with engine.begin() as connection:
+        result = connection.execute(insert(table), _rows(2))
+
+    assert result.rowcount == 2
+    assert pyexasol_connection.imports == []
+    # a single multi-row INSERT of "insertmanyvalues"
+    statement, parameters = engine.dbapi_connection.statements[-1]
+    assert statement.startswith("INSERT INTO my_schema.events")
+    assert len(parameters) == 12
+
+
+def test_executemany_above_threshold_imports_via_http_transport(
+    engine, table, pyexasol_connection
+):
+    with engine.begin() as connection:
+        result = connection.execute(insert(table), _rows(3))
+
+    assert result.rowcount == 3
+    assert engine.dbapi_connection.executemany_calls == []
+    [(target, import_params, rows)] = pyexasol_connection.imports
+    assert target == ("MY_SCHEMA", "EVENTS")
+    assert import_params == {
+        "columns": ["ID", "NAME", "AMOUNT", "CREATED", "UPDATED", "VALID_FROM"],
+        "csv_cols": [
+            "1",
+            "2",
+            "3",
+            "4 FORMAT='YYYY-MM-DD HH24:MI:SS.FF6'",
+            "5 FORMAT='YYYY-MM-DD HH24:MI:SS.FF6'",
+            "6 FORMAT='YYYY-MM-DD'",
+        ],
+    }
+    # values passed the bind processors of the websocket dialect first
+    assert rows[1] == [
+        1,
+        "event 1",
+        "10",
+        "2024-01-02 03:04:05.000006",
+        "2024-01-02 03:04:05.000000",
+        "2024-01-02",
+    ]
+    assert rows[0][1] is None
+
+
+@pytest.mark.parametrize(
+    "threshold, expected_imports", [(None, 0), (10, 0), (1, 1)], ids=str
+)
+def test_execution_option_overrides_threshold(
+    engine, table, pyexasol_connection, threshold, expected_imports
+):
+    with engine.begin() as connection:
+        connection.execution_options(exasol_bulk_import_threshold=threshold).execute(
+            insert(table), _rows(3)
+        )
+
+    assert len(pyexasol_connection.imports) == expected_imports
+
+
+def test_insert_with_sql_expressions_uses_dbapi(engine, table, pyexasol_connection):
+    statement = insert(table).values(name=func.upper(table.c.name))
+
+    with engine.begin() as connection:
+        connection.execute(statement, [{"id": i, "name": "x"} for i in range(3)])
+
+    assert pyexasol_connection.imports == []
+
+
+def test_tables_requiring_quotes_use_dbapi(engine, pyexasol_connection):
+    table = Table("MixedCase", MetaData(), Column("id", Integer, primary_key=True))
+
+    with engine.begin() as connection:
+        connection.execute(insert(table), [{"id": i} for i in range(3)])
+
+    assert pyexasol_connection.imports == []
+
+
+def test_import_errors_are_raised_as_database_errors(make_fake_engine, table):
+    error = ExaRuntimeError(None, "boom")
+    engine = make_fake_engine(
+        dbapi_connection=FakeDBAPIConnection(FakePyexasolConnection(error=error)),
+        bulk_import_threshold=1,
+    )
+
+    with pytest.raises(sa_exc.DatabaseError) as exc_info:
+        with engine.begin() as connection:
+            connection.execute(insert(table), _rows(3))
+    assert exc_info.value.orig is error
+
+
+class _FakeExportConnection:
+    """Answers EXPORT queries with a canned CSV stream."""
+
+    def __init__(self, csv_data="", error=None):
+        self.csv_data = csv_data
+        self.error = error
+        self.exports = []
+        self.options = {"verbose_error": False}
+
+    def export_to_callback(self, callback, dst, query_or_table, export_params=None):
+        self.exports.append((query_or_table, export_params))
+        if self.error is not None:
+            raise self.error
+        try:
+            return callback(io.BytesIO(self.csv_data.encode("utf-8")), dst)
+        except Exception as ex:
+            raise ExaExportError(None, (ex,)) from ex
+
+
+@pytest.fixture
+def export_table():
+    return Table(
+        "measurements",
+        MetaData(),
+        Column("id", Integer),
+        Column("name", String(20)),
+        Column("value", Float),
+        Column("amount", Numeric(18, 2)),
+        Column("valid", Boolean),
+        Column("day", Date),
+        Column("created", DateTime),
+    )
+
+
+_EXPORT_CSV = (
+    "ID,NAME,VALUE,AMOUNT,VALID,day,CREATED\n"
+    "1,first,1.5,12.50,1,2024-01-02,2024-01-02 03:04:05.000000\n"
+    '2,"with, comma",,,0,,\n'
+)
+
+
+def _export_engine(make_fake_engine, export_connection):
+    return make_fake_engine(dbapi_connection=FakeDBAPIConnection(export_connection))
+
+
+def test_export_stream_feeds_cursor_result(make_fake_engine, export_table):
+    export_connection = _FakeExportConnection(_EXPORT_CSV)
+    engine = _export_engine(make_fake_engine, export_connection)
+    statement = select(export_table).where(
+        export_table.c.name != "it's", export_table.c.id > 0
+    )
+
+    with engine.connect() as connection:
+        rows = (
+            connection.execution_options(exasol_export_stream=True)
+            .execute(statement)
+            .all()
+        )
+
+    assert rows == [
+        (
+            1,
+            "first",
+            1.5,
+            decimal.Decimal("12.50"),
+            True,
+            datetime.date(2024, 1, 2),
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+        ),
+        (2, "with, comma", None, None, False, None, None),
+    ]
+    [(query, export_params)] = export_connection.exports
+    assert export_params == {"with_column_names": True}
+    assert "name != 'it''s' AND measurements.id > 0" in query
+    # nothing was fetched through the websocket cursor
+    assert not any("measurements" in s for s, _ in engine.dbapi_connection.statements)
+
+
+def test_export_stream_applies_to_textual_selects(make_fake_engine):
+    engine = _export_engine(make_fake_engine, _FakeExportConnection("A,B\nx,\n"))
+
+    with engine.connect() as connection:
+        result = connection.execution_options(exasol_export_stream=True).execute(
+            text("SELECT a, b FROM t WHERE a = :a"), {"a": "x"}
+        )
+        assert list(result.keys()) == ["a", "b"]
+        assert result.all() == [("x", None)]
+
+
+def test_export_stream_buffers_at_most_two_chunks(make_fake_engine):
+    csv_data = "ID\n" + "".join(f"{i}\n" for i in range(1000))
+    engine = _export_engine(make_fake_engine, _FakeExportConnection(csv_data))
+
+    with engine.connect() as connection:
+        result = connection.execution_options(
+            exasol_export_stream=True, exasol_export_chunk_size=10
+        ).execute(select(literal_column("id", Integer)))
+        cursor = result.cursor
+        first = result.fetchmany(5)
+        assert cursor._queue.qsize() <= 2
+        assert len(cursor._rows) <= 10
+        result.close()
+
+    assert first == [(i,) for i in range(5)]
+    assert cursor._thread is None
+
+
+def test_export_stream_errors_are_raised_as_dbapi_errors(make_fake_engine):
+    export_connection = _FakeExportConnection()
+    error = export_connection.error = ExaRuntimeError(
+        export_connection, "export failed"
+    )
+    engine = _export_engine(make_fake_engine, export_connection)
+
+    with pytest.raises(sa_exc.DBAPIError) as exc_info:
+        with engine.connect() as connection:
+            connection.execution_options(exasol_export_stream=True).execute(
+                text("SELECT 1")
+            )
+    assert exc_info.value.orig.__cause__ is error
+    assert "export failed" in str(exc_info.value.orig)
+
+
+def test_export_stream_cannot_be_combined_with_profiles(make_fake_engine):
+    export_connection = _FakeExportConnection("A\n1\n")
+    engine = _export_engine(make_fake_engine, export_connection)
+
+    with engine.connect() as connection:
+        with pytest.raises(sa_exc.StatementError) as exc_info:
+            connection.execution_options(
+                exasol_export_stream=True, exasol_profile=True
+            ).execute(text("SELECT a FROM t"))
+
+    assert isinstance(exc_info.value.orig, sa_exc.ArgumentError)
+    assert "exasol_profile" in str(exc_info.value.orig)
+    assert export_connection.exports == []
+
+
+def test_export_stream_is_ignored_for_dml(make_fake_engine, export_table):
+    export_connection = _FakeExportConnection()
+    engine = _export_engine(make_fake_engine, export_connection)
+
+    with engine.begin() as connection:
+        connection.execution_options(exasol_export_stream=True).execute(
+            insert(export_table).values(id=1)
+        )
+
+    assert export_connection.exports == []
+
+
+@pytest.mark.parametrize(
+    "statement, parameters, expected",
+    [
+        ("SELECT ? FROM t", [None], "SELECT NULL FROM t"),
+        (
+            "SELECT '?', \"?\", ? FROM t -- ?\nWHERE a = ? /* ? */",
+            ["it's", decimal.Decimal("1E+2")],
+            "SELECT '?', \"?\", 'it''s' FROM t -- ?\nWHERE a = 100 /* ? */",
+        ),
+        (
+            "SELECT * FROM t WHERE a IN (?, ?, ?)",
+            [True, 1.5, datetime.date(2024, 1, 2)],
+            "SELECT * FROM t WHERE a IN (TRUE, 1.5, DATE '2024-01-02')",
+        ),
+    ],
+)
+def test_inline_parameters(statement, parameters, expected):
+    assert transport.inline_parameters(statement, parameters) == expected
+
+
+def test_inline_parameters_requires_matching_parameter_count():
+    with pytest.raises(ValueError):
+        transport.inline_parameters("SELECT ?", [1, 2])
+    with pytest.raises(ValueError):
+        transport.inline_parameters("SELECT ?, ?", [1])